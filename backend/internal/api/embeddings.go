@@ -1,8 +1,13 @@
 package api
 
 import (
+	"encoding/base64"
 	"encoding/json"
+	"fmt"
 	"net/http"
+	"strconv"
+
+	"alice-backend/internal/minilm"
 
 	"github.com/gorilla/mux"
 )
@@ -28,10 +33,17 @@ type BatchEmbeddingResponse struct {
 	Embeddings [][]float32 `json:"embeddings"`
 }
 
+// maxEmbeddingDimension bounds the length of any embedding accepted in a request
+const maxEmbeddingDimension = 8192
+
 // SimilarityRequest represents a similarity computation request
+// The *B64 fields carry base64-encoded little-endian float32 data and take
+// precedence over the plain arrays when set.
 type SimilarityRequest struct {
-	Embedding1 []float32 `json:"embedding1"`
-	Embedding2 []float32 `json:"embedding2"`
+	Embedding1    []float32 `json:"embedding1"`
+	Embedding2    []float32 `json:"embedding2"`
+	Embedding1B64 string    `json:"embedding1_b64,omitempty"`
+	Embedding2B64 string    `json:"embedding2_b64,omitempty"`
 }
 
 // SimilarityResponse represents a similarity computation response
@@ -40,10 +52,14 @@ type SimilarityResponse struct {
 }
 
 // SearchRequest represents a similarity search request
+// The *B64 fields carry base64-encoded little-endian float32 data and take
+// precedence over the plain arrays when set.
 type SearchRequest struct {
-	QueryEmbedding      []float32   `json:"query_embedding"`
-	CandidateEmbeddings [][]float32 `json:"candidate_embeddings"`
-	TopK                int         `json:"top_k,omitempty"`
+	QueryEmbedding         []float32   `json:"query_embedding"`
+	CandidateEmbeddings    [][]float32 `json:"candidate_embeddings"`
+	QueryEmbeddingB64      string      `json:"query_embedding_b64,omitempty"`
+	CandidateEmbeddingsB64 []string    `json:"candidate_embeddings_b64,omitempty"`
+	TopK                   int         `json:"top_k,omitempty"`
 }
 
 // SearchResponse represents a similarity search response
@@ -52,6 +68,100 @@ type SearchResponse struct {
 	Similarities []float32 `json:"similarities"`
 }
 
+// decodePacked replaces the plain embeddings with their base64 forms when present
+func (req *SimilarityRequest) decodePacked() error {
+	var err error
+	if req.Embedding1B64 != "" {
+		if req.Embedding1, err = decodeFloat32s(req.Embedding1B64); err != nil {
+			return err
+		}
+	}
+	if req.Embedding2B64 != "" {
+		if req.Embedding2, err = decodeFloat32s(req.Embedding2B64); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// decodePacked replaces the plain query embedding with its base64 form when present
+func (req *SearchRequest) decodePacked() error {
+	var err error
+	if req.QueryEmbeddingB64 != "" {
+		if req.QueryEmbedding, err = decodeFloat32s(req.QueryEmbeddingB64); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// candidateCount returns the number of candidates in the request
+func (req *SearchRequest) candidateCount() int {
+	if len(req.CandidateEmbeddingsB64) > 0 {
+		return len(req.CandidateEmbeddingsB64)
+	}
+	return len(req.CandidateEmbeddings)
+}
+
+// candidateIndex packs the request candidates straight into a search index.
+// Every candidate is checked against dim before the index is reserved, so
+// the reservation is bounded by the request body rather than by its counts.
+// Base64 candidates are decoded through reused scratch buffers, so no
+// per-candidate slices are allocated.
+func (req *SearchRequest) candidateIndex(dim int) (*minilm.CandidateIndex, error) {
+	if len(req.CandidateEmbeddingsB64) == 0 {
+		for i, candidate := range req.CandidateEmbeddings {
+			if len(candidate) != dim {
+				return nil, fmt.Errorf("candidate %d: embedding has dimension %d, expected %d", i, len(candidate), dim)
+			}
+		}
+
+		index := minilm.NewCandidateIndex(dim, len(req.CandidateEmbeddings))
+		for i, candidate := range req.CandidateEmbeddings {
+			if err := index.Add(candidate); err != nil {
+				return nil, fmt.Errorf("candidate %d: %w", i, err)
+			}
+		}
+		return index, nil
+	}
+
+	encodedLen := base64.StdEncoding.EncodedLen(dim * 4)
+	for i, packed := range req.CandidateEmbeddingsB64 {
+		if len(packed) != encodedLen || base64DecodedLen(packed) != dim*4 {
+			return nil, fmt.Errorf("candidate %d: embedding has %d bytes, expected %d", i, base64DecodedLen(packed), dim*4)
+		}
+	}
+
+	index := minilm.NewCandidateIndex(dim, len(req.CandidateEmbeddingsB64))
+	src := make([]byte, 0, encodedLen)
+	raw := make([]byte, dim*4)
+	row := make([]float32, 0, dim)
+	for i, packed := range req.CandidateEmbeddingsB64 {
+		src = append(src[:0], packed...)
+		n, err := base64.StdEncoding.Decode(raw, src)
+		if err != nil {
+			return nil, fmt.Errorf("candidate %d: invalid base64 payload: %w", i, err)
+		}
+		if row, err = appendFloat32sFromBytes(row[:0], raw[:n]); err != nil {
+			return nil, fmt.Errorf("candidate %d: %w", i, err)
+		}
+		if err := index.Add(row); err != nil {
+			return nil, fmt.Errorf("candidate %d: %w", i, err)
+		}
+	}
+	return index, nil
+}
+
+// base64DecodedLen returns the exact number of bytes a padded standard base64
+// string decodes to, assuming it is well formed
+func base64DecodedLen(s string) int {
+	n := len(s) / 4 * 3
+	for i := len(s) - 1; i >= 0 && i >= len(s)-2 && s[i] == '='; i-- {
+		n--
+	}
+	return n
+}
+
 // GenerateEmbedding handles single embedding generation
 func (h *Handler) GenerateEmbedding(w http.ResponseWriter, r *http.Request) {
 	if !h.config.Features.Embeddings {
@@ -60,13 +170,13 @@ func (h *Handler) GenerateEmbedding(w http.ResponseWriter, r *http.Request) {
 	}
 
 	embeddingService := h.modelManager.GetEmbeddingService()
-	if embeddingService == nil || !embeddingService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service not available")
 		return
 	}
 
 	var req EmbeddingRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
@@ -78,14 +188,24 @@ func (h *Handler) GenerateEmbedding(w http.ResponseWriter, r *http.Request) {
 
 	embedding, err := embeddingService.GenerateEmbedding(r.Context(), req.Text)
 	if err != nil {
-		h.writeError(w, http.StatusInternalServerError, "Embedding generation failed: "+err.Error())
+		h.writeServiceError(w, err, "Embedding generation failed: ")
 		return
 	}
 
-	h.writeSuccess(w, EmbeddingResponse{
-		Embedding: embedding,
-		Text:      req.Text,
-	})
+	// Encoded by hand in the EmbeddingResponse layout: reflection-based
+	// encoding walks every float through an interface value
+	text, err := json.Marshal(req.Text)
+	if err != nil {
+		h.writeError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
+	}
+	buf := make([]byte, 0, 32+len(embedding)*12+len(text))
+	buf = append(buf, `{"embedding":`...)
+	buf = appendFloat32s(buf, embedding)
+	buf = append(buf, `,"text":`...)
+	buf = append(buf, text...)
+	buf = append(buf, '}')
+	h.writeSuccessRaw(w, buf)
 }
 
 // GenerateEmbeddings handles batch embedding generation
@@ -96,13 +216,13 @@ func (h *Handler) GenerateEmbeddings(w http.ResponseWriter, r *http.Request) {
 	}
 
 	embeddingService := h.modelManager.GetEmbeddingService()
-	if embeddingService == nil || !embeddingService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service not available")
 		return
 	}
 
 	var req BatchEmbeddingRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
@@ -114,13 +234,67 @@ func (h *Handler) GenerateEmbeddings(w http.ResponseWriter, r *http.Request) {
 
 	embeddings, err := embeddingService.GenerateEmbeddings(r.Context(), req.Texts)
 	if err != nil {
-		h.writeError(w, http.StatusInternalServerError, "Batch embedding generation failed: "+err.Error())
+		h.writeServiceError(w, err, "Batch embedding generation failed: ")
 		return
 	}
 
-	h.writeSuccess(w, BatchEmbeddingResponse{
-		Embeddings: embeddings,
-	})
+	// Encoded by hand in the BatchEmbeddingResponse layout
+	size := 16
+	for _, e := range embeddings {
+		size += 2 + len(e)*12
+	}
+	buf := make([]byte, 0, size)
+	buf = append(buf, `{"embeddings":[`...)
+	for i, e := range embeddings {
+		if i > 0 {
+			buf = append(buf, ',')
+		}
+		buf = appendFloat32s(buf, e)
+	}
+	buf = append(buf, `]}`...)
+	h.writeSuccessRaw(w, buf)
+}
+
+// GenerateEmbeddingsRaw handles batch embedding generation, returning the
+// embeddings as a packed little-endian float32 matrix (application/octet-stream)
+// with its shape in the X-Count and X-Dim headers
+func (h *Handler) GenerateEmbeddingsRaw(w http.ResponseWriter, r *http.Request) {
+	if !h.config.Features.Embeddings {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is disabled")
+		return
+	}
+
+	embeddingService := h.modelManager.GetEmbeddingService()
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service not available")
+		return
+	}
+
+	var req BatchEmbeddingRequest
+	if err := decodeJSON(w, r, &req); err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid request body")
+		return
+	}
+
+	if len(req.Texts) == 0 {
+		h.writeError(w, http.StatusBadRequest, "Texts array is required")
+		return
+	}
+
+	embeddings, err := embeddingService.GenerateEmbeddings(r.Context(), req.Texts)
+	if err != nil {
+		h.writeServiceError(w, err, "Batch embedding generation failed: ")
+		return
+	}
+
+	dim := 0
+	if len(embeddings) > 0 {
+		dim = len(embeddings[0])
+	}
+
+	w.Header().Set("X-Count", strconv.Itoa(len(embeddings)))
+	w.Header().Set("X-Dim", strconv.Itoa(dim))
+	h.writeBinary(w, appendFloat32sLE(make([]byte, 0, len(embeddings)*dim*4), embeddings...), "application/octet-stream")
 }
 
 // ComputeSimilarity handles similarity computation
@@ -131,22 +305,32 @@ func (h *Handler) ComputeSimilarity(w http.ResponseWriter, r *http.Request) {
 	}
 
 	embeddingService := h.modelManager.GetEmbeddingService()
-	if embeddingService == nil || !embeddingService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service not available")
 		return
 	}
 
 	var req SimilarityRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
 
+	if err := req.decodePacked(); err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid packed embedding: "+err.Error())
+		return
+	}
+
 	if len(req.Embedding1) == 0 || len(req.Embedding2) == 0 {
 		h.writeError(w, http.StatusBadRequest, "Both embeddings are required")
 		return
 	}
 
+	if len(req.Embedding1) > maxEmbeddingDimension || len(req.Embedding2) > maxEmbeddingDimension {
+		h.writeError(w, http.StatusBadRequest, "Embedding dimension exceeds limit")
+		return
+	}
+
 	similarity, err := embeddingService.ComputeSimilarity(r.Context(), req.Embedding1, req.Embedding2)
 	if err != nil {
 		h.writeError(w, http.StatusInternalServerError, "Similarity computation failed: "+err.Error())
@@ -166,31 +350,47 @@ func (h *Handler) SearchSimilar(w http.ResponseWriter, r *http.Request) {
 	}
 
 	embeddingService := h.modelManager.GetEmbeddingService()
-	if embeddingService == nil || !embeddingService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service not available")
 		return
 	}
 
 	var req SearchRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
 
+	if err := req.decodePacked(); err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid packed embedding: "+err.Error())
+		return
+	}
+
 	if len(req.QueryEmbedding) == 0 {
 		h.writeError(w, http.StatusBadRequest, "Query embedding is required")
 		return
 	}
 
-	if len(req.CandidateEmbeddings) == 0 {
+	if len(req.QueryEmbedding) > maxEmbeddingDimension {
+		h.writeError(w, http.StatusBadRequest, "Embedding dimension exceeds limit")
+		return
+	}
+
+	if req.candidateCount() == 0 {
 		h.writeError(w, http.StatusBadRequest, "Candidate embeddings are required")
 		return
 	}
 
-	indices, similarities, err := embeddingService.SearchSimilar(
+	index, err := req.candidateIndex(len(req.QueryEmbedding))
+	if err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid candidate embeddings: "+err.Error())
+		return
+	}
+
+	indices, similarities, err := embeddingService.SearchIndex(
 		r.Context(),
 		req.QueryEmbedding,
-		req.CandidateEmbeddings,
+		index,
 		req.TopK,
 	)
 	if err != nil {
@@ -198,14 +398,20 @@ func (h *Handler) SearchSimilar(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	h.writeSuccess(w, SearchResponse{
-		Indices:      indices,
-		Similarities: similarities,
-	})
+	// Encoded by hand: reflection-based encoding of the score array
+	// dominates latency for large candidate sets
+	buf := make([]byte, 0, 32+len(indices)*24)
+	buf = append(buf, `{"indices":`...)
+	buf = appendInts(buf, indices)
+	buf = append(buf, `,"similarities":`...)
+	buf = appendFloat32s(buf, similarities)
+	buf = append(buf, '}')
+	h.writeSuccessRaw(w, buf)
 }
 
-// GetEmbeddingsInfo returns embeddings service information
-func (h *Handler) GetEmbeddingsInfo(w http.ResponseWriter, r *http.Request) {
+// WarmEmbeddings loads a lazily configured embeddings model and returns once
+// it is ready
+func (h *Handler) WarmEmbeddings(w http.ResponseWriter, r *http.Request) {
 	if !h.config.Features.Embeddings {
 		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is disabled")
 		return
@@ -217,17 +423,25 @@ func (h *Handler) GetEmbeddingsInfo(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	info := embeddingService.GetInfo()
-	h.writeSuccess(w, info)
+	if err := embeddingService.Warm(r.Context()); err != nil {
+		h.writeServiceError(w, err, "Embeddings warmup failed: ")
+		return
+	}
+
+	h.writeSuccess(w, map[string]bool{"ready": true})
 }
 
-// RegisterEmbeddingsRoutes registers embeddings-related routes
+// RegisterEmbeddingsRoutes registers embeddings-related routes on the /api router
 func (h *Handler) RegisterEmbeddingsRoutes(router *mux.Router) {
-	embeddingsRouter := router.PathPrefix("/api/embeddings").Subrouter()
+	embeddingsRouter := router.PathPrefix("/embeddings").Subrouter()
 
 	embeddingsRouter.HandleFunc("/generate", h.GenerateEmbedding).Methods("POST")
 	embeddingsRouter.HandleFunc("/batch", h.GenerateEmbeddings).Methods("POST")
+	embeddingsRouter.HandleFunc("/generate-batch", h.GenerateEmbeddings).Methods("POST")
+	embeddingsRouter.HandleFunc("/generate-batch-raw", h.GenerateEmbeddingsRaw).Methods("POST")
 	embeddingsRouter.HandleFunc("/similarity", h.ComputeSimilarity).Methods("POST")
 	embeddingsRouter.HandleFunc("/search", h.SearchSimilar).Methods("POST")
-	embeddingsRouter.HandleFunc("/info", h.GetEmbeddingsInfo).Methods("GET")
+	embeddingsRouter.HandleFunc("/warm", h.WarmEmbeddings).Methods("POST")
+	embeddingsRouter.HandleFunc("/ready", h.EmbeddingsReady).Methods("GET")
+	embeddingsRouter.HandleFunc("/info", h.EmbeddingsInfo).Methods("GET")
 }
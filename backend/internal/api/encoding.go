@@ -0,0 +1,89 @@
+package api
+
+import (
+	"encoding/base64"
+	"encoding/binary"
+	"fmt"
+	"math"
+	"strconv"
+)
+
+// appendFloat32s appends v to dst as a JSON number array without going
+// through reflection. NaN and Inf are not representable in JSON and are
+// written as 0.
+func appendFloat32s(dst []byte, v []float32) []byte {
+	dst = append(dst, '[')
+	for i, f := range v {
+		if i > 0 {
+			dst = append(dst, ',')
+		}
+		if math.IsNaN(float64(f)) || math.IsInf(float64(f), 0) {
+			dst = append(dst, '0')
+			continue
+		}
+		dst = strconv.AppendFloat(dst, float64(f), 'g', -1, 32)
+	}
+	return append(dst, ']')
+}
+
+// appendInts appends v to dst as a JSON number array
+func appendInts(dst []byte, v []int) []byte {
+	dst = append(dst, '[')
+	for i, n := range v {
+		if i > 0 {
+			dst = append(dst, ',')
+		}
+		dst = strconv.AppendInt(dst, int64(n), 10)
+	}
+	return append(dst, ']')
+}
+
+// appendByteValues appends b to dst as a JSON array of its byte values, the
+// layout the frontend expects for audio, without widening b into an []int first
+func appendByteValues(dst []byte, b []byte) []byte {
+	dst = append(dst, '[')
+	for i, v := range b {
+		if i > 0 {
+			dst = append(dst, ',')
+		}
+		dst = strconv.AppendUint(dst, uint64(v), 10)
+	}
+	return append(dst, ']')
+}
+
+// decodeFloat32s decodes a base64 string of packed little-endian float32
+// values, the compact alternative to JSON number arrays in request bodies
+func decodeFloat32s(s string) ([]float32, error) {
+	raw, err := base64.StdEncoding.DecodeString(s)
+	if err != nil {
+		return nil, fmt.Errorf("invalid base64 payload: %w", err)
+	}
+	return float32sFromBytes(raw)
+}
+
+// float32sFromBytes unpacks little-endian float32 values from raw
+func float32sFromBytes(raw []byte) ([]float32, error) {
+	return appendFloat32sFromBytes(nil, raw)
+}
+
+// appendFloat32sFromBytes unpacks little-endian float32 values from raw onto dst
+func appendFloat32sFromBytes(dst []float32, raw []byte) ([]float32, error) {
+	if len(raw)%4 != 0 {
+		return nil, fmt.Errorf("payload length %d is not a multiple of 4", len(raw))
+	}
+
+	for i := 0; i < len(raw); i += 4 {
+		dst = append(dst, math.Float32frombits(binary.LittleEndian.Uint32(raw[i:])))
+	}
+	return dst, nil
+}
+
+// appendFloat32sLE appends each vector to dst as packed little-endian float32 values
+func appendFloat32sLE(dst []byte, vectors ...[]float32) []byte {
+	for _, v := range vectors {
+		for _, f := range v {
+			dst = binary.LittleEndian.AppendUint32(dst, math.Float32bits(f))
+		}
+	}
+	return dst
+}
@@ -2,16 +2,30 @@ package api
 
 import (
 	"encoding/json"
+	"errors"
 	"net/http"
+	"sync"
 
 	"alice-backend/internal/config"
+	"alice-backend/internal/minilm"
 	"alice-backend/internal/models"
+	"alice-backend/internal/piper"
+	"alice-backend/internal/whisper"
 )
 
 // Handler provides HTTP handlers for all API endpoints
 type Handler struct {
 	config       *config.Config
 	modelManager *models.Manager
+	health       healthCache
+}
+
+// healthCache holds the encoded health response for the service status it
+// was built from, so probes only re-encode when readiness actually changes
+type healthCache struct {
+	mu     sync.Mutex
+	status models.ServiceStatus
+	body   []byte
 }
 
 // NewHandler creates a new API handler
@@ -22,6 +36,18 @@ func NewHandler(config *config.Config, modelManager *models.Manager) *Handler {
 	}
 }
 
+// maxRequestBodyBytes bounds request bodies; the largest legitimate
+// payloads are audio, raw or JSON-encoded, and candidate embedding sets
+const maxRequestBodyBytes = 64 << 20
+
+// decodeJSON strictly decodes a JSON request body into v, rejecting unknown
+// fields and oversized bodies before any work is done on them
+func decodeJSON(w http.ResponseWriter, r *http.Request, v interface{}) error {
+	dec := json.NewDecoder(http.MaxBytesReader(w, r.Body, maxRequestBodyBytes))
+	dec.DisallowUnknownFields()
+	return dec.Decode(v)
+}
+
 // writeSuccess writes a successful JSON response
 func (h *Handler) writeSuccess(w http.ResponseWriter, data interface{}) {
 	w.Header().Set("Content-Type", "application/json")
@@ -32,6 +58,18 @@ func (h *Handler) writeSuccess(w http.ResponseWriter, data interface{}) {
 	})
 }
 
+// writeSuccessRaw writes a success JSON response around an already encoded data payload
+func (h *Handler) writeSuccessRaw(w http.ResponseWriter, data []byte) {
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	buf := make([]byte, 0, len(data)+32)
+	buf = append(buf, `{"data":`...)
+	buf = append(buf, data...)
+	buf = append(buf, `,"success":true}`...)
+	buf = append(buf, '\n')
+	w.Write(buf)
+}
+
 // writeError writes an error JSON response
 func (h *Handler) writeError(w http.ResponseWriter, statusCode int, message string) {
 	w.Header().Set("Content-Type", "application/json")
@@ -42,6 +80,17 @@ func (h *Handler) writeError(w http.ResponseWriter, statusCode int, message stri
 	})
 }
 
+// writeServiceError writes a failed service call as 503 when the service was
+// not ready and as 500 otherwise. Services check readiness themselves, so
+// handlers do not need a separate (and racy) IsReady round trip.
+func (h *Handler) writeServiceError(w http.ResponseWriter, err error, prefix string) {
+	if errors.Is(err, whisper.ErrNotReady) || errors.Is(err, piper.ErrNotReady) || errors.Is(err, minilm.ErrNotReady) {
+		h.writeError(w, http.StatusServiceUnavailable, err.Error())
+		return
+	}
+	h.writeError(w, http.StatusInternalServerError, prefix+err.Error())
+}
+
 // writeBinary writes a binary response
 func (h *Handler) writeBinary(w http.ResponseWriter, data []byte, contentType string) {
 	w.Header().Set("Content-Type", contentType)
@@ -51,15 +100,35 @@ func (h *Handler) writeBinary(w http.ResponseWriter, data []byte, contentType st
 
 // HealthCheck returns the health status of the backend
 func (h *Handler) HealthCheck(w http.ResponseWriter, r *http.Request) {
-	response := map[string]interface{}{
-		"status": "healthy",
-		"services": map[string]bool{
-			"stt":        h.modelManager.GetSTTService() != nil && h.modelManager.GetSTTService().IsReady(),
-			"tts":        h.modelManager.GetTTSService() != nil && h.modelManager.GetTTSService().IsReady(),
-			"embeddings": h.modelManager.GetEmbeddingService() != nil && h.modelManager.GetEmbeddingService().IsReady(),
-		},
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	w.Write(h.healthBody(h.modelManager.Status()))
+}
+
+// healthBody returns the encoded health response for status, reusing the
+// previous encoding while the status is unchanged
+func (h *Handler) healthBody(status models.ServiceStatus) []byte {
+	h.health.mu.Lock()
+	defer h.health.mu.Unlock()
+
+	if h.health.body != nil && h.health.status == status {
+		return h.health.body
 	}
-	h.writeSuccess(w, response)
+
+	body, _ := json.Marshal(map[string]interface{}{
+		"success": true,
+		"data": map[string]interface{}{
+			"status": "healthy",
+			"services": map[string]bool{
+				"stt":        status.STT,
+				"tts":        status.TTS,
+				"embeddings": status.Embeddings,
+			},
+		},
+	})
+	h.health.status = status
+	h.health.body = append(body, '\n')
+	return h.health.body
 }
 
 // GetConfig returns the current configuration
@@ -141,7 +210,15 @@ func (h *Handler) EmbeddingsReady(w http.ResponseWriter, r *http.Request) {
 	}
 
 	embeddingService := h.modelManager.GetEmbeddingService()
-	if embeddingService == nil || !embeddingService.IsReady() {
+	if embeddingService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
+		return
+	}
+
+	if !embeddingService.IsReady() {
+		// Clients poll this before using embeddings, so a lazily loaded
+		// model starts loading on the first poll
+		embeddingService.StartWarm()
 		h.writeError(w, http.StatusServiceUnavailable, "Embeddings service is not ready")
 		return
 	}
@@ -1,7 +1,6 @@
 package api
 
 import (
-	"encoding/json"
 	"net/http"
 
 	"github.com/gorilla/mux"
@@ -13,7 +12,7 @@ func (h *Handler) DownloadModel(w http.ResponseWriter, r *http.Request) {
 	service := vars["service"]
 
 	var req DownloadModelRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
@@ -28,17 +27,27 @@ func (h *Handler) DownloadModel(w http.ResponseWriter, r *http.Request) {
 
 // GetModelStatus returns the status of all models
 func (h *Handler) GetModelStatus(w http.ResponseWriter, r *http.Request) {
+	status := h.modelManager.Status()
+
+	// The settings screen polls this instead of /embeddings/ready, so it
+	// starts loading a lazily configured embeddings model the same way
+	if h.config.Features.Embeddings && !status.Embeddings {
+		if embeddingService := h.modelManager.GetEmbeddingService(); embeddingService != nil {
+			embeddingService.StartWarm()
+		}
+	}
+
 	response := ModelsStatusResponse{
 		STT: ModelStatus{
-			Installed:   h.modelManager.GetSTTService() != nil && h.modelManager.GetSTTService().IsReady(),
+			Installed:   status.STT,
 			Downloading: false,
 		},
 		TTS: ModelStatus{
-			Installed:   h.modelManager.GetTTSService() != nil && h.modelManager.GetTTSService().IsReady(),
+			Installed:   status.TTS,
 			Downloading: false,
 		},
 		Embeddings: ModelStatus{
-			Installed:   h.modelManager.GetEmbeddingService() != nil && h.modelManager.GetEmbeddingService().IsReady(),
+			Installed:   status.Embeddings,
 			Downloading: false,
 		},
 	}
@@ -48,20 +57,29 @@ func (h *Handler) GetModelStatus(w http.ResponseWriter, r *http.Request) {
 
 // GetModelDownloadStatus returns the download status of all models
 func (h *Handler) GetModelDownloadStatus(w http.ResponseWriter, r *http.Request) {
+	status := h.modelManager.Status()
 	response := DownloadStatusResponse{
 		STT: ModelStatus{
-			Installed:   h.modelManager.GetSTTService() != nil && h.modelManager.GetSTTService().IsReady(),
+			Installed:   status.STT,
 			Downloading: false,
 		},
 		TTS: ModelStatus{
-			Installed:   h.modelManager.GetTTSService() != nil && h.modelManager.GetTTSService().IsReady(),
+			Installed:   status.TTS,
 			Downloading: false,
 		},
 		Embeddings: ModelStatus{
-			Installed:   h.modelManager.GetEmbeddingService() != nil && h.modelManager.GetEmbeddingService().IsReady(),
+			Installed:   status.Embeddings,
 			Downloading: false,
 		},
 	}
 
 	h.writeSuccess(w, response)
 }
+
+// RegisterModelRoutes registers model management routes on the /api router
+func (h *Handler) RegisterModelRoutes(router *mux.Router) {
+	modelsRouter := router.PathPrefix("/models").Subrouter()
+	modelsRouter.HandleFunc("/download/{service}", h.DownloadModel).Methods("POST")
+	modelsRouter.HandleFunc("/status", h.GetModelStatus).Methods("GET")
+	modelsRouter.HandleFunc("/download-status", h.GetModelDownloadStatus).Methods("GET")
+}
@@ -1,18 +1,26 @@
 package api
 
 import (
-	"encoding/json"
+	"errors"
+	"fmt"
 	"io"
 	"net/http"
+	"strconv"
 
 	"github.com/gorilla/mux"
 )
 
+// whisperSampleRate is the only input rate whisper.cpp accepts
+const whisperSampleRate = 16000
+
 // TranscribeRequest represents a transcription request (JSON format)
+// AudioDataB64 carries base64-encoded little-endian float32 samples and takes
+// precedence over AudioData when set.
 type TranscribeRequest struct {
-	AudioData  []float32 `json:"audio_data,omitempty"`
-	SampleRate int       `json:"sample_rate,omitempty"`
-	Language   string    `json:"language,omitempty"`
+	AudioData    []float32 `json:"audio_data,omitempty"`
+	AudioDataB64 string    `json:"audio_data_b64,omitempty"`
+	SampleRate   int       `json:"sample_rate,omitempty"`
+	Language     string    `json:"language,omitempty"`
 }
 
 // TranscribeResponse represents a transcription response
@@ -30,14 +38,14 @@ func (h *Handler) TranscribeAudio(w http.ResponseWriter, r *http.Request) {
 	}
 
 	sttService := h.modelManager.GetSTTService()
-	if sttService == nil || !sttService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "STT service is not ready")
+	if sttService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "STT service not available")
 		return
 	}
 
-	var audioData []byte
-	var language string
+	var text string
 	var err error
+	duration := float32(1.0) // Placeholder duration for uploaded files
 
 	// Check Content-Type to determine request format
 	contentType := r.Header.Get("Content-Type")
@@ -45,36 +53,27 @@ func (h *Handler) TranscribeAudio(w http.ResponseWriter, r *http.Request) {
 	if contentType == "application/json" {
 		// Handle JSON request (from frontend audio processing)
 		var req TranscribeRequest
-		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		if err := decodeJSON(w, r, &req); err != nil {
 			h.writeError(w, http.StatusBadRequest, "Invalid JSON request body")
 			return
 		}
 
+		if req.AudioDataB64 != "" {
+			if req.AudioData, err = decodeFloat32s(req.AudioDataB64); err != nil {
+				h.writeError(w, http.StatusBadRequest, "Invalid packed audio data: "+err.Error())
+				return
+			}
+		}
+
 		if len(req.AudioData) == 0 {
 			h.writeError(w, http.StatusBadRequest, "Audio data is required")
 			return
 		}
 
-		// Store language from request
-		language = req.Language
-
-		// Convert Float32Array to 16-bit PCM bytes
-		audioData = make([]byte, len(req.AudioData)*2)
-		for i, sample := range req.AudioData {
-			// Clamp sample to [-1, 1] range
-			if sample > 1.0 {
-				sample = 1.0
-			} else if sample < -1.0 {
-				sample = -1.0
-			}
-			
-			// Convert float32 to 16-bit signed integer
-			sample16 := int16(sample * 32767)
-			
-			// Write as little-endian 16-bit
-			audioData[i*2] = byte(sample16 & 0xFF)
-			audioData[i*2+1] = byte((sample16 >> 8) & 0xFF)
-		}
+		// The samples are already float32, so hand them to whisper as is
+		// instead of quantizing to 16-bit PCM and converting back
+		text, err = sttService.TranscribeSamplesWithLanguage(r.Context(), req.AudioData, req.Language)
+		duration = float32(len(req.AudioData)) / whisperSampleRate
 	} else {
 		// Handle multipart form (file upload)
 		if err := r.ParseMultipartForm(10 << 20); err != nil {
@@ -82,44 +81,105 @@ func (h *Handler) TranscribeAudio(w http.ResponseWriter, r *http.Request) {
 			return
 		}
 
-		file, _, err := r.FormFile("file")
-		if err != nil {
+		file, _, formErr := r.FormFile("file")
+		if formErr != nil {
 			// Try "audio" field for backward compatibility
-			file, _, err = r.FormFile("audio")
-			if err != nil {
+			file, _, formErr = r.FormFile("audio")
+			if formErr != nil {
 				h.writeError(w, http.StatusBadRequest, "Failed to get audio file (expected 'file' or 'audio' field)")
 				return
 			}
 		}
 		defer file.Close()
 
-		// Get language from form parameter
-		language = r.FormValue("language")
-
 		// Read audio data
-		audioData, err = io.ReadAll(file)
-		if err != nil {
+		audioData, readErr := io.ReadAll(file)
+		if readErr != nil {
 			h.writeError(w, http.StatusInternalServerError, "Failed to read audio file")
 			return
 		}
+
+		// Transcribe audio with language from form parameter
+		text, err = sttService.TranscribeAudioWithLanguage(r.Context(), audioData, r.FormValue("language"))
+	}
+
+	if err != nil {
+		h.writeServiceError(w, err, "Transcription failed: ")
+		return
+	}
+
+	h.writeSuccess(w, TranscribeResponse{
+		Text:       text,
+		Confidence: 0.95, // Placeholder confidence
+		Duration:   duration,
+	})
+}
+
+// TranscribeRaw handles transcription of a raw little-endian float32 PCM body
+// (application/octet-stream), skipping JSON encoding of the samples entirely
+func (h *Handler) TranscribeRaw(w http.ResponseWriter, r *http.Request) {
+	if !h.config.Features.STT {
+		h.writeError(w, http.StatusServiceUnavailable, "STT service is disabled")
+		return
+	}
+
+	sttService := h.modelManager.GetSTTService()
+	if sttService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "STT service not available")
+		return
+	}
+
+	query := r.URL.Query()
+	if rate := query.Get("sample_rate"); rate != "" {
+		sampleRate, err := strconv.Atoi(rate)
+		if err != nil || sampleRate != whisperSampleRate {
+			h.writeError(w, http.StatusBadRequest, fmt.Sprintf("Unsupported sample rate %q, expected %d", rate, whisperSampleRate))
+			return
+		}
+	}
+
+	body, err := io.ReadAll(http.MaxBytesReader(w, r.Body, maxRequestBodyBytes))
+	if err != nil {
+		var maxBytesErr *http.MaxBytesError
+		if errors.As(err, &maxBytesErr) {
+			h.writeError(w, http.StatusRequestEntityTooLarge, fmt.Sprintf("Request body exceeds %d bytes", maxBytesErr.Limit))
+			return
+		}
+		h.writeError(w, http.StatusBadRequest, "Failed to read request body")
+		return
+	}
+
+	samples, err := float32sFromBytes(body)
+	if err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid audio data: "+err.Error())
+		return
+	}
+
+	if len(samples) == 0 {
+		h.writeError(w, http.StatusBadRequest, "Audio data is required")
+		return
 	}
 
-	// Transcribe audio with language parameter
-	text, err := sttService.TranscribeAudioWithLanguage(r.Context(), audioData, language)
+	text, err := sttService.TranscribeSamplesWithLanguage(r.Context(), samples, query.Get("language"))
 	if err != nil {
-		h.writeError(w, http.StatusInternalServerError, "Transcription failed: "+err.Error())
+		h.writeServiceError(w, err, "Transcription failed: ")
 		return
 	}
 
 	h.writeSuccess(w, TranscribeResponse{
 		Text:       text,
 		Confidence: 0.95, // Placeholder confidence
-		Duration:   1.0,  // Placeholder duration
+		Duration:   float32(len(samples)) / whisperSampleRate,
 	})
 }
 
-// RegisterSTTRoutes registers STT-related routes
+// RegisterSTTRoutes registers STT-related routes on the /api router
 func (h *Handler) RegisterSTTRoutes(router *mux.Router) {
-	sttRouter := router.PathPrefix("/api/stt").Subrouter()
+	sttRouter := router.PathPrefix("/stt").Subrouter()
 	sttRouter.HandleFunc("/transcribe", h.TranscribeAudio).Methods("POST")
+	sttRouter.HandleFunc("/transcribe-audio", h.TranscribeAudio).Methods("POST")
+	sttRouter.HandleFunc("/transcribe-file", h.TranscribeAudio).Methods("POST")
+	sttRouter.HandleFunc("/transcribe-raw", h.TranscribeRaw).Methods("POST")
+	sttRouter.HandleFunc("/ready", h.STTReady).Methods("GET")
+	sttRouter.HandleFunc("/info", h.STTInfo).Methods("GET")
 }
@@ -1,8 +1,13 @@
 package api
 
 import (
-	"encoding/json"
+	"encoding/binary"
+	"log"
 	"net/http"
+	"strconv"
+	"time"
+
+	"alice-backend/internal/wav"
 
 	"github.com/gorilla/mux"
 )
@@ -30,13 +35,13 @@ func (h *Handler) SynthesizeSpeech(w http.ResponseWriter, r *http.Request) {
 	}
 
 	ttsService := h.modelManager.GetTTSService()
-	if ttsService == nil || !ttsService.IsReady() {
-		h.writeError(w, http.StatusServiceUnavailable, "TTS service is not ready")
+	if ttsService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "TTS service not available")
 		return
 	}
 
 	var req SynthesizeRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
@@ -52,24 +57,94 @@ func (h *Handler) SynthesizeSpeech(w http.ResponseWriter, r *http.Request) {
 
 	audioData, err := ttsService.Synthesize(r.Context(), req.Text, req.Voice)
 	if err != nil {
-		h.writeError(w, http.StatusInternalServerError, "TTS synthesis failed: "+err.Error())
+		h.writeServiceError(w, err, "TTS synthesis failed: ")
 		return
 	}
 
-	// Convert byte array to number array for frontend compatibility
-	audioNumbers := make([]int, len(audioData))
-	for i, b := range audioData {
-		audioNumbers[i] = int(b)
+	// The sample rate depends on the voice, so read it back from the header
+	sampleRate := 22050
+	duration := 0.0
+	if len(audioData) >= wav.HeaderSize {
+		sampleRate = int(binary.LittleEndian.Uint32(audioData[24:28]))
+		if sampleRate > 0 {
+			duration = float64(len(audioData)-wav.HeaderSize) / float64(sampleRate*2)
+		}
 	}
 
-	response := map[string]interface{}{
-		"audio":       audioNumbers,
-		"format":      "wav",
-		"sample_rate": 22050,
-		"duration":    1.0, // Placeholder duration
+	// The audio goes out as a number array for frontend compatibility.
+	// Encoding it by hand writes each byte straight into the response
+	// instead of widening the clip into an []int and reflecting over it.
+	buf := make([]byte, 0, 96+len(audioData)*4)
+	buf = append(buf, `{"audio":`...)
+	buf = appendByteValues(buf, audioData)
+	buf = append(buf, `,"duration":`...)
+	buf = strconv.AppendFloat(buf, duration, 'g', -1, 64)
+	buf = append(buf, `,"format":"wav","sample_rate":`...)
+	buf = strconv.AppendInt(buf, int64(sampleRate), 10)
+	buf = append(buf, '}')
+	h.writeSuccessRaw(w, buf)
+}
+
+// SynthesizeSpeechStream handles TTS synthesis, streaming WAV audio to the
+// client as it is produced instead of buffering the whole clip
+func (h *Handler) SynthesizeSpeechStream(w http.ResponseWriter, r *http.Request) {
+	if !h.config.Features.TTS {
+		h.writeError(w, http.StatusServiceUnavailable, "TTS service is disabled")
+		return
 	}
 
-	h.writeSuccess(w, response)
+	ttsService := h.modelManager.GetTTSService()
+	if ttsService == nil {
+		h.writeError(w, http.StatusServiceUnavailable, "TTS service not available")
+		return
+	}
+
+	var req SynthesizeRequest
+	if err := decodeJSON(w, r, &req); err != nil {
+		h.writeError(w, http.StatusBadRequest, "Invalid request body")
+		return
+	}
+
+	if req.Text == "" {
+		h.writeError(w, http.StatusBadRequest, "Text is required")
+		return
+	}
+
+	// Long utterances can outlast the server write timeout
+	rc := http.NewResponseController(w)
+	rc.SetWriteDeadline(time.Time{})
+
+	sw := &streamWriter{w: w, rc: rc, contentType: "audio/wav"}
+	if err := ttsService.SynthesizeStream(r.Context(), req.Text, req.Voice, sw); err != nil {
+		if !sw.started {
+			h.writeServiceError(w, err, "TTS synthesis failed: ")
+			return
+		}
+		log.Printf("TTS stream interrupted: %v", err)
+	}
+}
+
+// streamWriter sends the response headers on first write and flushes every
+// chunk so the client receives audio as soon as it is available
+type streamWriter struct {
+	w           http.ResponseWriter
+	rc          *http.ResponseController
+	contentType string
+	started     bool
+}
+
+func (sw *streamWriter) Write(p []byte) (int, error) {
+	if !sw.started {
+		sw.w.Header().Set("Content-Type", sw.contentType)
+		sw.w.WriteHeader(http.StatusOK)
+		sw.started = true
+	}
+
+	n, err := sw.w.Write(p)
+	if err != nil {
+		return n, err
+	}
+	return n, sw.rc.Flush()
 }
 
 // GetVoices returns available TTS voices
@@ -145,7 +220,7 @@ func (h *Handler) SetDefaultVoice(w http.ResponseWriter, r *http.Request) {
 	}
 
 	var req SetDefaultVoiceRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if err := decodeJSON(w, r, &req); err != nil {
 		h.writeError(w, http.StatusBadRequest, "Invalid request body")
 		return
 	}
@@ -168,11 +243,14 @@ func (h *Handler) SetDefaultVoice(w http.ResponseWriter, r *http.Request) {
 	h.writeSuccess(w, response)
 }
 
-// RegisterTTSRoutes registers TTS-related routes
+// RegisterTTSRoutes registers TTS-related routes on the /api router
 func (h *Handler) RegisterTTSRoutes(router *mux.Router) {
-	ttsRouter := router.PathPrefix("/api/tts").Subrouter()
+	ttsRouter := router.PathPrefix("/tts").Subrouter()
 	ttsRouter.HandleFunc("/synthesize", h.SynthesizeSpeech).Methods("POST")
+	ttsRouter.HandleFunc("/synthesize-stream", h.SynthesizeSpeechStream).Methods("POST")
 	ttsRouter.HandleFunc("/voices", h.GetVoices).Methods("GET")
 	ttsRouter.HandleFunc("/default-voice", h.GetDefaultVoice).Methods("GET")
 	ttsRouter.HandleFunc("/default-voice", h.SetDefaultVoice).Methods("POST")
+	ttsRouter.HandleFunc("/ready", h.TTSReady).Methods("GET")
+	ttsRouter.HandleFunc("/info", h.TTSInfo).Methods("GET")
 }
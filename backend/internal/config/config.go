@@ -3,6 +3,7 @@ package config
 import (
 	"os"
 	"strconv"
+	"time"
 )
 
 // Config holds the application configuration
@@ -14,7 +15,10 @@ type Config struct {
 
 // ServerConfig holds server configuration
 type ServerConfig struct {
-	Port string
+	Port      string
+	AccessLog bool
+	// DebugLog enables per-request diagnostic logging in the model services
+	DebugLog bool
 }
 
 // ModelsConfig holds model configuration
@@ -22,21 +26,50 @@ type ModelsConfig struct {
 	Whisper WhisperConfig
 	Piper   PiperConfig
 	MiniLM  MiniLMConfig
+	// MirrorDir is a local directory checked for model files before they
+	// are downloaded, with whisper, piper and minilm subdirectories
+	MirrorDir string
 }
 
 // WhisperConfig holds Whisper model configuration
 type WhisperConfig struct {
 	Path string
+	// Workers caps concurrent transcriptions; 0 picks half the CPUs
+	Workers int
+	// Quantization selects quantized model weights: none, q8_0 or q5_1
+	Quantization string
+	// BeamSize is the decoder beam width; 1 decodes greedily
+	BeamSize int
+	// Threads per transcription; 0 splits the CPUs between workers
+	Threads int
 }
 
 // PiperConfig holds Piper model configuration
 type PiperConfig struct {
 	Path string
+	// Workers caps concurrent syntheses
+	Workers int
+	// CacheSize is the number of synthesized clips kept for reuse
+	CacheSize int
 }
 
 // MiniLMConfig holds MiniLM model configuration
 type MiniLMConfig struct {
-	Path string
+	Path         string
+	BatchMaxSize int
+	BatchMaxWait time.Duration
+	CacheSize    int
+	// SearchQuantization ("none" or "int8", env EMBEDDINGS_SEARCH_QUANTIZATION)
+	// selects int8 arithmetic for similarity search scoring. It is independent
+	// of QuantizedModel, which picks the model that generates the embeddings.
+	SearchQuantization string
+	Lazy               bool
+	// Threads per forward pass; 0 uses every CPU
+	Threads int
+	// QuantizedModel (env EMBEDDINGS_QUANTIZED_MODEL) loads the int8
+	// quantized model_quantized.onnx weights instead of model.onnx to
+	// generate embeddings. It does not change how they are scored.
+	QuantizedModel bool
 }
 
 // FeaturesConfig holds feature flags
@@ -44,29 +77,48 @@ type FeaturesConfig struct {
 	STT        bool
 	TTS        bool
 	Embeddings bool
+	// Warmup runs one throwaway inference per service after it loads
+	Warmup bool
 }
 
 // LoadConfig loads configuration from environment variables
 func LoadConfig() *Config {
 	return &Config{
 		Server: ServerConfig{
-			Port: getEnv("PORT", "8765"),
+			Port:      getEnv("PORT", "8765"),
+			AccessLog: getBoolEnv("ACCESS_LOG", false),
+			DebugLog:  getBoolEnv("DEBUG_LOG", false),
 		},
 		Models: ModelsConfig{
 			Whisper: WhisperConfig{
-				Path: getEnv("WHISPER_MODEL_PATH", "./models/whisper-base"),
+				Path:         getEnv("WHISPER_MODEL_PATH", "./models/whisper-base"),
+				Workers:      getIntEnv("ALICE_WORKERS", 0),
+				Quantization: getEnv("WHISPER_QUANTIZATION", "none"),
+				BeamSize:     getIntEnv("WHISPER_BEAM_SIZE", 1),
+				Threads:      getIntEnv("WHISPER_THREADS", 0),
 			},
 			Piper: PiperConfig{
-				Path: getEnv("PIPER_MODEL_PATH", "./models/piper"),
+				Path:      getEnv("PIPER_MODEL_PATH", "./models/piper"),
+				Workers:   getIntEnv("TTS_WORKERS", 1),
+				CacheSize: getIntEnv("TTS_CACHE_SIZE", 128),
 			},
 			MiniLM: MiniLMConfig{
-				Path: getEnv("MINILM_MODEL_PATH", "./models/minilm"),
+				Path:               getEnv("MINILM_MODEL_PATH", "./models/minilm"),
+				BatchMaxSize:       getIntEnv("ALICE_EMB_BATCH_MAX", 32),
+				BatchMaxWait:       time.Duration(getIntEnv("ALICE_EMB_BATCH_WAIT_MS", 5)) * time.Millisecond,
+				CacheSize:          getIntEnv("ALICE_EMB_CACHE_SIZE", 1024),
+				SearchQuantization: getEnv("EMBEDDINGS_SEARCH_QUANTIZATION", "none"),
+				Lazy:               getBoolEnv("EMBEDDINGS_LAZY", false),
+				Threads:            getIntEnv("EMBEDDINGS_THREADS", 0),
+				QuantizedModel:     getBoolEnv("EMBEDDINGS_QUANTIZED_MODEL", false),
 			},
+			MirrorDir: getEnv("MODEL_MIRROR_DIR", ""),
 		},
 		Features: FeaturesConfig{
 			STT:        getBoolEnv("ENABLE_STT", true),
 			TTS:        getBoolEnv("ENABLE_TTS", true),
 			Embeddings: getBoolEnv("ENABLE_EMBEDDINGS", true),
+			Warmup:     getBoolEnv("MODEL_WARMUP", true),
 		},
 	}
 }
@@ -88,3 +140,13 @@ func getBoolEnv(key string, defaultValue bool) bool {
 	}
 	return defaultValue
 }
+
+// getIntEnv gets an integer environment variable with a default value
+func getIntEnv(key string, defaultValue int) int {
+	if value := os.Getenv(key); value != "" {
+		if intValue, err := strconv.Atoi(value); err == nil {
+			return intValue
+		}
+	}
+	return defaultValue
+}
@@ -131,6 +131,9 @@ type progressReader struct {
 	total         int64
 	logger        *log.Logger
 	bytesReceived int64
+	// loggedStep is the last 10% step logged, so each step is formatted and
+	// written once rather than on every Read that lands inside it
+	loggedStep int64
 }
 
 func (pr *progressReader) Read(p []byte) (int, error) {
@@ -138,9 +141,9 @@ func (pr *progressReader) Read(p []byte) (int, error) {
 	pr.bytesReceived += int64(n)
 
 	if pr.total > 0 {
-		percentage := float64(pr.bytesReceived) * 100.0 / float64(pr.total)
-		if int(percentage)%10 == 0 {
-			pr.logger.Printf("Download progress: %.1f%%", percentage)
+		if step := pr.bytesReceived * 10 / pr.total; step > pr.loggedStep {
+			pr.loggedStep = step
+			pr.logger.Printf("Download progress: %.1f%%", float64(pr.bytesReceived)*100.0/float64(pr.total))
 		}
 	}
 
@@ -0,0 +1,70 @@
+package downloader
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"strconv"
+	"time"
+)
+
+const (
+	// lockRefreshInterval is how often a held lock's timestamp is refreshed
+	lockRefreshInterval = 10 * time.Second
+	// lockStaleAfter is how long a lock may go unrefreshed before it is
+	// considered abandoned by a crashed process and taken over
+	lockStaleAfter = 3 * lockRefreshInterval
+	// lockPollInterval is how often a waiting process retries the lock
+	lockPollInterval = 250 * time.Millisecond
+)
+
+// AcquireLock takes a cross-process lock backed by the file at path, waiting
+// until it is free or ctx is done. Processes sharing a download directory use
+// it so only one of them fetches a file while the others wait and then find it
+// on disk. The returned function releases the lock.
+func AcquireLock(ctx context.Context, path string) (func(), error) {
+	for {
+		f, err := os.OpenFile(path, os.O_CREATE|os.O_EXCL|os.O_WRONLY, 0644)
+		if err == nil {
+			f.WriteString(strconv.Itoa(os.Getpid()))
+			f.Close()
+			return holdLock(path), nil
+		}
+		if !os.IsExist(err) {
+			return nil, fmt.Errorf("failed to create lock file: %w", err)
+		}
+
+		if info, err := os.Stat(path); err == nil && time.Since(info.ModTime()) > lockStaleAfter {
+			os.Remove(path)
+			continue
+		}
+
+		select {
+		case <-ctx.Done():
+			return nil, ctx.Err()
+		case <-time.After(lockPollInterval):
+		}
+	}
+}
+
+// holdLock keeps the lock file fresh until the returned release is called
+func holdLock(path string) func() {
+	done := make(chan struct{})
+	go func() {
+		ticker := time.NewTicker(lockRefreshInterval)
+		defer ticker.Stop()
+		for {
+			select {
+			case <-done:
+				return
+			case now := <-ticker.C:
+				os.Chtimes(path, now, now)
+			}
+		}
+	}()
+
+	return func() {
+		close(done)
+		os.Remove(path)
+	}
+}
@@ -0,0 +1,64 @@
+package downloader
+
+import (
+	"fmt"
+	"io"
+	"log"
+	"os"
+	"path/filepath"
+)
+
+// CopyFromMirror places mirrorDir/name at destPath, for installs that ship
+// or pre-seed model files locally instead of fetching them over the network.
+// The file is hard-linked when the mirror is on the same filesystem and
+// copied otherwise. It reports false, leaving destPath untouched, when
+// mirrorDir is empty or does not contain name.
+func CopyFromMirror(mirrorDir, name, destPath string) bool {
+	if mirrorDir == "" {
+		return false
+	}
+
+	src := filepath.Join(mirrorDir, name)
+	if err := linkOrCopy(src, destPath); err != nil {
+		if !os.IsNotExist(err) {
+			log.Printf("Warning: failed to use %s from model mirror: %v", src, err)
+		}
+		return false
+	}
+
+	log.Printf("Using %s from model mirror", src)
+	return true
+}
+
+// linkOrCopy hard-links src to dst, falling back to copying through a
+// temporary file so dst never exists half-written
+func linkOrCopy(src, dst string) error {
+	in, err := os.Open(src)
+	if err != nil {
+		return err
+	}
+	defer in.Close()
+
+	if err := os.MkdirAll(filepath.Dir(dst), 0755); err != nil {
+		return fmt.Errorf("failed to create directory: %w", err)
+	}
+	if err := os.Link(src, dst); err == nil {
+		return nil
+	}
+
+	partPath := dst + ".part"
+	out, err := os.Create(partPath)
+	if err != nil {
+		return fmt.Errorf("failed to create file: %w", err)
+	}
+	if _, err := io.Copy(out, in); err != nil {
+		out.Close()
+		os.Remove(partPath)
+		return fmt.Errorf("failed to copy file: %w", err)
+	}
+	if err := out.Close(); err != nil {
+		os.Remove(partPath)
+		return fmt.Errorf("failed to copy file: %w", err)
+	}
+	return os.Rename(partPath, dst)
+}
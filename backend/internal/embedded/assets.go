@@ -14,6 +14,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
 )
 
 // Embed all platform-specific binaries and data files
@@ -21,6 +22,10 @@ import (
 //go:embed assets/.gitkeep
 var EmbeddedAssets embed.FS
 
+// extractMu serializes asset extraction. Services initialize concurrently and
+// each runs EnsureAssets against the same directories.
+var extractMu sync.Mutex
+
 // AssetManager handles extraction and management of embedded assets
 type AssetManager struct {
 	baseDir string
@@ -37,8 +42,27 @@ type PlatformInfo struct {
 	PiperVoices  []string
 }
 
-// GetPlatformInfo returns platform-specific paths and requirements
+var (
+	platformInfoOnce sync.Once
+	platformInfo     *PlatformInfo
+
+	productionBaseDirOnce sync.Once
+	productionBaseDir     string
+
+	executableStampOnce sync.Once
+	executableStamp     string
+)
+
+// GetPlatformInfo returns platform-specific paths and requirements. The
+// result is computed once and shared, so callers must not modify it.
 func GetPlatformInfo() *PlatformInfo {
+	platformInfoOnce.Do(func() {
+		platformInfo = detectPlatformInfo()
+	})
+	return platformInfo
+}
+
+func detectPlatformInfo() *PlatformInfo {
 	info := &PlatformInfo{
 		OS:           runtime.GOOS,
 		Arch:         runtime.GOARCH,
@@ -66,8 +90,16 @@ func GetPlatformInfo() *PlatformInfo {
 }
 
 // GetProductionBaseDirectory determines the appropriate base directory for assets
-// based on whether we're running in development or production (Electron bundled) mode
+// based on whether we're running in development or production (Electron bundled) mode.
+// The directory is resolved once per process; every service shares it.
 func GetProductionBaseDirectory() string {
+	productionBaseDirOnce.Do(func() {
+		productionBaseDir = detectProductionBaseDirectory()
+	})
+	return productionBaseDir
+}
+
+func detectProductionBaseDirectory() string {
 	// Get the executable path
 	exePath, err := os.Executable()
 	if err != nil {
@@ -145,6 +177,9 @@ func NewAssetManager(baseDir string) *AssetManager {
 
 // EnsureAssets extracts all required assets for the current platform
 func (am *AssetManager) EnsureAssets(ctx context.Context) error {
+	extractMu.Lock()
+	defer extractMu.Unlock()
+
 	info := GetPlatformInfo()
 	
 	log.Printf("Ensuring assets for platform: %s/%s", info.OS, info.Arch)
@@ -199,7 +234,7 @@ func (am *AssetManager) extractWhisperAssets(ctx context.Context, info *Platform
 	log.Printf("Extracting embedded Whisper assets from: %s", archivePath)
 	// Extract archive to bin directory
 	binDir := filepath.Join(am.baseDir, "bin")
-	return am.extractEmbeddedZip(archivePath, binDir)
+	return am.extractEmbeddedZip(archivePath, binDir, filepath.Join(binDir, info.WhisperPath))
 }
 
 // extractPiperAssets extracts Piper binary and espeak-ng data
@@ -230,10 +265,11 @@ func (am *AssetManager) extractPiperAssets(ctx context.Context, info *PlatformIn
 	
 	log.Printf("Extracting embedded Piper assets from: %s", archivePath)
 	binDir := filepath.Join(am.baseDir, "bin")
+	piperPath := filepath.Join(binDir, info.PiperPath)
 	if isZip {
-		return am.extractEmbeddedZip(archivePath, binDir)
+		return am.extractEmbeddedZip(archivePath, binDir, piperPath)
 	} else {
-		return am.extractEmbeddedTarGz(archivePath, binDir)
+		return am.extractEmbeddedTarGz(archivePath, binDir, piperPath)
 	}
 }
 
@@ -286,40 +322,47 @@ func (am *AssetManager) extractVoiceModels(ctx context.Context, info *PlatformIn
 	return nil
 }
 
-// extractEmbeddedZip extracts a ZIP archive from embedded assets
-func (am *AssetManager) extractEmbeddedZip(archivePath, targetDir string) error {
+// extractEmbeddedZip extracts a ZIP archive from embedded assets. primaryPath
+// is the archive's main output, used to tell whether an earlier extraction
+// is still on disk.
+func (am *AssetManager) extractEmbeddedZip(archivePath, targetDir, primaryPath string) error {
 	archiveData, err := EmbeddedAssets.ReadFile(archivePath)
 	if err != nil {
 		return fmt.Errorf("failed to read embedded archive: %w", err)
 	}
 	
-	// Create a zip reader from the embedded data
-	reader, err := zip.NewReader(strings.NewReader(string(archiveData)), int64(len(archiveData)))
-	if err != nil {
-		return fmt.Errorf("failed to create zip reader: %w", err)
-	}
-	
-	return am.extractZipFiles(reader, targetDir)
+	return am.extractOnce(archivePath, archiveData, targetDir, primaryPath, func() error {
+		// Create a zip reader from the embedded data
+		reader, err := zip.NewReader(strings.NewReader(string(archiveData)), int64(len(archiveData)))
+		if err != nil {
+			return fmt.Errorf("failed to create zip reader: %w", err)
+		}
+
+		return am.extractZipFiles(reader, targetDir)
+	})
 }
 
-// extractEmbeddedTarGz extracts a TAR.GZ archive from embedded assets
-func (am *AssetManager) extractEmbeddedTarGz(archivePath, targetDir string) error {
+// extractEmbeddedTarGz extracts a TAR.GZ archive from embedded assets.
+// primaryPath is used as in extractEmbeddedZip.
+func (am *AssetManager) extractEmbeddedTarGz(archivePath, targetDir, primaryPath string) error {
 	archiveData, err := EmbeddedAssets.ReadFile(archivePath)
 	if err != nil {
 		return fmt.Errorf("failed to read embedded archive: %w", err)
 	}
 	
-	// Create gzip reader
-	gzReader, err := gzip.NewReader(strings.NewReader(string(archiveData)))
-	if err != nil {
-		return fmt.Errorf("failed to create gzip reader: %w", err)
-	}
-	defer gzReader.Close()
-	
-	// Create tar reader
-	tarReader := tar.NewReader(gzReader)
-	
-	return am.extractTarFiles(tarReader, targetDir)
+	return am.extractOnce(archivePath, archiveData, targetDir, primaryPath, func() error {
+		// Create gzip reader
+		gzReader, err := gzip.NewReader(strings.NewReader(string(archiveData)))
+		if err != nil {
+			return fmt.Errorf("failed to create gzip reader: %w", err)
+		}
+		defer gzReader.Close()
+
+		// Create tar reader
+		tarReader := tar.NewReader(gzReader)
+
+		return am.extractTarFiles(tarReader, targetDir)
+	})
 }
 
 // extractEmbeddedFile extracts a single file from embedded assets
@@ -332,8 +375,61 @@ func (am *AssetManager) extractEmbeddedFile(embeddedPath, targetPath string) err
 	if err := os.MkdirAll(filepath.Dir(targetPath), 0755); err != nil {
 		return fmt.Errorf("failed to create target directory: %w", err)
 	}
-	
-	return os.WriteFile(targetPath, data, 0644)
+
+	return am.extractOnce(embeddedPath, data, filepath.Dir(targetPath), targetPath, func() error {
+		return os.WriteFile(targetPath, data, 0644)
+	})
+}
+
+// extractOnce runs extract unless a stamp file in targetDir shows that this
+// exact embedded asset was already extracted there and its output at
+// outputPath is still on disk, so restarts skip rewriting binaries and models
+// that are already in place while files deleted since are restored. The stamp
+// is written only after extract succeeds; an interrupted extraction is redone.
+func (am *AssetManager) extractOnce(embeddedPath string, data []byte, targetDir, outputPath string, extract func() error) error {
+	stampPath := filepath.Join(targetDir, "."+filepath.Base(embeddedPath)+".extracted")
+	sum := assetStamp(data)
+
+	if stamp, err := os.ReadFile(stampPath); err == nil && string(stamp) == sum {
+		if _, err := os.Stat(outputPath); err == nil {
+			return nil
+		}
+		log.Printf("Extracted %s is missing, extracting %s again", outputPath, embeddedPath)
+	}
+
+	if err := extract(); err != nil {
+		return err
+	}
+
+	if err := os.WriteFile(stampPath, []byte(sum), 0644); err != nil {
+		log.Printf("Warning: Failed to write extraction stamp %s: %v", stampPath, err)
+	}
+	return nil
+}
+
+// assetStamp identifies embedded data as shipped in this build of the
+// backend. Embedded data cannot change without the executable changing, so
+// the executable's size and modification time stand in for a hash of the
+// data, which for bundled archives and voices means reading hundreds of
+// megabytes on every start. The data is hashed only if the executable
+// cannot be examined.
+func assetStamp(data []byte) string {
+	executableStampOnce.Do(func() {
+		exe, err := os.Executable()
+		if err != nil {
+			return
+		}
+		info, err := os.Stat(exe)
+		if err != nil {
+			return
+		}
+		executableStamp = fmt.Sprintf("exe-%d-%d", info.Size(), info.ModTime().UnixNano())
+	})
+
+	if executableStamp == "" {
+		return fmt.Sprintf("%x", md5.Sum(data))
+	}
+	return fmt.Sprintf("%s-%d", executableStamp, len(data))
 }
 
 // extractZipFiles extracts files from a ZIP archive
@@ -0,0 +1,135 @@
+package minilm
+
+import (
+	"context"
+	"fmt"
+	"time"
+)
+
+var errBatcherStopped = fmt.Errorf("embeddings batcher stopped: %w", ErrNotReady)
+
+// batchRequest is a single text waiting to be embedded by the batcher
+type batchRequest struct {
+	text   string
+	result chan batchResult
+}
+
+// batchResult carries the embedding for one batchRequest
+type batchResult struct {
+	embedding []float32
+	err       error
+}
+
+// batcher coalesces concurrent single-text embedding requests into one model
+// forward pass. When more requests are already queued behind the first, it
+// waits up to maxWait for others to arrive, or until maxSize texts are
+// queued, whichever happens first.
+type batcher struct {
+	queue   chan batchRequest
+	done    chan struct{}
+	maxSize int
+	maxWait time.Duration
+	run     func(ctx context.Context, texts []string) ([][]float32, error)
+}
+
+// newBatcher starts a batcher that embeds texts with run
+func newBatcher(maxSize int, maxWait time.Duration, run func(ctx context.Context, texts []string) ([][]float32, error)) *batcher {
+	if maxSize <= 0 {
+		maxSize = 1
+	}
+
+	b := &batcher{
+		queue:   make(chan batchRequest, maxSize),
+		done:    make(chan struct{}),
+		maxSize: maxSize,
+		maxWait: maxWait,
+		run:     run,
+	}
+	go b.loop()
+	return b
+}
+
+// submit queues text and waits for its embedding
+func (b *batcher) submit(ctx context.Context, text string) ([]float32, error) {
+	req := batchRequest{text: text, result: make(chan batchResult, 1)}
+
+	select {
+	case b.queue <- req:
+	case <-b.done:
+		return nil, errBatcherStopped
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+
+	select {
+	case res := <-req.result:
+		return res.embedding, res.err
+	case <-b.done:
+		return nil, errBatcherStopped
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+// stop terminates the batching loop; pending and future submits fail
+func (b *batcher) stop() {
+	close(b.done)
+}
+
+func (b *batcher) loop() {
+	batch := make([]batchRequest, 0, b.maxSize)
+	texts := make([]string, 0, b.maxSize)
+
+	for {
+		select {
+		case req := <-b.queue:
+			batch = append(batch[:0], req)
+		case <-b.done:
+			return
+		}
+
+		// A lone request on an idle batcher runs at once rather than paying
+		// maxWait for company that is not coming. Under load, requests queue
+		// up while a forward pass runs and are collected below.
+		if len(b.queue) > 0 {
+			if !b.collect(&batch) {
+				return
+			}
+		}
+
+		texts = texts[:0]
+		for _, req := range batch {
+			texts = append(texts, req.text)
+		}
+
+		// Requests share the forward pass, so one caller's cancellation
+		// must not abort it for the others
+		embeddings, err := b.run(context.Background(), texts)
+		for i, req := range batch {
+			if err != nil {
+				req.result <- batchResult{err: err}
+				continue
+			}
+			req.result <- batchResult{embedding: embeddings[i]}
+		}
+	}
+}
+
+// collect adds queued requests to batch until it is full or maxWait has
+// passed. It returns false if the batcher was stopped meanwhile.
+func (b *batcher) collect(batch *[]batchRequest) bool {
+	timer := time.NewTimer(b.maxWait)
+	defer timer.Stop()
+
+	for len(*batch) < b.maxSize {
+		select {
+		case req := <-b.queue:
+			*batch = append(*batch, req)
+		case <-timer.C:
+			return true
+		case <-b.done:
+			return false
+		}
+	}
+	return true
+}
@@ -0,0 +1,71 @@
+package minilm
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"sync"
+)
+
+// embeddingCache is a fixed-size LRU of embeddings keyed by the SHA-256 of
+// the input text, so repeated texts skip tokenization and inference
+type embeddingCache struct {
+	mu       sync.Mutex
+	capacity int
+	order    *list.List
+	entries  map[[sha256.Size]byte]*list.Element
+}
+
+type cacheEntry struct {
+	key       [sha256.Size]byte
+	embedding []float32
+}
+
+// newEmbeddingCache returns a cache holding up to capacity embeddings, or nil
+// if capacity is not positive
+func newEmbeddingCache(capacity int) *embeddingCache {
+	if capacity <= 0 {
+		return nil
+	}
+	return &embeddingCache{
+		capacity: capacity,
+		order:    list.New(),
+		entries:  make(map[[sha256.Size]byte]*list.Element, capacity),
+	}
+}
+
+// get returns the cached embedding for text. The result is shared and must
+// not be modified.
+func (c *embeddingCache) get(text string) ([]float32, bool) {
+	key := sha256.Sum256([]byte(text))
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.entries[key]
+	if !ok {
+		return nil, false
+	}
+	c.order.MoveToFront(elem)
+	return elem.Value.(*cacheEntry).embedding, true
+}
+
+// put stores the embedding for text, evicting the least recently used entry when full
+func (c *embeddingCache) put(text string, embedding []float32) {
+	key := sha256.Sum256([]byte(text))
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if elem, ok := c.entries[key]; ok {
+		elem.Value.(*cacheEntry).embedding = embedding
+		c.order.MoveToFront(elem)
+		return
+	}
+
+	c.entries[key] = c.order.PushFront(&cacheEntry{key: key, embedding: embedding})
+	if c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*cacheEntry).key)
+	}
+}
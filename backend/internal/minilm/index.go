@@ -0,0 +1,69 @@
+package minilm
+
+import "fmt"
+
+// CandidateIndex holds search candidates as one contiguous row-major float32
+// matrix with every row normalized to unit length, so a search scores it in a
+// single pass without repacking or renormalizing candidates
+type CandidateIndex struct {
+	dim    int
+	matrix []float32
+
+	// int8 copy of matrix with one scale per row, built by Quantize
+	matrix8 []int8
+	scales  []float32
+}
+
+// NewCandidateIndex returns an empty index for dim-dimensional embeddings with
+// room for capacity rows before it has to grow
+func NewCandidateIndex(dim, capacity int) *CandidateIndex {
+	return &CandidateIndex{
+		dim:    dim,
+		matrix: make([]float32, 0, dim*capacity),
+	}
+}
+
+// Dim returns the embedding dimension of the index
+func (idx *CandidateIndex) Dim() int {
+	return idx.dim
+}
+
+// Len returns the number of candidates in the index
+func (idx *CandidateIndex) Len() int {
+	if idx.dim == 0 {
+		return 0
+	}
+	return len(idx.matrix) / idx.dim
+}
+
+// Add copies embedding into the index as a new normalized row
+func (idx *CandidateIndex) Add(embedding []float32) error {
+	if len(embedding) != idx.dim {
+		return fmt.Errorf("embedding has dimension %d, expected %d", len(embedding), idx.dim)
+	}
+
+	start := len(idx.matrix)
+	idx.matrix = append(idx.matrix, embedding...)
+	normalize(idx.matrix[start:])
+
+	// A stale int8 copy would silently miss the new row
+	idx.matrix8, idx.scales = nil, nil
+	return nil
+}
+
+// Quantize builds the int8 copy of the index used by int8 similarity search,
+// a quarter of the float32 matrix in size. It is a no-op if the copy is
+// already current.
+func (idx *CandidateIndex) Quantize() {
+	if idx.matrix8 != nil {
+		return
+	}
+
+	rows := idx.Len()
+	idx.matrix8 = make([]int8, len(idx.matrix))
+	idx.scales = make([]float32, rows)
+	for i := 0; i < rows; i++ {
+		row := idx.matrix[i*idx.dim : (i+1)*idx.dim]
+		idx.scales[i] = quantizeInt8(row, idx.matrix8[i*idx.dim:])
+	}
+}
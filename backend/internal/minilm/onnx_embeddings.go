@@ -9,7 +9,6 @@ import (
 	"fmt"
 	"io"
 	"log"
-	"math"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -17,21 +16,37 @@ import (
 	"sort"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 	"unicode"
 
+	"alice-backend/internal/downloader"
+
 	ort "github.com/yalue/onnxruntime_go"
 )
 
+// ErrNotReady is returned by embedding calls made before the model is loaded
+// or after the service has shut down
+var ErrNotReady = errors.New("embeddings service is not ready")
+
 // OnnxEmbeddingService provides text embedding functionality using ONNX Runtime with pure Go tokenizer
 type OnnxEmbeddingService struct {
+	// initMu serializes loading and shutdown; mu only guards the fields
+	// below so readers are not blocked while the model loads
+	initMu    sync.Mutex
 	mu        sync.RWMutex
-	ready     bool
+	ready     atomic.Bool
 	config    *Config
 	info      *ServiceInfo
 	tokenizer *wordPiece
 	session   *ort.DynamicAdvancedSession
+	batcher   *batcher
+	cache     *embeddingCache
 	maxLen    int
+	warming   atomic.Bool
+	// runSlot admits one forward pass at a time; ONNX Runtime already
+	// spreads each pass across all cores
+	runSlot chan struct{}
 }
 
 // Ensure OnnxEmbeddingService implements EmbeddingProvider
@@ -40,8 +55,10 @@ var _ EmbeddingProvider = (*OnnxEmbeddingService)(nil)
 // NewOnnxEmbeddingService creates a new ONNX-based embedding service
 func NewOnnxEmbeddingService(config *Config) *OnnxEmbeddingService {
 	return &OnnxEmbeddingService{
-		config: config,
-		maxLen: 128, // Standard max length for MiniLM
+		config:  config,
+		cache:   newEmbeddingCache(config.CacheSize),
+		maxLen:  128, // Standard max length for MiniLM
+		runSlot: make(chan struct{}, 1),
 		info: &ServiceInfo{
 			Name:        "ONNX MiniLM Embeddings",
 			Version:     "2.0.0",
@@ -56,13 +73,18 @@ func NewOnnxEmbeddingService(config *Config) *OnnxEmbeddingService {
 
 // Initialize initializes the ONNX embeddings service
 func (s *OnnxEmbeddingService) Initialize(ctx context.Context) error {
-	s.mu.Lock()
-	defer s.mu.Unlock()
+	s.initMu.Lock()
+	defer s.initMu.Unlock()
+
+	// A lazy service can be warmed by several callers at once
+	if s.ready.Load() {
+		return nil
+	}
 
 	log.Println("Initializing ONNX embeddings service with pure Go tokenizer...")
 
 	// Ensure runtime and model files
-	if err := s.ensureRuntimeAndModel(); err != nil {
+	if err := s.ensureRuntimeAndModel(ctx); err != nil {
 		return fmt.Errorf("failed to ensure runtime and model: %w", err)
 	}
 
@@ -71,24 +93,34 @@ func (s *OnnxEmbeddingService) Initialize(ctx context.Context) error {
 		return fmt.Errorf("failed to initialize session: %w", err)
 	}
 
-	s.ready = true
+	s.mu.Lock()
+	// A batcher left from an earlier initialization would keep its goroutine
+	// running alongside the new one
+	if s.batcher != nil {
+		s.batcher.stop()
+	}
+	s.batcher = newBatcher(s.config.BatchMaxSize, s.config.BatchMaxWait, s.GenerateEmbeddings)
+	s.ready.Store(true)
 	s.info.Status = "ready"
 	s.info.LastUpdated = time.Now()
 	s.info.Metadata["onnx_runtime"] = "enabled"
 	s.info.Metadata["tokenizer"] = "pure_go_wordpiece"
+	s.info.Metadata["search_quantization"] = s.config.SearchQuantization
+	s.info.Metadata["model_file"] = modelFileName(s.config.QuantizedModel)
+	s.mu.Unlock()
 
 	log.Println("ONNX embeddings service initialized successfully")
 	return nil
 }
 
-func (s *OnnxEmbeddingService) ensureRuntimeAndModel() error {
+func (s *OnnxEmbeddingService) ensureRuntimeAndModel(ctx context.Context) error {
 	// Ensure model directory
 	if err := os.MkdirAll(s.config.ModelPath, 0o755); err != nil {
 		return err
 	}
 
 	// Download ORT shared library
-	libPath, err := ensureORTSharedLib()
+	libPath, err := ensureORTSharedLib(ctx)
 	if err != nil {
 		return fmt.Errorf("onnxruntime lib: %w", err)
 	}
@@ -96,8 +128,14 @@ func (s *OnnxEmbeddingService) ensureRuntimeAndModel() error {
 	// Point onnxruntime_go to the shared library
 	ort.SetSharedLibraryPath(libPath)
 
-	// Download model and vocab
-	_, vocabPath, err := ensureMiniLMModel(s.config.ModelPath)
+	// Download model and vocab. Another backend process sharing the model
+	// directory may be fetching them too; wait for it rather than racing it.
+	release, err := downloader.AcquireLock(ctx, filepath.Join(s.config.ModelPath, ".download.lock"))
+	if err != nil {
+		return fmt.Errorf("model download lock: %w", err)
+	}
+	_, vocabPath, err := ensureMiniLMModel(s.config.ModelPath, s.config.QuantizedModel, s.config.MirrorDir)
+	release()
 	if err != nil {
 		return err
 	}
@@ -120,8 +158,34 @@ func (s *OnnxEmbeddingService) initSession() error {
 	inNames := []string{"input_ids", "attention_mask", "token_type_ids"}
 	outNames := []string{"last_hidden_state"}
 
-	modelPath := filepath.Join(s.config.ModelPath, "model.onnx")
-	sess, err := ort.NewDynamicAdvancedSession(modelPath, inNames, outNames, nil)
+	// Enable all graph optimizations (constant folding, node fusions such as
+	// attention and GELU, layout transforms) so inference runs fused kernels
+	opts, err := ort.NewSessionOptions()
+	if err != nil {
+		return fmt.Errorf("failed to create session options: %w", err)
+	}
+	defer opts.Destroy()
+
+	if err := opts.SetGraphOptimizationLevel(ort.GraphOptimizationLevelEnableAll); err != nil {
+		return fmt.Errorf("failed to set graph optimization level: %w", err)
+	}
+
+	// Passes are serialized by runSlot, so give each one every core for
+	// intra-op parallelism unless configured otherwise, and skip the
+	// inter-op pool, which only helps graphs with independent branches
+	threads := s.config.Threads
+	if threads <= 0 {
+		threads = runtime.NumCPU()
+	}
+	if err := opts.SetIntraOpNumThreads(threads); err != nil {
+		return fmt.Errorf("failed to set intra-op threads: %w", err)
+	}
+	if err := opts.SetInterOpNumThreads(1); err != nil {
+		return fmt.Errorf("failed to set inter-op threads: %w", err)
+	}
+
+	modelPath := filepath.Join(s.config.ModelPath, modelFileName(s.config.QuantizedModel))
+	sess, err := ort.NewDynamicAdvancedSession(modelPath, inNames, outNames, opts)
 	if err != nil {
 		return err
 	}
@@ -131,9 +195,55 @@ func (s *OnnxEmbeddingService) initSession() error {
 
 // IsReady returns true if the service is ready
 func (s *OnnxEmbeddingService) IsReady() bool {
-	s.mu.RLock()
-	defer s.mu.RUnlock()
-	return s.ready
+	return s.ready.Load()
+}
+
+// Warm initializes a lazily loaded service if it is not ready yet. Concurrent
+// callers wait for the same initialization.
+func (s *OnnxEmbeddingService) Warm(ctx context.Context) error {
+	if s.IsReady() {
+		return nil
+	}
+	if err := s.Initialize(ctx); err != nil {
+		return fmt.Errorf("%w: %v", ErrNotReady, err)
+	}
+	return nil
+}
+
+// StartWarm begins warming a lazily loaded service in the background and
+// returns immediately. It does nothing if the service is ready, not lazy, or
+// already warming.
+func (s *OnnxEmbeddingService) StartWarm() {
+	if !s.config.Lazy || s.IsReady() || !s.warming.CompareAndSwap(false, true) {
+		return
+	}
+	go func() {
+		defer s.warming.Store(false)
+		if err := s.Warm(context.Background()); err != nil {
+			log.Printf("Failed to warm embeddings service: %v", err)
+		}
+	}()
+}
+
+// Warmup runs one forward pass outside the cache and batcher so ONNX Runtime
+// makes its first-run allocations before a real request arrives
+func (s *OnnxEmbeddingService) Warmup(ctx context.Context) error {
+	if !s.IsReady() {
+		return ErrNotReady
+	}
+	_, err := s.embed([]string{"warmup"})
+	return err
+}
+
+// ensureReady loads a lazy service on first use
+func (s *OnnxEmbeddingService) ensureReady(ctx context.Context) error {
+	if s.IsReady() {
+		return nil
+	}
+	if !s.config.Lazy {
+		return ErrNotReady
+	}
+	return s.Warm(ctx)
 }
 
 // GetInfo returns service information
@@ -148,47 +258,107 @@ func (s *OnnxEmbeddingService) GetInfo() *ServiceInfo {
 
 // GenerateEmbedding generates a single embedding using ONNX Runtime
 func (s *OnnxEmbeddingService) GenerateEmbedding(ctx context.Context, text string) ([]float32, error) {
-	if !s.IsReady() {
-		return nil, fmt.Errorf("embeddings service is not ready")
+	if err := s.ensureReady(ctx); err != nil {
+		return nil, err
 	}
 
 	if text == "" {
 		return nil, fmt.Errorf("text cannot be empty")
 	}
 
-	// Use batch function with single text
-	embeddings, err := s.GenerateEmbeddings(ctx, []string{text})
-	if err != nil {
-		return nil, err
+	if s.cache != nil {
+		if embedding, ok := s.cache.get(text); ok {
+			return embedding, nil
+		}
 	}
 
-	return embeddings[0], nil
+	s.mu.RLock()
+	b := s.batcher
+	s.mu.RUnlock()
+	if b == nil {
+		return nil, ErrNotReady
+	}
+
+	// Coalesce with concurrent requests into a shared forward pass
+	return b.submit(ctx, text)
 }
 
 // GenerateEmbeddings generates multiple embeddings
 func (s *OnnxEmbeddingService) GenerateEmbeddings(ctx context.Context, texts []string) ([][]float32, error) {
-	if !s.IsReady() {
-		return nil, fmt.Errorf("embeddings service is not ready")
+	if err := s.ensureReady(ctx); err != nil {
+		return nil, err
 	}
 
 	if len(texts) == 0 {
 		return nil, fmt.Errorf("texts cannot be empty")
 	}
 
-	// Tokenize all texts
-	ids, masks := s.batchTokenize(texts, s.maxLen)
+	if s.cache == nil {
+		return s.embed(texts)
+	}
 
-	// Create tensors
-	bsz := len(texts)
-	seq := s.maxLen
-	inputIDs := make([]int64, bsz*seq)
-	attMask := make([]int64, bsz*seq)
+	// Only run the model for texts that are not cached
+	out := make([][]float32, len(texts))
+	var missTexts []string
+	var missIdx []int
+	for i, text := range texts {
+		if embedding, ok := s.cache.get(text); ok {
+			out[i] = embedding
+			continue
+		}
+		missTexts = append(missTexts, text)
+		missIdx = append(missIdx, i)
+	}
 
-	for i := 0; i < bsz; i++ {
-		copy(inputIDs[i*seq:(i+1)*seq], ids[i])
-		copy(attMask[i*seq:(i+1)*seq], masks[i])
+	if len(missTexts) == 0 {
+		return out, nil
+	}
+
+	embeddings, err := s.embed(missTexts)
+	if err != nil {
+		return nil, err
+	}
+
+	for j, i := range missIdx {
+		out[i] = embeddings[j]
+		s.cache.put(missTexts[j], embeddings[j])
+	}
+
+	return out, nil
+}
+
+// inferenceBatchSize caps the number of texts in one forward pass. The
+// activations for a batch grow with batch * sequence * hidden size, so
+// large requests are split rather than run as one oversized tensor.
+const inferenceBatchSize = 32
+
+// embed runs the model over texts and returns their mean-pooled, L2-normalized embeddings
+func (s *OnnxEmbeddingService) embed(texts []string) ([][]float32, error) {
+	if len(texts) <= inferenceBatchSize {
+		return s.embedBatch(texts)
 	}
 
+	out := make([][]float32, 0, len(texts))
+	for start := 0; start < len(texts); start += inferenceBatchSize {
+		end := min(start+inferenceBatchSize, len(texts))
+		embeddings, err := s.embedBatch(texts[start:end])
+		if err != nil {
+			return nil, err
+		}
+		out = append(out, embeddings...)
+	}
+	return out, nil
+}
+
+// embedBatch runs a single forward pass over texts
+func (s *OnnxEmbeddingService) embedBatch(texts []string) ([][]float32, error) {
+	// Tokenize all texts straight into the tensor buffers, padded only to
+	// the longest sequence in the batch
+	bsz := len(texts)
+	inputIDs, attMask, seq := s.batchTokenize(texts, s.maxLen)
+
+	// Create tensors
+
 	in1, err := ort.NewTensor[int64](ort.NewShape(int64(bsz), int64(seq)), inputIDs)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create input tensor: %w", err)
@@ -212,12 +382,17 @@ func (s *OnnxEmbeddingService) GenerateEmbeddings(ctx context.Context, texts []s
 	inputsVals := []ort.Value{in1, in2, tti}
 	outputsVals := make([]ort.Value, 1)
 
-	if err := s.session.Run(inputsVals, outputsVals); err != nil {
+	// Concurrent passes would oversubscribe the cores each one already uses
+	s.runSlot <- struct{}{}
+	err = s.session.Run(inputsVals, outputsVals)
+	<-s.runSlot
+	if err != nil {
 		return nil, fmt.Errorf("ONNX inference failed: %w", err)
 	}
 
-	// Process output
+	// Process output. Run allocated the output tensor, so it is ours to free.
 	out0 := outputsVals[0]
+	defer out0.Destroy()
 	t, ok := out0.(*ort.Tensor[float32])
 	if !ok {
 		return nil, errors.New("unexpected output type")
@@ -232,11 +407,13 @@ func (s *OnnxEmbeddingService) GenerateEmbeddings(ctx context.Context, texts []s
 	seqLen := int(shape[1])
 	hiddenSize := int(shape[2])
 
-	// Mean pooling with attention mask
+	// Mean pooling with attention mask. All rows share one contiguous
+	// backing array so callers can hand it out as a packed matrix.
 	out := make([][]float32, bsz)
+	flat := make([]float32, bsz*hiddenSize)
 	for i := 0; i < bsz; i++ {
 		start := i * seqLen * hiddenSize
-		vec := make([]float32, hiddenSize)
+		vec := flat[i*hiddenSize : (i+1)*hiddenSize : (i+1)*hiddenSize]
 		var count float32
 
 		for j := 0; j < seqLen; j++ {
@@ -250,19 +427,9 @@ func (s *OnnxEmbeddingService) GenerateEmbeddings(ctx context.Context, texts []s
 			count += 1
 		}
 
+		// The 1/count mean scale cancels out under L2 normalization
 		if count > 0 {
-			inv := 1.0 / count
-			var norm float64
-			for d := 0; d < hiddenSize; d++ {
-				vec[d] *= float32(inv)
-				norm += float64(vec[d] * vec[d])
-			}
-			if norm > 0 {
-				invn := float32(1.0 / math.Sqrt(norm))
-				for d := 0; d < hiddenSize; d++ {
-					vec[d] *= invn
-				}
-			}
+			normalize(vec)
 		}
 		out[i] = vec
 	}
@@ -270,39 +437,62 @@ func (s *OnnxEmbeddingService) GenerateEmbeddings(ctx context.Context, texts []s
 	return out, nil
 }
 
-// batchTokenize tokenizes multiple texts
-func (s *OnnxEmbeddingService) batchTokenize(texts []string, maxLen int) ([][]int64, [][]int64) {
-	ids := make([][]int64, len(texts))
-	masks := make([][]int64, len(texts))
+// batchTokenize tokenizes multiple texts into flat row-major id and mask
+// buffers ready to back the input tensors. Rows are padded to the longest
+// sequence in the batch rather than maxLen, since attention cost grows with
+// sequence length and short chat texts would otherwise be mostly padding.
+// It returns the buffers and that padded sequence length.
+func (s *OnnxEmbeddingService) batchTokenize(texts []string, maxLen int) ([]int64, []int64, int) {
+	ids := make([]int64, len(texts)*maxLen)
+	masks := make([]int64, len(texts)*maxLen)
+	seq := 1
 	for i, t := range texts {
-		ii, mm := s.encode(t, maxLen)
-		ids[i], masks[i] = ii, mm
+		seq = max(seq, s.encode(t, ids[i*maxLen:(i+1)*maxLen], masks[i*maxLen:(i+1)*maxLen]))
+	}
+
+	// Compact rows down to seq columns in place; each row only moves left
+	if seq < maxLen {
+		for i := 1; i < len(texts); i++ {
+			copy(ids[i*seq:(i+1)*seq], ids[i*maxLen:i*maxLen+seq])
+			copy(masks[i*seq:(i+1)*seq], masks[i*maxLen:i*maxLen+seq])
+		}
+		ids, masks = ids[:len(texts)*seq], masks[:len(texts)*seq]
 	}
-	return ids, masks
+	return ids, masks, seq
 }
 
-func (s *OnnxEmbeddingService) encode(text string, maxLen int) ([]int64, []int64) {
-	toks := basicTokens(text)
+// encode writes the token ids and attention mask for text into ids and mask,
+// which must be zeroed and of equal length; unused positions stay as padding.
+// It returns the number of positions used.
+func (s *OnnxEmbeddingService) encode(text string, ids, mask []int64) int {
+	maxLen := len(ids)
+	// Every word yields at least one piece, so only the first maxLen-1 words
+	// (after [CLS]) can survive truncation
+	budget := maxLen - 1
+	toks := basicTokens(text, budget)
 	var pieces []int
 	for _, w := range toks {
 		pieces = append(pieces, s.tokenizer.tokenizeWord(w)...)
+		if len(pieces) >= budget {
+			break
+		}
 	}
-	seq := []int{s.tokenizer.clsID}
-	seq = append(seq, pieces...)
-	seq = append(seq, s.tokenizer.sepID)
-	if len(seq) > maxLen {
-		seq = seq[:maxLen]
-	}
-	ids := make([]int64, maxLen)
-	mask := make([]int64, maxLen)
-	for i, v := range seq {
-		ids[i] = int64(v)
-		mask[i] = 1
+
+	ids[0], mask[0] = int64(s.tokenizer.clsID), 1
+	n := 1
+	for _, v := range pieces {
+		if n == maxLen {
+			break
+		}
+		ids[n], mask[n] = int64(v), 1
+		n++
 	}
-	for i := len(seq); i < maxLen; i++ {
-		ids[i] = 0
+	// [SEP] is only kept when the text fits, as truncation cuts it off
+	if n < maxLen {
+		ids[n], mask[n] = int64(s.tokenizer.sepID), 1
+		n++
 	}
-	return ids, mask
+	return n
 }
 
 // ComputeSimilarity computes cosine similarity between two embeddings
@@ -315,13 +505,8 @@ func (s *OnnxEmbeddingService) ComputeSimilarity(ctx context.Context, embedding1
 		return 0, fmt.Errorf("embeddings cannot be empty")
 	}
 
-	// Compute dot product (cosine similarity for normalized vectors)
-	dotProduct := float32(0)
-	for i := range embedding1 {
-		dotProduct += embedding1[i] * embedding2[i]
-	}
-
-	return dotProduct, nil
+	// Dot product (cosine similarity for normalized vectors)
+	return dot(embedding1, embedding2), nil
 }
 
 // SearchSimilar finds similar embeddings
@@ -330,50 +515,71 @@ func (s *OnnxEmbeddingService) SearchSimilar(ctx context.Context, queryEmbedding
 		return nil, nil, fmt.Errorf("query embedding cannot be empty")
 	}
 
-	if len(candidateEmbeddings) == 0 {
+	index := NewCandidateIndex(len(queryEmbedding), len(candidateEmbeddings))
+	for i, candidate := range candidateEmbeddings {
+		if err := index.Add(candidate); err != nil {
+			return nil, nil, fmt.Errorf("candidate %d: %w", i, err)
+		}
+	}
+
+	return s.SearchIndex(ctx, queryEmbedding, index, topK)
+}
+
+// SearchIndex finds the candidates in index most similar to queryEmbedding
+func (s *OnnxEmbeddingService) SearchIndex(ctx context.Context, queryEmbedding []float32, index *CandidateIndex, topK int) ([]int, []float32, error) {
+	if len(queryEmbedding) == 0 {
+		return nil, nil, fmt.Errorf("query embedding cannot be empty")
+	}
+
+	if index.Len() == 0 {
 		return nil, nil, fmt.Errorf("candidate embeddings cannot be empty")
 	}
 
+	if index.Dim() != len(queryEmbedding) {
+		return nil, nil, fmt.Errorf("candidates have dimension %d, expected %d", index.Dim(), len(queryEmbedding))
+	}
+
 	if topK <= 0 {
 		topK = 5
 	}
 
-	// Compute similarities
-	similarities := make([]float32, len(candidateEmbeddings))
-	indices := make([]int, len(candidateEmbeddings))
+	// Normalize the query once; index rows are already unit length, so each
+	// candidate costs a single dot product
+	query := make([]float32, len(queryEmbedding))
+	copy(query, queryEmbedding)
+	normalize(query)
 
-	for i, candidate := range candidateEmbeddings {
-		similarity, err := s.ComputeSimilarity(ctx, queryEmbedding, candidate)
-		if err != nil {
-			return nil, nil, fmt.Errorf("failed to compute similarity for candidate %d: %w", i, err)
-		}
-		similarities[i] = similarity
-		indices[i] = i
-	}
-
-	// Sort by similarity (descending)
-	for i := 0; i < len(similarities)-1; i++ {
-		for j := i + 1; j < len(similarities); j++ {
-			if similarities[i] < similarities[j] {
-				similarities[i], similarities[j] = similarities[j], similarities[i]
-				indices[i], indices[j] = indices[j], indices[i]
-			}
-		}
+	scores := make([]float32, index.Len())
+	if s.config.SearchQuantization == QuantizationInt8 {
+		index.Quantize()
+		query8 := make([]int8, len(query))
+		queryScale := quantizeInt8(query, query8)
+		scoreRowsInt8(index.matrix8, index.scales, query8, queryScale, scores)
+	} else {
+		scoreRows(index.matrix, query, scores)
 	}
 
-	// Return top K
-	if topK > len(similarities) {
-		topK = len(similarities)
+	indices := topKIndices(scores, topK)
+	similarities := make([]float32, len(indices))
+	for i, idx := range indices {
+		similarities[i] = scores[idx]
 	}
 
-	return indices[:topK], similarities[:topK], nil
+	return indices, similarities, nil
 }
 
 // Shutdown gracefully shuts down the embeddings service
 func (s *OnnxEmbeddingService) Shutdown(ctx context.Context) error {
+	s.initMu.Lock()
+	defer s.initMu.Unlock()
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
+	if s.batcher != nil {
+		s.batcher.stop()
+		s.batcher = nil
+	}
+
 	if s.session != nil {
 		s.session.Destroy()
 		s.session = nil
@@ -382,7 +588,7 @@ func (s *OnnxEmbeddingService) Shutdown(ctx context.Context) error {
 	// Clean up ONNX Runtime environment
 	ort.DestroyEnvironment()
 
-	s.ready = false
+	s.ready.Store(false)
 	s.info.Status = "stopped"
 	s.info.LastUpdated = time.Now()
 
@@ -392,11 +598,19 @@ func (s *OnnxEmbeddingService) Shutdown(ctx context.Context) error {
 
 // Downloads and model management (adapted from GoLLMCore)
 
-func ensureMiniLMModel(dir string) (modelPath, vocabPath string, err error) {
-	modelPath = filepath.Join(dir, "model.onnx")
+// modelFileName returns the local file name of the MiniLM model variant
+func modelFileName(quantized bool) string {
+	if quantized {
+		return "model_quantized.onnx"
+	}
+	return "model.onnx"
+}
+
+func ensureMiniLMModel(dir string, quantized bool, mirrorDir string) (modelPath, vocabPath string, err error) {
+	modelPath = filepath.Join(dir, modelFileName(quantized))
 	vocabPath = filepath.Join(dir, "vocab.txt")
 
-	if _, e := os.Stat(modelPath); e != nil {
+	if _, e := os.Stat(modelPath); e != nil && !downloader.CopyFromMirror(mirrorDir, modelFileName(quantized), modelPath) {
 		urls := []string{
 			// ONNX export of MiniLM (Transformers.js format)
 			"https://huggingface.co/Xenova/all-MiniLM-L6-v2/resolve/main/onnx/model.onnx",
@@ -405,12 +619,19 @@ func ensureMiniLMModel(dir string) (modelPath, vocabPath string, err error) {
 			// Community ONNX mirrors
 			"https://huggingface.co/onnx-community/all-MiniLM-L6-v2/resolve/main/model.onnx",
 		}
+		if quantized {
+			// Dynamically quantized int8 weights: a quarter of the size and
+			// faster on CPUs with int8 dot-product instructions
+			urls = []string{
+				"https://huggingface.co/Xenova/all-MiniLM-L6-v2/resolve/main/onnx/model_quantized.onnx",
+			}
+		}
 		if err = tryDownload(urls, modelPath, 3, 180*time.Second); err != nil {
 			return "", "", err
 		}
 	}
 
-	if _, e := os.Stat(vocabPath); e != nil {
+	if _, e := os.Stat(vocabPath); e != nil && !downloader.CopyFromMirror(mirrorDir, "vocab.txt", vocabPath) {
 		urls := []string{
 			"https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2/resolve/main/vocab.txt",
 		}
@@ -422,7 +643,7 @@ func ensureMiniLMModel(dir string) (modelPath, vocabPath string, err error) {
 	return modelPath, vocabPath, nil
 }
 
-func ensureORTSharedLib() (string, error) {
+func ensureORTSharedLib(ctx context.Context) (string, error) {
 	baseDir := filepath.Join(os.TempDir(), "onnxruntime")
 	ortVersion := "v1.22.0"
 	versionDir := filepath.Join(baseDir, ortVersion)
@@ -430,6 +651,14 @@ func ensureORTSharedLib() (string, error) {
 		return "", err
 	}
 
+	// The runtime lives in the shared temp directory, so every backend
+	// process on the machine resolves the same files
+	release, err := downloader.AcquireLock(ctx, filepath.Join(versionDir, ".download.lock"))
+	if err != nil {
+		return "", fmt.Errorf("runtime download lock: %w", err)
+	}
+	defer release()
+
 	switch runtime.GOOS {
 	case "windows":
 		dll := filepath.Join(versionDir, "onnxruntime.dll")
@@ -702,24 +931,38 @@ func loadWordPiece(path string) (*wordPiece, error) {
 	}, nil
 }
 
-func basicTokens(s string) []string {
-	s = strings.ToLower(s)
-	var out []string
+// basicTokens splits s into lowercased runs of letters and digits, stopping
+// after maxTokens tokens. Tokens are slices of one lowered copy of the text,
+// built a rune at a time so long inputs are never lowered or scanned past
+// the point where they would be truncated anyway.
+func basicTokens(s string, maxTokens int) []string {
 	var b strings.Builder
-	flush := func() {
-		if b.Len() > 0 {
-			out = append(out, b.String())
-			b.Reset()
-		}
-	}
+	var bounds []int
+	inToken := false
 	for _, r := range s {
 		if unicode.IsLetter(r) || unicode.IsDigit(r) {
-			b.WriteRune(r)
-		} else {
-			flush()
+			if !inToken {
+				if len(bounds)/2 == maxTokens {
+					break
+				}
+				bounds = append(bounds, b.Len())
+				inToken = true
+			}
+			b.WriteRune(unicode.ToLower(r))
+		} else if inToken {
+			bounds = append(bounds, b.Len())
+			inToken = false
 		}
 	}
-	flush()
+	if inToken {
+		bounds = append(bounds, b.Len())
+	}
+
+	lowered := b.String()
+	out := make([]string, len(bounds)/2)
+	for i := range out {
+		out[i] = lowered[bounds[2*i]:bounds[2*i+1]]
+	}
 	return out
 }
 
@@ -0,0 +1,200 @@
+package minilm
+
+import (
+	"math"
+	"runtime"
+	"sort"
+	"sync"
+)
+
+// parallelScoreThreshold is the matrix size (rows * dim) above which row
+// scoring is split across goroutines; below it the goroutine handoff costs
+// more than the dot products themselves
+const parallelScoreThreshold = 1 << 20
+
+// dot returns the inner product of a and b. The loop is unrolled by four with
+// independent accumulators so the compiler can keep the FMA pipeline busy, and
+// the up-front reslice of b lets it drop per-element bounds checks.
+// Callers must ensure len(b) >= len(a).
+func dot(a, b []float32) float32 {
+	b = b[:len(a)]
+
+	var s0, s1, s2, s3 float32
+	i := 0
+	for ; i <= len(a)-4; i += 4 {
+		s0 += a[i] * b[i]
+		s1 += a[i+1] * b[i+1]
+		s2 += a[i+2] * b[i+2]
+		s3 += a[i+3] * b[i+3]
+	}
+	for ; i < len(a); i++ {
+		s0 += a[i] * b[i]
+	}
+
+	return (s0 + s1) + (s2 + s3)
+}
+
+// normalize scales v in place to unit L2 norm. Zero vectors are left as is.
+func normalize(v []float32) {
+	norm := dot(v, v)
+	if norm <= 0 {
+		return
+	}
+	inv := float32(1.0 / math.Sqrt(float64(norm)))
+	for i := range v {
+		v[i] *= inv
+	}
+}
+
+// scoreRows computes the matrix-vector product of a row-major matrix with
+// query, writing one score per row into scores
+func scoreRows(matrix, query, scores []float32) {
+	dim := len(query)
+	forRows(len(scores), len(matrix), func(start, end int) {
+		for i := start; i < end; i++ {
+			scores[i] = dot(query, matrix[i*dim:(i+1)*dim])
+		}
+	})
+}
+
+// scoreRowsInt8 is scoreRows for an int8 matrix with per-row scales. Each
+// score is rescaled by both the row and the query scale.
+func scoreRowsInt8(matrix []int8, rowScales []float32, query []int8, queryScale float32, scores []float32) {
+	dim := len(query)
+	forRows(len(scores), len(matrix), func(start, end int) {
+		for i := start; i < end; i++ {
+			scores[i] = float32(dotInt8(query, matrix[i*dim:(i+1)*dim])) * queryScale * rowScales[i]
+		}
+	})
+}
+
+// forRows calls fn over [0, rows), split into contiguous ranges across
+// GOMAXPROCS goroutines when size reaches parallelScoreThreshold
+func forRows(rows, size int, fn func(start, end int)) {
+	workers := runtime.GOMAXPROCS(0)
+	if size < parallelScoreThreshold || workers < 2 {
+		fn(0, rows)
+		return
+	}
+
+	chunk := (rows + workers - 1) / workers
+	var wg sync.WaitGroup
+	for start := 0; start < rows; start += chunk {
+		end := min(start+chunk, rows)
+		wg.Add(1)
+		go func(start, end int) {
+			defer wg.Done()
+			fn(start, end)
+		}(start, end)
+	}
+	wg.Wait()
+}
+
+// quantizeInt8 writes v scaled into int8 range to dst and returns the scale
+// such that v[i] ~= float32(dst[i]) * scale. dst must be at least len(v) long.
+func quantizeInt8(v []float32, dst []int8) float32 {
+	dst = dst[:len(v)]
+
+	var maxAbs float32
+	for _, x := range v {
+		if x < 0 {
+			x = -x
+		}
+		if x > maxAbs {
+			maxAbs = x
+		}
+	}
+	if maxAbs == 0 {
+		for i := range dst {
+			dst[i] = 0
+		}
+		return 0
+	}
+
+	scale := maxAbs / 127
+	inv := 1 / scale
+	for i, x := range v {
+		dst[i] = int8(math.Round(float64(x * inv)))
+	}
+	return scale
+}
+
+// dotInt8 returns the inner product of two int8 vectors accumulated in int32,
+// unrolled the same way as dot. Callers must ensure len(b) >= len(a).
+func dotInt8(a, b []int8) int32 {
+	b = b[:len(a)]
+
+	var s0, s1, s2, s3 int32
+	i := 0
+	for ; i <= len(a)-4; i += 4 {
+		s0 += int32(a[i]) * int32(b[i])
+		s1 += int32(a[i+1]) * int32(b[i+1])
+		s2 += int32(a[i+2]) * int32(b[i+2])
+		s3 += int32(a[i+3]) * int32(b[i+3])
+	}
+	for ; i < len(a); i++ {
+		s0 += int32(a[i]) * int32(b[i])
+	}
+
+	return (s0 + s1) + (s2 + s3)
+}
+
+// topKIndices returns the indices of the k highest scores, best first, with
+// ties going to the lower index. It keeps a k-sized min-heap of the best rows
+// seen so far instead of sorting every score, so ranking costs O(n log k).
+func topKIndices(scores []float32, k int) []int {
+	k = min(k, len(scores))
+	if k <= 0 {
+		return nil
+	}
+
+	// worse reports whether row a ranks below row b
+	worse := func(a, b int) bool {
+		if scores[a] != scores[b] {
+			return scores[a] < scores[b]
+		}
+		return a > b
+	}
+
+	heap := make([]int, 0, k)
+	siftDown := func(i int) {
+		for {
+			least := i
+			if l := 2*i + 1; l < len(heap) && worse(heap[l], heap[least]) {
+				least = l
+			}
+			if r := 2*i + 2; r < len(heap) && worse(heap[r], heap[least]) {
+				least = r
+			}
+			if least == i {
+				return
+			}
+			heap[i], heap[least] = heap[least], heap[i]
+			i = least
+		}
+	}
+
+	for i := range scores {
+		if len(heap) < k {
+			heap = append(heap, i)
+			for j := len(heap) - 1; j > 0; {
+				parent := (j - 1) / 2
+				if !worse(heap[j], heap[parent]) {
+					break
+				}
+				heap[j], heap[parent] = heap[parent], heap[j]
+				j = parent
+			}
+			continue
+		}
+		if worse(heap[0], i) {
+			heap[0] = i
+			siftDown(0)
+		}
+	}
+
+	sort.Slice(heap, func(a, b int) bool {
+		return worse(heap[b], heap[a])
+	})
+	return heap
+}
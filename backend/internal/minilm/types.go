@@ -5,10 +5,38 @@ import (
 	"time"
 )
 
+// Supported similarity search quantization modes
+const (
+	QuantizationNone = "none"
+	QuantizationInt8 = "int8"
+)
+
 // Config holds embeddings configuration
 type Config struct {
 	ModelPath string
 	Dimension int
+	// BatchMaxSize caps how many concurrent single-text requests are
+	// embedded in one forward pass
+	BatchMaxSize int
+	// BatchMaxWait is how long the batcher waits for more requests once
+	// several are queued; a lone request runs immediately
+	BatchMaxWait time.Duration
+	// CacheSize is the number of embeddings kept in the LRU cache; 0 disables it
+	CacheSize int
+	// SearchQuantization selects the similarity search arithmetic
+	// (QuantizationNone or QuantizationInt8). It only affects how candidate
+	// embeddings are scored, not which model produces them; see QuantizedModel.
+	SearchQuantization string
+	// Lazy defers loading the model until it is first needed
+	Lazy bool
+	// Threads is the intra-op thread count for inference; 0 uses every CPU
+	Threads int
+	// QuantizedModel loads the int8 quantized model weights instead of the
+	// float32 ones. It only affects how embeddings are generated, not how
+	// they are scored; see SearchQuantization.
+	QuantizedModel bool
+	// MirrorDir is a local directory checked for model files before downloading
+	MirrorDir string
 }
 
 // ServiceInfo contains information about the embeddings service
@@ -45,6 +73,9 @@ type EmbeddingProvider interface {
 	// SearchSimilar finds similar embeddings
 	SearchSimilar(ctx context.Context, queryEmbedding []float32, candidateEmbeddings [][]float32, topK int) ([]int, []float32, error)
 
+	// SearchIndex finds similar embeddings in a prebuilt candidate index
+	SearchIndex(ctx context.Context, queryEmbedding []float32, index *CandidateIndex, topK int) ([]int, []float32, error)
+
 	// Shutdown gracefully shuts down the embeddings service
 	Shutdown(ctx context.Context) error
 }
\ No newline at end of file
@@ -2,9 +2,12 @@ package models
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"log"
+	"path/filepath"
 	"sync"
+	"time"
 
 	"alice-backend/internal/config"
 	"alice-backend/internal/minilm"
@@ -28,61 +31,116 @@ func NewManager(config *config.Config) *Manager {
 	}
 }
 
-// Initialize initializes all services based on configuration
+// Initialize initializes all services based on configuration. The enabled
+// services load independently, so they initialize concurrently and startup
+// takes as long as the slowest one rather than the sum of all three.
+// Services are published before they finish loading; until then they
+// report not ready.
 func (m *Manager) Initialize(ctx context.Context) error {
 	m.mu.Lock()
-	defer m.mu.Unlock()
 
 	log.Println("Initializing model manager...")
 
+	type service struct {
+		name string
+		init func(ctx context.Context) error
+		warm func(ctx context.Context) error
+	}
+	var services []service
+
 	// Initialize STT service if enabled
 	if m.config.Features.STT {
-		log.Println("Initializing STT service...")
 		sttConfig := &whisper.Config{
 			Language:       "en",
 			ModelPath:      m.config.Models.Whisper.Path,
 			SampleRate:     16000,
 			VoiceThreshold: 0.02,
+			Workers:        m.config.Models.Whisper.Workers,
+			Quantization:   m.config.Models.Whisper.Quantization,
+			BeamSize:       m.config.Models.Whisper.BeamSize,
+			Threads:        m.config.Models.Whisper.Threads,
+			Debug:          m.config.Server.DebugLog,
+			MirrorDir:      mirrorSubdir(m.config.Models.MirrorDir, "whisper"),
 		}
 
 		m.sttService = whisper.NewSTTService(sttConfig)
-		if err := m.sttService.Initialize(ctx); err != nil {
-			return fmt.Errorf("failed to initialize STT service: %w", err)
-		}
-		log.Println("STT service initialized")
+		services = append(services, service{"STT", m.sttService.Initialize, m.sttService.Warmup})
 	}
 
 	// Initialize TTS service if enabled
 	if m.config.Features.TTS {
-		log.Println("Initializing TTS service...")
 		ttsConfig := &piper.Config{
 			PiperPath: "", // Let ensurePiper set the correct OS-specific path
 			ModelPath: m.config.Models.Piper.Path,
 			Voice:     "en_US-amy-medium",
 			Speed:     1.0,
+			Debug:     m.config.Server.DebugLog,
+			Workers:   m.config.Models.Piper.Workers,
+			CacheSize: m.config.Models.Piper.CacheSize,
+			MirrorDir: mirrorSubdir(m.config.Models.MirrorDir, "piper"),
 		}
 
 		m.ttsService = piper.NewTTSService(ttsConfig)
-		if err := m.ttsService.Initialize(ctx); err != nil {
-			return fmt.Errorf("failed to initialize TTS service: %w", err)
-		}
-		log.Println("TTS service initialized")
+		services = append(services, service{"TTS", m.ttsService.Initialize, m.ttsService.Warmup})
 	}
 
 	// Initialize embeddings service if enabled
 	if m.config.Features.Embeddings {
-		log.Println("Initializing embeddings service...")
 		embeddingConfig := &minilm.Config{
-			ModelPath: m.config.Models.MiniLM.Path,
-			Dimension: 384,
+			ModelPath:          m.config.Models.MiniLM.Path,
+			Dimension:          384,
+			BatchMaxSize:       m.config.Models.MiniLM.BatchMaxSize,
+			BatchMaxWait:       m.config.Models.MiniLM.BatchMaxWait,
+			CacheSize:          m.config.Models.MiniLM.CacheSize,
+			SearchQuantization: m.config.Models.MiniLM.SearchQuantization,
+			Lazy:               m.config.Models.MiniLM.Lazy,
+			Threads:            m.config.Models.MiniLM.Threads,
+			QuantizedModel:     m.config.Models.MiniLM.QuantizedModel,
+			MirrorDir:          mirrorSubdir(m.config.Models.MirrorDir, "minilm"),
 		}
 
 		// Always use ONNX implementation with automatic model downloading
 		m.embeddingService = minilm.NewOnnxEmbeddingService(embeddingConfig)
-		if err := m.embeddingService.Initialize(ctx); err != nil {
-			return fmt.Errorf("failed to initialize embeddings service: %w", err)
+		if embeddingConfig.Lazy {
+			log.Println("Embeddings service will load on first use")
+		} else {
+			services = append(services, service{"embeddings", m.embeddingService.Initialize, m.embeddingService.Warmup})
 		}
-		log.Println("Embeddings service initialized")
+	}
+
+	// Loading can take minutes on first run while models download; the lock
+	// only covers publishing the services so getters never wait on it
+	m.mu.Unlock()
+
+	errs := make([]error, len(services))
+	var wg sync.WaitGroup
+	for i, svc := range services {
+		wg.Add(1)
+		go func(i int, svc service) {
+			defer wg.Done()
+			log.Printf("Initializing %s service...", svc.name)
+			if err := svc.init(ctx); err != nil {
+				errs[i] = fmt.Errorf("failed to initialize %s service: %w", svc.name, err)
+				return
+			}
+			log.Printf("%s service initialized", svc.name)
+
+			// A throwaway inference pays the first-run costs (binary and
+			// model file reads, runtime allocations) before a user does
+			if m.config.Features.Warmup {
+				start := time.Now()
+				if err := svc.warm(ctx); err != nil {
+					log.Printf("Warning: %s warmup failed: %v", svc.name, err)
+					return
+				}
+				log.Printf("%s service warmed up in %v", svc.name, time.Since(start))
+			}
+		}(i, svc)
+	}
+	wg.Wait()
+
+	if err := errors.Join(errs...); err != nil {
+		return err
 	}
 
 	log.Println("Model manager initialized successfully")
@@ -145,16 +203,40 @@ func (m *Manager) Shutdown(ctx context.Context) error {
 	return nil
 }
 
-// GetStatus returns the status of all services
-func (m *Manager) GetStatus() map[string]interface{} {
+// ServiceStatus reports which services are ready
+type ServiceStatus struct {
+	STT        bool
+	TTS        bool
+	Embeddings bool
+}
+
+// Status returns a snapshot of service readiness taken under a single lock
+func (m *Manager) Status() ServiceStatus {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
-	status := map[string]interface{}{
-		"stt":        m.sttService != nil && m.sttService.IsReady(),
-		"tts":        m.ttsService != nil && m.ttsService.IsReady(),
-		"embeddings": m.embeddingService != nil && m.embeddingService.IsReady(),
+	return ServiceStatus{
+		STT:        m.sttService != nil && m.sttService.IsReady(),
+		TTS:        m.ttsService != nil && m.ttsService.IsReady(),
+		Embeddings: m.embeddingService != nil && m.embeddingService.IsReady(),
+	}
+}
+
+// GetStatus returns the status of all services
+func (m *Manager) GetStatus() map[string]interface{} {
+	status := m.Status()
+	return map[string]interface{}{
+		"stt":        status.STT,
+		"tts":        status.TTS,
+		"embeddings": status.Embeddings,
 	}
+}
 
-	return status
+// mirrorSubdir returns the directory under the model mirror holding one
+// service's files, or "" when no mirror is configured
+func mirrorSubdir(mirrorDir, service string) string {
+	if mirrorDir == "" {
+		return ""
+	}
+	return filepath.Join(mirrorDir, service)
 }
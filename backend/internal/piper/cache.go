@@ -0,0 +1,86 @@
+package piper
+
+import (
+	"bytes"
+	"container/list"
+	"sync"
+)
+
+// audioCache is a fixed-size LRU of synthesized WAV audio keyed by voice and
+// normalized text, so phrases an assistant repeats skip piper entirely
+type audioCache struct {
+	mu       sync.Mutex
+	capacity int
+	order    *list.List
+	entries  map[audioKey]*list.Element
+}
+
+type audioKey struct {
+	voice string
+	text  string
+}
+
+type audioEntry struct {
+	key   audioKey
+	audio []byte
+}
+
+// newAudioCache returns a cache holding up to capacity clips, or nil if
+// capacity is not positive
+func newAudioCache(capacity int) *audioCache {
+	if capacity <= 0 {
+		return nil
+	}
+	return &audioCache{
+		capacity: capacity,
+		order:    list.New(),
+		entries:  make(map[audioKey]*list.Element, capacity),
+	}
+}
+
+// get returns the cached audio for text in voice. The result is shared and
+// must not be modified.
+func (c *audioCache) get(voice, text string) ([]byte, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.entries[audioKey{voice, text}]
+	if !ok {
+		return nil, false
+	}
+	c.order.MoveToFront(elem)
+	return elem.Value.(*audioEntry).audio, true
+}
+
+// put stores the audio for text in voice, evicting the least recently used
+// clip when full. The cache keeps its own copy trimmed to the clip's length,
+// so spare capacity of the synthesis buffer is not held for the clip's life.
+func (c *audioCache) put(voice, text string, audio []byte) {
+	key := audioKey{voice, text}
+	audio = bytes.Clone(audio)
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if elem, ok := c.entries[key]; ok {
+		elem.Value.(*audioEntry).audio = audio
+		c.order.MoveToFront(elem)
+		return
+	}
+
+	c.entries[key] = c.order.PushFront(&audioEntry{key: key, audio: audio})
+	if c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*audioEntry).key)
+	}
+}
+
+// clear drops every cached clip
+func (c *audioCache) clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.order.Init()
+	clear(c.entries)
+}
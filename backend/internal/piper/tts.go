@@ -3,8 +3,10 @@ package piper
 import (
 	"archive/tar"
 	"archive/zip"
+	"bytes"
 	"compress/gzip"
 	"context"
+	"errors"
 	"fmt"
 	"io"
 	"log"
@@ -16,28 +18,70 @@ import (
 	"runtime"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
+	"unicode"
+	"unicode/utf8"
 
+	"alice-backend/internal/downloader"
 	"alice-backend/internal/embedded"
+	"alice-backend/internal/wav"
 )
 
+// ErrNotReady is returned by synthesis calls made before the service has
+// finished initializing
+var ErrNotReady = errors.New("TTS service is not ready")
+
 // TTSService provides text-to-speech functionality using Piper
 type TTSService struct {
+	// initMu serializes initialization; mu only guards voices, info and the
+	// default voice so voice listings are not blocked while Piper is fetched
+	initMu       sync.Mutex
 	mu           sync.RWMutex
-	ready        bool
+	ready        atomic.Bool
 	voices       map[string]*Voice
 	config       *Config
 	info         *ServiceInfo
 	defaultVoice string
 	assetManager *embedded.AssetManager
+	envOnce      sync.Once
+	env          []string
+	workers      chan struct{}
+	cache        *audioCache
+	voiceConfigs voiceConfigCache
+
+	// voiceLocks holds one lock per voice so concurrent requests for the
+	// same missing voice download it once, while different voices download
+	// in parallel. installedVoices records voices whose files have been
+	// found on disk, so later requests skip the file checks. failedVoices
+	// records when a voice's download last failed, so requests within
+	// voiceRetryInterval fail fast instead of retrying the download.
+	voiceLocksMu    sync.Mutex
+	voiceLocks      map[string]*sync.Mutex
+	installedVoices map[string]bool
+	failedVoices    map[string]time.Time
 }
 
+// voiceRetryInterval is how long after a failed voice download further
+// requests for that voice fail without attempting the download again
+const voiceRetryInterval = 5 * time.Minute
+
 // Config holds TTS configuration
 type Config struct {
 	PiperPath string
 	ModelPath string
 	Voice     string
 	Speed     float32
+	// Debug enables per-synthesis diagnostic logging
+	Debug bool
+	// Workers is the number of piper processes allowed to run at once
+	Workers int
+	// CacheSize is the number of synthesized clips kept in the LRU cache;
+	// 0 disables it
+	CacheSize int
+	// MirrorDir is a local directory checked for voice models before
+	// downloading
+	MirrorDir string
 }
 
 // Voice represents a TTS voice
@@ -63,6 +107,12 @@ type ServiceInfo struct {
 
 // NewTTSService creates a new TTS service
 func NewTTSService(config *Config) *TTSService {
+	// Each piper process already runs its model across several threads, so
+	// by default syntheses take turns rather than contend for the cores
+	if config.Workers <= 0 {
+		config.Workers = 1
+	}
+
 	baseDir := embedded.GetProductionBaseDirectory()
 	assetManager := embedded.NewAssetManager(baseDir)
 
@@ -71,6 +121,8 @@ func NewTTSService(config *Config) *TTSService {
 		voices:       make(map[string]*Voice),
 		defaultVoice: "en_US-amy-medium",
 		assetManager: assetManager,
+		workers:      make(chan struct{}, config.Workers),
+		cache:        newAudioCache(config.CacheSize),
 		info: &ServiceInfo{
 			Name:        "Piper TTS",
 			Version:     "1.0.0",
@@ -84,8 +136,8 @@ func NewTTSService(config *Config) *TTSService {
 }
 
 func (s *TTSService) Initialize(ctx context.Context) error {
-	s.mu.Lock()
-	defer s.mu.Unlock()
+	s.initMu.Lock()
+	defer s.initMu.Unlock()
 
 	log.Println("Initializing Piper TTS service...")
 
@@ -102,16 +154,18 @@ func (s *TTSService) Initialize(ctx context.Context) error {
 		log.Printf("Warning: %v - TTS will use fallback audio", err)
 	}
 
+	s.mu.Lock()
 	s.loadVoices()
-
-	s.ready = true
+	s.ready.Store(true)
 	s.info.Status = "ready"
 	s.info.LastUpdated = time.Now()
+	s.mu.Unlock()
 
 	log.Println("Piper TTS service initialized successfully")
 	return nil
 }
 
+// loadVoices populates the voice catalog. Callers must hold s.mu.
 func (s *TTSService) loadVoices() {
 	voices := []*Voice{
 		{
@@ -315,9 +369,7 @@ func (s *TTSService) loadVoices() {
 }
 
 func (s *TTSService) IsReady() bool {
-	s.mu.RLock()
-	defer s.mu.RUnlock()
-	return s.ready
+	return s.ready.Load()
 }
 
 func (s *TTSService) GetVoices() []*Voice {
@@ -342,45 +394,23 @@ func (s *TTSService) GetInfo() *ServiceInfo {
 
 func (s *TTSService) Synthesize(ctx context.Context, text string, voice string) ([]byte, error) {
 	if !s.IsReady() {
-		return nil, fmt.Errorf("TTS service is not ready")
+		return nil, ErrNotReady
 	}
 
+	text = normalizeText(text)
 	if text == "" {
 		return nil, fmt.Errorf("text cannot be empty")
 	}
 
-	if voice == "" {
-		voice = s.config.Voice
-		if voice == "" {
-			voice = "en_US-amy-medium" // Default voice
-		}
-	}
-
-	s.mu.RLock()
-	selectedVoice, exists := s.voices[voice]
-
+	voice, selectedVoice, exists := s.resolveVoice(voice)
 	if !exists {
-		log.Printf("Voice '%s' not found, trying default voices...", voice)
-		if fallbackVoice, exists := s.voices[s.defaultVoice]; exists {
-			selectedVoice = fallbackVoice
-			voice = s.defaultVoice
-			log.Printf("Using default fallback voice: %s", s.defaultVoice)
-		} else {
-			for _, fallbackVoice := range s.voices {
-				if fallbackVoice.Language == "en-US" || fallbackVoice.Language == "en-GB" {
-					selectedVoice = fallbackVoice
-					voice = fallbackVoice.Name
-					log.Printf("Using fallback voice: %s", fallbackVoice.Name)
-					break
-				}
-			}
-		}
-		exists = selectedVoice != nil
+		return nil, fmt.Errorf("no voices available")
 	}
-	s.mu.RUnlock()
 
-	if !exists {
-		return nil, fmt.Errorf("no voices available")
+	if s.cache != nil {
+		if audioData, ok := s.cache.get(voice, text); ok {
+			return audioData, nil
+		}
 	}
 
 	if err := s.ensureVoiceModel(ctx, voice); err != nil {
@@ -389,15 +419,192 @@ func (s *TTSService) Synthesize(ctx context.Context, text string, voice string)
 		return s.generatePlaceholderWAV(text, selectedVoice), nil
 	}
 
-	audioData, err := s.synthesizeWithPiper(ctx, text, voice)
+	audioData, err := s.synthesizeWithPiper(ctx, text, voice, s.sampleRate(voice, selectedVoice))
 	if err != nil {
 		log.Printf("Failed to synthesize with Piper: %v", err)
+		// The files may have been removed; check them again next time
+		s.setVoiceInstalled(voice, false)
 		return s.generatePlaceholderWAV(text, selectedVoice), nil
 	}
 
+	if s.cache != nil {
+		s.cache.put(voice, text, audioData)
+	}
 	return audioData, nil
 }
 
+// Warmup synthesizes a short phrase in the default voice, fetching the voice
+// model if needed, so the first real request starts from a warm page cache.
+// The result bypasses the audio cache.
+func (s *TTSService) Warmup(ctx context.Context) error {
+	if !s.IsReady() {
+		return ErrNotReady
+	}
+
+	voice, selectedVoice, exists := s.resolveVoice("")
+	if !exists {
+		return fmt.Errorf("no voices available")
+	}
+	if err := s.ensureVoiceModel(ctx, voice); err != nil {
+		return fmt.Errorf("failed to ensure voice model %s: %w", voice, err)
+	}
+
+	_, err := s.synthesizeWithPiper(ctx, "Ready.", voice, s.sampleRate(voice, selectedVoice))
+	return err
+}
+
+// SynthesizeStream synthesizes text and writes a WAV stream to w while Piper is
+// still producing audio. The header declares an unknown data length, so
+// playback can start before synthesis finishes. The header is held back until
+// Piper produces its first audio, so nothing is written to w if synthesis
+// fails before producing any.
+func (s *TTSService) SynthesizeStream(ctx context.Context, text string, voice string, w io.Writer) error {
+	if !s.IsReady() {
+		return ErrNotReady
+	}
+
+	text = normalizeText(text)
+	if text == "" {
+		return fmt.Errorf("text cannot be empty")
+	}
+
+	voice, selectedVoice, exists := s.resolveVoice(voice)
+	if !exists {
+		return fmt.Errorf("no voices available")
+	}
+
+	if err := s.ensureVoiceModel(ctx, voice); err != nil {
+		return fmt.Errorf("failed to ensure voice model %s: %w", voice, err)
+	}
+
+	release, err := s.acquireWorker(ctx)
+	if err != nil {
+		return err
+	}
+	defer release()
+
+	cmd := s.piperCommand(ctx, voice, "--output-raw")
+	cmd.Stdin = strings.NewReader(text)
+
+	var stderr bytes.Buffer
+	cmd.Stderr = &stderr
+
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return fmt.Errorf("failed to open piper output: %w", err)
+	}
+
+	if err := cmd.Start(); err != nil {
+		return fmt.Errorf("failed to run piper: %w", err)
+	}
+
+	// The first chunk of audio is read in behind the header and both go out
+	// in a single write
+	first := wav.AppendHeader(make([]byte, 0, streamFirstChunkSize), s.sampleRate(voice, selectedVoice), wav.UnknownSize)
+	n, err := io.ReadAtLeast(stdout, first[wav.HeaderSize:cap(first)], 1)
+	if err == nil {
+		_, err = w.Write(first[:wav.HeaderSize+n])
+	}
+	if err == nil {
+		_, err = io.Copy(w, stdout)
+	}
+	if err != nil {
+		// Drain so piper can exit instead of blocking on a full pipe
+		io.Copy(io.Discard, stdout)
+	}
+
+	if waitErr := cmd.Wait(); waitErr != nil {
+		s.setVoiceInstalled(voice, false)
+		return fmt.Errorf("piper failed: %w: %s", waitErr, strings.TrimSpace(stderr.String()))
+	}
+	if n == 0 {
+		return fmt.Errorf("piper produced no audio: %s", strings.TrimSpace(stderr.String()))
+	}
+	return err
+}
+
+// streamFirstChunkSize is the size of the buffer holding the WAV header and
+// the first audio read from Piper in SynthesizeStream
+const streamFirstChunkSize = 32 << 10
+
+// normalizeText prepares text for piper in a single pass: runs of whitespace,
+// including newlines that piper would otherwise treat as separate utterances,
+// collapse to one space, control characters are dropped and the ends are
+// trimmed. Text that is already clean is returned without copying.
+func normalizeText(text string) string {
+	clean := true
+	prevSpace := true
+	for _, r := range text {
+		if r == ' ' {
+			if prevSpace {
+				clean = false
+				break
+			}
+			prevSpace = true
+			continue
+		}
+		if unicode.IsSpace(r) || unicode.IsControl(r) || r == utf8.RuneError {
+			clean = false
+			break
+		}
+		prevSpace = false
+	}
+	if clean && !prevSpace {
+		return text
+	}
+
+	var b strings.Builder
+	b.Grow(len(text))
+	pendingSpace := false
+	for _, r := range text {
+		switch {
+		case unicode.IsSpace(r):
+			pendingSpace = b.Len() > 0
+		case unicode.IsControl(r) || r == utf8.RuneError:
+		default:
+			if pendingSpace {
+				b.WriteByte(' ')
+				pendingSpace = false
+			}
+			b.WriteRune(r)
+		}
+	}
+	return b.String()
+}
+
+// resolveVoice returns the requested voice, falling back to the default
+// voice and then to any English voice when it is unknown
+func (s *TTSService) resolveVoice(voice string) (string, *Voice, bool) {
+	if voice == "" {
+		voice = s.config.Voice
+		if voice == "" {
+			voice = "en_US-amy-medium" // Default voice
+		}
+	}
+
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+
+	if selectedVoice, exists := s.voices[voice]; exists {
+		return voice, selectedVoice, true
+	}
+
+	log.Printf("Voice '%s' not found, trying default voices...", voice)
+	if fallbackVoice, exists := s.voices[s.defaultVoice]; exists {
+		log.Printf("Using default fallback voice: %s", s.defaultVoice)
+		return s.defaultVoice, fallbackVoice, true
+	}
+
+	for _, fallbackVoice := range s.voices {
+		if fallbackVoice.Language == "en-US" || fallbackVoice.Language == "en-GB" {
+			log.Printf("Using fallback voice: %s", fallbackVoice.Name)
+			return fallbackVoice.Name, fallbackVoice, true
+		}
+	}
+
+	return voice, nil, false
+}
+
 func (s *TTSService) generatePlaceholderWAV(text string, voice *Voice) []byte {
 
 	const (
@@ -415,49 +622,13 @@ func (s *TTSService) generatePlaceholderWAV(text string, voice *Voice) []byte {
 
 	numSamples := int(sampleRate * textDuration)
 
-	wav := make([]byte, 44+numSamples*2)
-
-	copy(wav[0:4], []byte("RIFF"))
-	fileSize := uint32(44 + numSamples*2 - 8)
-	wav[4] = byte(fileSize & 0xFF)
-	wav[5] = byte((fileSize >> 8) & 0xFF)
-	wav[6] = byte((fileSize >> 16) & 0xFF)
-	wav[7] = byte((fileSize >> 24) & 0xFF)
-
-	copy(wav[8:12], []byte("WAVE"))
-
-	copy(wav[12:16], []byte("fmt "))
-	wav[16] = 16
-	wav[20] = 1
-	wav[22] = 1
-
-	wav[24] = byte(sampleRate & 0xFF)
-	wav[25] = byte((sampleRate >> 8) & 0xFF)
-	wav[26] = byte((sampleRate >> 16) & 0xFF)
-	wav[27] = byte((sampleRate >> 24) & 0xFF)
-
-	byteRate := uint32(sampleRate * 2)
-	wav[28] = byte(byteRate & 0xFF)
-	wav[29] = byte((byteRate >> 8) & 0xFF)
-	wav[30] = byte((byteRate >> 16) & 0xFF)
-	wav[31] = byte((byteRate >> 24) & 0xFF)
-
-	wav[32] = 2
-
-	wav[34] = 16
-
-	copy(wav[36:40], []byte("data"))
-
-	dataSize := uint32(numSamples * 2)
-	wav[40] = byte(dataSize & 0xFF)
-	wav[41] = byte((dataSize >> 8) & 0xFF)
-	wav[42] = byte((dataSize >> 16) & 0xFF)
-	wav[43] = byte((dataSize >> 24) & 0xFF)
+	audio := wav.AppendHeader(make([]byte, 0, wav.HeaderSize+numSamples*2), sampleRate, uint32(numSamples*2))
+	audio = audio[:wav.HeaderSize+numSamples*2]
 
-	s.generateSpeechLikeAudio(wav[44:], numSamples, text, voice)
+	s.generateSpeechLikeAudio(audio[wav.HeaderSize:], numSamples, text, voice)
 
 	log.Printf("Generated %d samples (%.2f seconds) of audio for text: %s", numSamples, textDuration, text[:min(50, len(text))])
-	return wav
+	return audio
 }
 
 func (s *TTSService) generateSpeechLikeAudio(buffer []byte, numSamples int, text string, voice *Voice) {
@@ -606,11 +777,16 @@ downloadPiper:
 }
 
 func (s *TTSService) ensureVoiceModel(ctx context.Context, voice string) error {
-	modelDir := "models/piper"
-	if s.config.ModelPath != "" {
-		modelDir = s.config.ModelPath
+	if s.voiceInstalled(voice) {
+		return nil
 	}
 
+	lock := s.voiceLock(voice)
+	lock.Lock()
+	defer lock.Unlock()
+
+	modelDir := s.voiceModelDir()
+
 	if err := os.MkdirAll(modelDir, 0755); err != nil {
 		return fmt.Errorf("failed to create models directory: %w", err)
 	}
@@ -629,13 +805,19 @@ func (s *TTSService) ensureVoiceModel(ctx context.Context, voice string) error {
 
 	if _, err := os.Stat(modelFile); err == nil {
 		if _, err := os.Stat(configFile); err == nil {
+			s.setVoiceInstalled(voice, true)
 			return nil
 		}
 	}
 
+	if failedAt, ok := s.voiceFailedAt(voice); ok && time.Since(failedAt) < voiceRetryInterval {
+		return fmt.Errorf("voice model %s download failed recently, retrying in %s", voice, (voiceRetryInterval - time.Since(failedAt)).Round(time.Second))
+	}
+
 	log.Printf("Voice model %s not found, attempting to download...", voice)
 
 	if err := s.downloadVoiceModel(voice, modelDir); err != nil {
+		s.setVoiceFailed(voice, true)
 		log.Printf("Failed to download voice model: %v", err)
 		log.Printf("Please download manually from: https://huggingface.co/rhasspy/piper-voices/tree/main")
 		log.Printf("Place files at: %s and %s", modelFile, configFile)
@@ -643,57 +825,180 @@ func (s *TTSService) ensureVoiceModel(ctx context.Context, voice string) error {
 	}
 
 	log.Printf("Voice model %s downloaded successfully", voice)
+	s.setVoiceFailed(voice, false)
+	s.setVoiceInstalled(voice, true)
 	return nil
 }
 
-func (s *TTSService) synthesizeWithPiper(ctx context.Context, text, voice string) ([]byte, error) {
-	modelDir := "models/piper"
-	if s.config.ModelPath != "" {
-		modelDir = s.config.ModelPath
-	}
+// voiceLock returns the lock serializing model setup for voice
+func (s *TTSService) voiceLock(voice string) *sync.Mutex {
+	s.voiceLocksMu.Lock()
+	defer s.voiceLocksMu.Unlock()
 
-	modelFile := filepath.Join(modelDir, voice+".onnx")
+	if s.voiceLocks == nil {
+		s.voiceLocks = make(map[string]*sync.Mutex)
+	}
+	lock, ok := s.voiceLocks[voice]
+	if !ok {
+		lock = &sync.Mutex{}
+		s.voiceLocks[voice] = lock
+	}
+	return lock
+}
 
-	tmpDir := os.TempDir()
-	inputFile := filepath.Join(tmpDir, fmt.Sprintf("piper_input_%d.txt", time.Now().UnixNano()))
-	outputFile := filepath.Join(tmpDir, fmt.Sprintf("piper_output_%d.wav", time.Now().UnixNano()))
+// voiceInstalled reports whether voice's files were already found on disk
+func (s *TTSService) voiceInstalled(voice string) bool {
+	s.voiceLocksMu.Lock()
+	defer s.voiceLocksMu.Unlock()
+	return s.installedVoices[voice]
+}
 
-	defer os.Remove(inputFile)
-	defer os.Remove(outputFile)
+// setVoiceInstalled records whether voice's files are known to be on disk
+func (s *TTSService) setVoiceInstalled(voice string, installed bool) {
+	s.voiceLocksMu.Lock()
+	defer s.voiceLocksMu.Unlock()
 
-	if err := os.WriteFile(inputFile, []byte(text), 0644); err != nil {
-		return nil, fmt.Errorf("failed to write input file: %w", err)
+	if !installed {
+		delete(s.installedVoices, voice)
+		return
+	}
+	if s.installedVoices == nil {
+		s.installedVoices = make(map[string]bool)
 	}
+	s.installedVoices[voice] = true
+}
+
+// voiceFailedAt returns when voice's download last failed, if it has
+func (s *TTSService) voiceFailedAt(voice string) (time.Time, bool) {
+	s.voiceLocksMu.Lock()
+	defer s.voiceLocksMu.Unlock()
+	failedAt, ok := s.failedVoices[voice]
+	return failedAt, ok
+}
 
-	args := []string{
-		"--model", modelFile,
-		"--output-file", outputFile,
+// setVoiceFailed records or clears a failed download of voice
+func (s *TTSService) setVoiceFailed(voice string, failed bool) {
+	s.voiceLocksMu.Lock()
+	defer s.voiceLocksMu.Unlock()
+
+	if !failed {
+		delete(s.failedVoices, voice)
+		return
+	}
+	if s.failedVoices == nil {
+		s.failedVoices = make(map[string]time.Time)
 	}
+	s.failedVoices[voice] = time.Now()
+}
 
-	if s.config.Speed > 0 && s.config.Speed != 1.0 {
-		args = append(args, "--length_scale", fmt.Sprintf("%.2f", 1.0/s.config.Speed))
+// maxAudioBufferHint bounds the output buffer synthesizeWithPiper reserves
+// before piper runs, about 95 seconds of 16-bit audio at 22.05kHz
+const maxAudioBufferHint = 4 << 20
+
+// synthesizeWithPiper runs piper over text and returns the audio as a WAV
+// file. Piper writes raw PCM straight into the response buffer behind space
+// reserved for the header, so there is no temp file and no extra copy.
+func (s *TTSService) synthesizeWithPiper(ctx context.Context, text, voice string, sampleRate int) ([]byte, error) {
+	release, err := s.acquireWorker(ctx)
+	if err != nil {
+		return nil, err
 	}
+	defer release()
 
-	cmd := exec.CommandContext(ctx, s.config.PiperPath, args...)
+	cmd := s.piperCommand(ctx, voice, "--output-raw")
 	cmd.Stdin = strings.NewReader(text)
 
-	espeakDataPath := filepath.Join(filepath.Dir(s.config.PiperPath), "espeak-ng-data")
-	cmd.Env = append(os.Environ(), "ESPEAK_DATA_PATH="+espeakDataPath)
+	// Roughly a second of audio per 15 characters of text, capped so long
+	// input does not reserve memory up front; the buffer grows past the hint
+	hint := min(len(text)*sampleRate*2/15, maxAudioBufferHint)
+	out := bytes.NewBuffer(make([]byte, wav.HeaderSize, wav.HeaderSize+hint))
+	var stderr bytes.Buffer
+	cmd.Stdout = out
+	cmd.Stderr = &stderr
 
-	_, err := cmd.CombinedOutput()
-	if err != nil {
-		return nil, fmt.Errorf("failed to run piper: %w", err)
+	if err := cmd.Run(); err != nil {
+		return nil, fmt.Errorf("failed to run piper: %w: %s", err, strings.TrimSpace(stderr.String()))
 	}
 
-	audioData, err := os.ReadFile(outputFile)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read output file: %w", err)
-	}
+	audioData := out.Bytes()
+	wav.AppendHeader(audioData[:0], sampleRate, uint32(len(audioData)-wav.HeaderSize))
 
-	log.Printf("Piper synthesis complete: %d bytes", len(audioData))
+	s.debugf("Piper synthesis complete: %d bytes", len(audioData))
 	return audioData, nil
 }
 
+// acquireWorker waits for a free piper slot. The returned function frees it.
+func (s *TTSService) acquireWorker(ctx context.Context) (func(), error) {
+	select {
+	case s.workers <- struct{}{}:
+		return func() { <-s.workers }, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+// debugf logs only when debug logging is enabled
+func (s *TTSService) debugf(format string, args ...interface{}) {
+	if s.config.Debug {
+		log.Printf(format, args...)
+	}
+}
+
+// voiceSampleRate returns the output rate of voice, which Piper voices
+// default to when the catalog does not say
+func voiceSampleRate(voice *Voice) int {
+	if voice.SampleRate == 0 {
+		return 22050
+	}
+	return voice.SampleRate
+}
+
+// sampleRate returns the output rate piper will produce for voice, as
+// declared by the voice's own config, falling back to the catalog entry
+func (s *TTSService) sampleRate(voice string, selectedVoice *Voice) int {
+	configPath := filepath.Join(s.voiceModelDir(), voice+".onnx.json")
+	if rate, ok := s.voiceConfigs.sampleRate(configPath); ok {
+		return rate
+	}
+	return voiceSampleRate(selectedVoice)
+}
+
+// voiceModelDir returns the directory piper voice models are read from
+func (s *TTSService) voiceModelDir() string {
+	if s.config.ModelPath != "" {
+		return s.config.ModelPath
+	}
+	return "models/piper"
+}
+
+// piperCommand builds a piper invocation for voice with the given output arguments
+func (s *TTSService) piperCommand(ctx context.Context, voice string, outputArgs ...string) *exec.Cmd {
+	args := []string{"--model", filepath.Join(s.voiceModelDir(), voice+".onnx")}
+	args = append(args, outputArgs...)
+
+	if s.config.Speed > 0 && s.config.Speed != 1.0 {
+		args = append(args, "--length_scale", fmt.Sprintf("%.2f", 1.0/s.config.Speed))
+	}
+
+	cmd := exec.CommandContext(ctx, s.config.PiperPath, args...)
+
+	cmd.Env = s.piperEnv()
+	return cmd
+}
+
+// piperEnv returns the environment for piper processes: the backend's own
+// plus ESPEAK_DATA_PATH next to the binary. It is built once on first use,
+// after initialization has settled the binary path, and shared read-only
+// by every invocation.
+func (s *TTSService) piperEnv() []string {
+	s.envOnce.Do(func() {
+		espeakDataPath := filepath.Join(filepath.Dir(s.config.PiperPath), "espeak-ng-data")
+		env := os.Environ()
+		s.env = append(env[:len(env):len(env)], "ESPEAK_DATA_PATH="+espeakDataPath)
+	})
+	return s.env
+}
+
 func (s *TTSService) downloadPiperBinary() error {
 	var downloadURLs []string
 	var fileName string
@@ -1090,55 +1395,58 @@ func (s *TTSService) extractSingleFileFromTar(tarReader *tar.Reader, outputPath
 	return nil
 }
 
-func (s *TTSService) downloadVoiceModel(voiceName, modelDir string) error {
-	baseURL := "https://huggingface.co/rhasspy/piper-voices/resolve/main"
+// voiceMapping locates each catalog voice in the rhasspy/piper-voices
+// repository. It is built once at package initialization rather than on
+// every voice download.
+var voiceMapping = map[string]struct {
+	lang    string
+	voice   string
+	quality string
+}{
+	"en_US-amy-medium":        {"en/en_US", "amy", "medium"},
+	"en_US-lessac-medium":     {"en/en_US", "lessac", "medium"},
+	"en_US-hfc_female-medium": {"en/en_US", "hfc_female", "medium"},
+	"en_US-kristin-medium":    {"en/en_US", "kristin", "medium"},
+	"en_GB-alba-medium":       {"en/en_GB", "alba", "medium"},
 
-	voiceMapping := map[string]struct {
-		lang    string
-		voice   string
-		quality string
-	}{
-		"en_US-amy-medium":        {"en/en_US", "amy", "medium"},
-		"en_US-lessac-medium":     {"en/en_US", "lessac", "medium"},
-		"en_US-hfc_female-medium": {"en/en_US", "hfc_female", "medium"},
-		"en_US-kristin-medium":    {"en/en_US", "kristin", "medium"},
-		"en_GB-alba-medium":       {"en/en_GB", "alba", "medium"},
+	"es_ES-carme-medium":  {"es/es_ES", "carme", "medium"},
+	"es_MX-teresa-medium": {"es/es_MX", "teresa", "medium"},
 
-		"es_ES-carme-medium":  {"es/es_ES", "carme", "medium"},
-		"es_MX-teresa-medium": {"es/es_MX", "teresa", "medium"},
+	"fr_FR-siwis-medium": {"fr/fr_FR", "siwis", "medium"},
 
-		"fr_FR-siwis-medium": {"fr/fr_FR", "siwis", "medium"},
+	"de_DE-eva_k-x_low": {"de/de_DE", "eva_k", "x_low"},
 
-		"de_DE-eva_k-x_low": {"de/de_DE", "eva_k", "x_low"},
+	"it_IT-paola-medium": {"it/it_IT", "paola", "medium"},
 
-		"it_IT-paola-medium": {"it/it_IT", "paola", "medium"},
+	"pt_BR-lais-medium": {"pt/pt_BR", "lais", "medium"},
 
-		"pt_BR-lais-medium": {"pt/pt_BR", "lais", "medium"},
+	"ru_RU-irina-medium": {"ru/ru_RU", "irina", "medium"},
 
-		"ru_RU-irina-medium": {"ru/ru_RU", "irina", "medium"},
+	"zh_CN-huayan-medium": {"zh/zh_CN", "huayan", "medium"},
 
-		"zh_CN-huayan-medium": {"zh/zh_CN", "huayan", "medium"},
+	"ja_JP-qmu_amaryllis-medium": {"ja/ja_JP", "qmu_amaryllis", "medium"},
 
-		"ja_JP-qmu_amaryllis-medium": {"ja/ja_JP", "qmu_amaryllis", "medium"},
+	"nl_NL-mls_5809-low": {"nl/nl_NL", "mls_5809", "low"},
 
-		"nl_NL-mls_5809-low": {"nl/nl_NL", "mls_5809", "low"},
+	"no_NO-talesyntese-medium": {"no/no_NO", "talesyntese", "medium"},
 
-		"no_NO-talesyntese-medium": {"no/no_NO", "talesyntese", "medium"},
+	"sv_SE-nst-medium": {"sv/sv_SE", "nst", "medium"},
 
-		"sv_SE-nst-medium": {"sv/sv_SE", "nst", "medium"},
+	"da_DK-talesyntese-medium": {"da/da_DK", "talesyntese", "medium"},
 
-		"da_DK-talesyntese-medium": {"da/da_DK", "talesyntese", "medium"},
+	"fi_FI-anna-medium": {"fi/fi_FI", "anna", "medium"},
 
-		"fi_FI-anna-medium": {"fi/fi_FI", "anna", "medium"},
+	"pl_PL-mls_6892-low": {"pl/pl_PL", "mls_6892", "low"},
 
-		"pl_PL-mls_6892-low": {"pl/pl_PL", "mls_6892", "low"},
+	"uk_UA-ukrainian_tts-medium": {"uk/uk_UA", "ukrainian_tts", "medium"},
 
-		"uk_UA-ukrainian_tts-medium": {"uk/uk_UA", "ukrainian_tts", "medium"},
+	"hi_IN-female-medium": {"hi/hi_IN", "female", "medium"},
 
-		"hi_IN-female-medium": {"hi/hi_IN", "female", "medium"},
+	"ar_JO-amina-medium": {"ar/ar_JO", "amina", "medium"},
+}
 
-		"ar_JO-amina-medium": {"ar/ar_JO", "amina", "medium"},
-	}
+func (s *TTSService) downloadVoiceModel(voiceName, modelDir string) error {
+	baseURL := "https://huggingface.co/rhasspy/piper-voices/resolve/main"
 
 	voiceInfo, exists := voiceMapping[voiceName]
 	if !exists {
@@ -1151,16 +1459,33 @@ func (s *TTSService) downloadVoiceModel(voiceName, modelDir string) error {
 	onnxFile := filepath.Join(modelDir, voiceName+".onnx")
 	jsonFile := filepath.Join(modelDir, voiceName+".onnx.json")
 
-	log.Printf("Downloading voice model: %s", onnxURL)
-	if err := s.downloadFileWithRetry(onnxURL, onnxFile, 3); err != nil {
-		return fmt.Errorf("failed to download .onnx file: %w", err)
+	if downloader.CopyFromMirror(s.config.MirrorDir, voiceName+".onnx", onnxFile) &&
+		downloader.CopyFromMirror(s.config.MirrorDir, voiceName+".onnx.json", jsonFile) {
+		return nil
 	}
 
-	log.Printf("Downloading voice config: %s", jsonURL)
-	if err := s.downloadFileWithRetry(jsonURL, jsonFile, 3); err != nil {
-		return fmt.Errorf("failed to download .onnx.json file: %w", err)
+	// The small config downloads alongside the model instead of after it
+	var onnxErr, jsonErr error
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		log.Printf("Downloading voice model: %s", onnxURL)
+		onnxErr = s.downloadFileWithRetry(onnxURL, onnxFile, 3)
+	}()
+	go func() {
+		defer wg.Done()
+		log.Printf("Downloading voice config: %s", jsonURL)
+		jsonErr = s.downloadFileWithRetry(jsonURL, jsonFile, 3)
+	}()
+	wg.Wait()
+
+	if onnxErr != nil {
+		return fmt.Errorf("failed to download .onnx file: %w", onnxErr)
+	}
+	if jsonErr != nil {
+		return fmt.Errorf("failed to download .onnx.json file: %w", jsonErr)
 	}
-
 	return nil
 }
 
@@ -1168,9 +1493,18 @@ func (s *TTSService) Shutdown(ctx context.Context) error {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	s.ready = false
+	s.ready.Store(false)
 	s.info.Status = "stopped"
 	s.info.LastUpdated = time.Now()
 
+	if s.cache != nil {
+		s.cache.clear()
+	}
+
+	s.voiceLocksMu.Lock()
+	s.installedVoices = nil
+	s.failedVoices = nil
+	s.voiceLocksMu.Unlock()
+
 	return nil
 }
@@ -0,0 +1,68 @@
+package piper
+
+import (
+	"encoding/json"
+	"os"
+	"sync"
+	"time"
+)
+
+// voiceConfigCache holds the parts of each voice's .onnx.json config the
+// service needs, keyed by path and revalidated against the file's size and
+// modification time, so a synthesis costs one stat instead of a read and a
+// JSON parse of the whole config
+type voiceConfigCache struct {
+	mu      sync.Mutex
+	entries map[string]voiceConfigEntry
+}
+
+type voiceConfigEntry struct {
+	modTime    time.Time
+	size       int64
+	sampleRate int
+}
+
+// voiceConfigFile is the subset of a piper voice config read by the service
+type voiceConfigFile struct {
+	Audio struct {
+		SampleRate int `json:"sample_rate"`
+	} `json:"audio"`
+}
+
+// sampleRate returns the output sample rate declared by the voice config at
+// path, or false if the config is missing or does not declare one
+func (c *voiceConfigCache) sampleRate(path string) (int, bool) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return 0, false
+	}
+
+	c.mu.Lock()
+	entry, ok := c.entries[path]
+	c.mu.Unlock()
+	if ok && entry.size == info.Size() && entry.modTime.Equal(info.ModTime()) {
+		return entry.sampleRate, entry.sampleRate > 0
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return 0, false
+	}
+	var cfg voiceConfigFile
+	if err := json.Unmarshal(data, &cfg); err != nil {
+		return 0, false
+	}
+
+	c.mu.Lock()
+	if c.entries == nil {
+		c.entries = make(map[string]voiceConfigEntry)
+	}
+	c.entries[path] = voiceConfigEntry{
+		modTime:    info.ModTime(),
+		size:       info.Size(),
+		sampleRate: cfg.Audio.SampleRate,
+	}
+	c.mu.Unlock()
+
+	return cfg.Audio.SampleRate, cfg.Audio.SampleRate > 0
+}
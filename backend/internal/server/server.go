@@ -17,12 +17,14 @@ import (
 type Server struct {
 	httpServer *http.Server
 	handler    *api.Handler
+	accessLog  bool
 }
 
 // NewServer creates a new HTTP server
 func NewServer(config *config.Config, handler *api.Handler) *Server {
 	return &Server{
-		handler: handler,
+		handler:   handler,
+		accessLog: config.Server.AccessLog,
 	}
 }
 
@@ -30,8 +32,11 @@ func NewServer(config *config.Config, handler *api.Handler) *Server {
 func (s *Server) Start(port string) error {
 	router := mux.NewRouter()
 
-	// Add middleware
-	router.Use(loggingMiddleware)
+	// Add middleware. Per-request access logging is opt-in since it
+	// costs two formatted log writes on every request.
+	if s.accessLog {
+		router.Use(loggingMiddleware)
+	}
 	router.Use(recoveryMiddleware)
 
 	// API routes
@@ -41,36 +46,12 @@ func (s *Server) Start(port string) error {
 	apiRouter.HandleFunc("/health", s.handler.HealthCheck).Methods("GET")
 	apiRouter.HandleFunc("/config", s.handler.GetConfig).Methods("GET")
 
-	// STT routes
-	sttRouter := apiRouter.PathPrefix("/stt").Subrouter()
-	sttRouter.HandleFunc("/transcribe", s.handler.TranscribeAudio).Methods("POST")
-	sttRouter.HandleFunc("/transcribe-audio", s.handler.TranscribeAudio).Methods("POST")
-	sttRouter.HandleFunc("/transcribe-file", s.handler.TranscribeAudio).Methods("POST")
-	sttRouter.HandleFunc("/ready", s.handler.STTReady).Methods("GET")
-	sttRouter.HandleFunc("/info", s.handler.STTInfo).Methods("GET")
-
-	// TTS routes
-	ttsRouter := apiRouter.PathPrefix("/tts").Subrouter()
-	ttsRouter.HandleFunc("/synthesize", s.handler.SynthesizeSpeech).Methods("POST")
-	ttsRouter.HandleFunc("/voices", s.handler.GetVoices).Methods("GET")
-	ttsRouter.HandleFunc("/ready", s.handler.TTSReady).Methods("GET")
-	ttsRouter.HandleFunc("/info", s.handler.TTSInfo).Methods("GET")
-
-	// Embeddings routes
-	embeddingsRouter := apiRouter.PathPrefix("/embeddings").Subrouter()
-	embeddingsRouter.HandleFunc("/generate", s.handler.GenerateEmbedding).Methods("POST")
-	embeddingsRouter.HandleFunc("/batch", s.handler.GenerateEmbeddings).Methods("POST")
-	embeddingsRouter.HandleFunc("/generate-batch", s.handler.GenerateEmbeddings).Methods("POST")
-	embeddingsRouter.HandleFunc("/ready", s.handler.EmbeddingsReady).Methods("GET")
-	embeddingsRouter.HandleFunc("/info", s.handler.EmbeddingsInfo).Methods("GET")
-
-	// Model management routes
-	modelsRouter := apiRouter.PathPrefix("/models").Subrouter()
-	modelsRouter.HandleFunc("/download/{service}", s.handler.DownloadModel).Methods("POST")
-	modelsRouter.HandleFunc("/status", s.handler.GetModelStatus).Methods("GET")
-	modelsRouter.HandleFunc("/download-status", s.handler.GetModelDownloadStatus).Methods("GET")
-
-	handler := corsMiddleware(router)
+	s.handler.RegisterSTTRoutes(apiRouter)
+	s.handler.RegisterTTSRoutes(apiRouter)
+	s.handler.RegisterEmbeddingsRoutes(apiRouter)
+	s.handler.RegisterModelRoutes(apiRouter)
+
+	handler := corsMiddleware(s.healthFastPath(router))
 
 	s.httpServer = &http.Server{
 		Addr:         ":" + port,
@@ -96,6 +77,7 @@ func corsMiddleware(next http.Handler) http.Handler {
 					w.Header().Set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
 					w.Header().Set("Access-Control-Allow-Headers", "Content-Type, Authorization")
 					w.Header().Set("Access-Control-Allow-Credentials", "true")
+					w.Header().Set("Access-Control-Expose-Headers", "X-Count, X-Dim")
 				}
 			}
 		}
@@ -109,6 +91,19 @@ func corsMiddleware(next http.Handler) http.Handler {
 	})
 }
 
+// healthFastPath answers GET /api/health directly, skipping route matching
+// and the access log and recovery middleware. Electron polls this endpoint
+// continuously while waiting for and watching the backend.
+func (s *Server) healthFastPath(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == http.MethodGet && r.URL.Path == "/api/health" {
+			s.handler.HealthCheck(w, r)
+			return
+		}
+		next.ServeHTTP(w, r)
+	})
+}
+
 // Stop gracefully stops the server
 func (s *Server) Stop(ctx context.Context) error {
 	if s.httpServer != nil {
@@ -0,0 +1,154 @@
+package wav
+
+import (
+	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"math"
+)
+
+const (
+	formatPCM   = 1
+	formatFloat = 3
+	// formatExtensible stores the real format in the first two bytes of the
+	// sub-format GUID
+	formatExtensible = 0xFFFE
+)
+
+// IsWAV reports whether data starts with a RIFF/WAVE header
+func IsWAV(data []byte) bool {
+	return len(data) >= 12 && bytes.Equal(data[0:4], []byte("RIFF")) && bytes.Equal(data[8:12], []byte("WAVE"))
+}
+
+// Decode decodes an in-memory WAV file into mono float32 samples at
+// sampleRate. 8/16/24/32-bit PCM and 32-bit float data are supported;
+// channels are averaged and other rates are linearly resampled.
+func Decode(data []byte, sampleRate int) ([]float32, error) {
+	if !IsWAV(data) {
+		return nil, errors.New("not a RIFF/WAVE file")
+	}
+
+	var (
+		format, channels, bits uint16
+		rate                   uint32
+		pcm                    []byte
+		haveFmt                bool
+	)
+
+	for pos := 12; pos+8 <= len(data); {
+		id := string(data[pos : pos+4])
+		size := int(binary.LittleEndian.Uint32(data[pos+4:]))
+		body := data[pos+8:]
+		if size > len(body) {
+			// Streamed WAVs may leave the data size unset or too large
+			size = len(body)
+		}
+		body = body[:size]
+
+		switch id {
+		case "fmt ":
+			if size < 16 {
+				return nil, errors.New("invalid WAV fmt chunk")
+			}
+			format = binary.LittleEndian.Uint16(body[0:])
+			channels = binary.LittleEndian.Uint16(body[2:])
+			rate = binary.LittleEndian.Uint32(body[4:])
+			bits = binary.LittleEndian.Uint16(body[14:])
+			if format == formatExtensible && size >= 26 {
+				format = binary.LittleEndian.Uint16(body[24:])
+			}
+			haveFmt = true
+		case "data":
+			pcm = body
+		}
+
+		// Chunks are padded to an even size
+		pos += 8 + size + size&1
+	}
+
+	if !haveFmt {
+		return nil, errors.New("WAV file has no fmt chunk")
+	}
+	if pcm == nil {
+		return nil, errors.New("WAV file has no data chunk")
+	}
+	if channels == 0 || rate == 0 {
+		return nil, fmt.Errorf("invalid WAV format: %d channels at %d Hz", channels, rate)
+	}
+
+	sample, err := sampleDecoder(format, bits)
+	if err != nil {
+		return nil, err
+	}
+
+	width := int(bits) / 8
+	frameSize := width * int(channels)
+	frames := len(pcm) / frameSize
+	samples := make([]float32, frames)
+	for i := range samples {
+		frame := pcm[i*frameSize:]
+		var sum float32
+		for c := 0; c < int(channels); c++ {
+			sum += sample(frame[c*width:])
+		}
+		samples[i] = sum / float32(channels)
+	}
+
+	if int(rate) != sampleRate {
+		samples = resampleLinear(samples, int(rate), sampleRate)
+	}
+	return samples, nil
+}
+
+// sampleDecoder returns a function converting one little-endian sample of
+// the given format and bit depth to a float32 in [-1, 1]
+func sampleDecoder(format, bits uint16) (func([]byte) float32, error) {
+	switch {
+	case format == formatPCM && bits == 8:
+		return func(b []byte) float32 { return (float32(b[0]) - 128) / 128 }, nil
+	case format == formatPCM && bits == 16:
+		return func(b []byte) float32 {
+			return float32(int16(binary.LittleEndian.Uint16(b))) / 32768
+		}, nil
+	case format == formatPCM && bits == 24:
+		return func(b []byte) float32 {
+			v := int32(b[0]) | int32(b[1])<<8 | int32(int8(b[2]))<<16
+			return float32(v) / (1 << 23)
+		}, nil
+	case format == formatPCM && bits == 32:
+		return func(b []byte) float32 {
+			return float32(int32(binary.LittleEndian.Uint32(b))) / (1 << 31)
+		}, nil
+	case format == formatFloat && bits == 32:
+		return func(b []byte) float32 {
+			return math.Float32frombits(binary.LittleEndian.Uint32(b))
+		}, nil
+	default:
+		return nil, fmt.Errorf("unsupported WAV encoding: format %d, %d bits", format, bits)
+	}
+}
+
+// resampleLinear converts samples from rate from to rate to by linear
+// interpolation, which is adequate for speech
+func resampleLinear(samples []float32, from, to int) []float32 {
+	if len(samples) == 0 {
+		return samples
+	}
+
+	n := int(int64(len(samples)) * int64(to) / int64(from))
+	out := make([]float32, n)
+	step := float64(from) / float64(to)
+	last := len(samples) - 1
+	for i := range out {
+		pos := float64(i) * step
+		j := int(pos)
+		if j >= last {
+			out[i] = samples[last]
+			continue
+		}
+		frac := float32(pos - float64(j))
+		out[i] = samples[j] + (samples[j+1]-samples[j])*frac
+	}
+	return out
+}
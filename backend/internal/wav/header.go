@@ -0,0 +1,43 @@
+package wav
+
+import "encoding/binary"
+
+// HeaderSize is the length of a canonical PCM WAV header
+const HeaderSize = 44
+
+// UnknownSize is the data size to pass to AppendHeader for a stream whose
+// length is not known up front; both RIFF sizes are set to the maximum, which
+// players treat as "read until the end"
+const UnknownSize = 0xFFFFFFFF
+
+// headerTemplate is a 16-bit mono PCM header with the size and rate fields
+// left zero for AppendHeader to patch
+var headerTemplate = [HeaderSize]byte{
+	'R', 'I', 'F', 'F', 0, 0, 0, 0, 'W', 'A', 'V', 'E',
+	'f', 'm', 't', ' ', 16, 0, 0, 0, // fmt chunk size
+	1, 0, // PCM
+	1, 0, // mono
+	0, 0, 0, 0, // sample rate
+	0, 0, 0, 0, // byte rate
+	2, 0, // block align
+	16, 0, // bits per sample
+	'd', 'a', 't', 'a', 0, 0, 0, 0,
+}
+
+// AppendHeader appends a 16-bit mono PCM WAV header for dataSize bytes of
+// samples at sampleRate to dst
+func AppendHeader(dst []byte, sampleRate int, dataSize uint32) []byte {
+	start := len(dst)
+	dst = append(dst, headerTemplate[:]...)
+	header := dst[start:]
+
+	riffSize := uint32(UnknownSize)
+	if dataSize != UnknownSize {
+		riffSize = 36 + dataSize
+	}
+	binary.LittleEndian.PutUint32(header[4:], riffSize)
+	binary.LittleEndian.PutUint32(header[24:], uint32(sampleRate))
+	binary.LittleEndian.PutUint32(header[28:], uint32(sampleRate*2))
+	binary.LittleEndian.PutUint32(header[40:], dataSize)
+	return dst
+}
@@ -1,23 +1,43 @@
 package whisper
 
 import (
+	"bytes"
 	"context"
+	"encoding/binary"
+	"errors"
 	"fmt"
 	"io"
 	"log"
 	"net/http"
 	"os"
 	"os/exec"
+	"path"
 	"path/filepath"
 	"runtime"
+	"strconv"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 	"archive/zip"
 
+	"alice-backend/internal/downloader"
 	"alice-backend/internal/embedded"
+	"alice-backend/internal/wav"
 )
 
+// ErrNotReady is returned by transcription calls made before the service has
+// finished initializing
+var ErrNotReady = errors.New("Whisper STT service is not ready")
+
+// Supported whisper model quantizations. The quantized ggml models are a
+// fraction of the size of the f16 one and decode faster on CPU at a small
+// accuracy cost.
+const (
+	QuantizationNone = "none"
+	QuantizationQ8   = "q8_0"
+	QuantizationQ5   = "q5_1"
+)
 
 // Config holds STT configuration
 type Config struct {
@@ -25,6 +45,20 @@ type Config struct {
 	ModelPath      string
 	SampleRate     int
 	VoiceThreshold float64
+	// Workers is the number of whisper processes allowed to run at once
+	Workers int
+	// Threads is the number of threads each whisper process uses
+	Threads int
+	// Quantization selects the model weights (QuantizationNone, QuantizationQ8
+	// or QuantizationQ5)
+	Quantization string
+	// BeamSize is the decoder beam width; 1 decodes greedily
+	BeamSize int
+	// Debug enables per-transcription diagnostic logging, including the full
+	// whisper command output
+	Debug bool
+	// MirrorDir is a local directory checked for the model before downloading
+	MirrorDir string
 }
 
 // ServiceInfo contains information about the STT service
@@ -40,11 +74,21 @@ type ServiceInfo struct {
 
 // STTService provides speech-to-text functionality using whisper
 type STTService struct {
+	// initMu serializes initialization; mu only guards info so GetInfo is
+	// not blocked while the model downloads
+	initMu       sync.Mutex
 	mu           sync.RWMutex
-	ready        bool
+	ready        atomic.Bool
 	config       *Config
 	info         *ServiceInfo
 	assetManager *embedded.AssetManager
+	workers      chan struct{}
+
+	// binMu guards the whisper binary path and the flags it supports,
+	// resolved once by whisperBinary
+	binMu    sync.Mutex
+	binPath  string
+	binFlags map[string]bool
 }
 
 // NewSTTService creates a new STT service
@@ -55,6 +99,25 @@ func NewSTTService(config *Config) *STTService {
 	if config.VoiceThreshold == 0 {
 		config.VoiceThreshold = 0.02
 	}
+	// Split the CPUs between concurrent transcriptions so parallel whisper
+	// processes do not oversubscribe cores
+	if config.Workers <= 0 {
+		config.Workers = max(1, runtime.NumCPU()/2)
+	}
+	if config.Threads <= 0 {
+		config.Threads = max(1, runtime.NumCPU()/config.Workers)
+	}
+	if config.BeamSize <= 0 {
+		config.BeamSize = 1
+	}
+	switch config.Quantization {
+	case QuantizationNone, QuantizationQ8, QuantizationQ5:
+	case "":
+		config.Quantization = QuantizationNone
+	default:
+		log.Printf("Warning: Unknown whisper quantization %q, using %s", config.Quantization, QuantizationNone)
+		config.Quantization = QuantizationNone
+	}
 
 	// Determine the base directory for assets
 	baseDir := embedded.GetProductionBaseDirectory()
@@ -63,6 +126,7 @@ func NewSTTService(config *Config) *STTService {
 	return &STTService{
 		config:       config,
 		assetManager: assetManager,
+		workers:      make(chan struct{}, config.Workers),
 		info: &ServiceInfo{
 			Name:        "Whisper STT",
 			Version:     "1.0.0",
@@ -70,15 +134,15 @@ func NewSTTService(config *Config) *STTService {
 			Model:       "whisper",
 			Language:    config.Language,
 			LastUpdated: time.Now(),
-			Metadata:    make(map[string]string),
+			Metadata:    map[string]string{"quantization": config.Quantization},
 		},
 	}
 }
 
 // Initialize initializes the STT service
 func (s *STTService) Initialize(ctx context.Context) error {
-	s.mu.Lock()
-	defer s.mu.Unlock()
+	s.initMu.Lock()
+	defer s.initMu.Unlock()
 
 	log.Println("Initializing Whisper STT service...")
 
@@ -95,7 +159,7 @@ func (s *STTService) Initialize(ctx context.Context) error {
 	}
 
 	// Ensure Whisper model is available
-	modelPath := s.assetManager.GetModelPath("whisper")
+	modelPath := s.modelPath()
 	if !s.assetManager.IsAssetAvailable(modelPath) {
 		log.Printf("Whisper model not found at %s, will download when needed", modelPath)
 		// Download model during initialization to avoid delays during transcription
@@ -107,9 +171,11 @@ func (s *STTService) Initialize(ctx context.Context) error {
 		}
 	}
 
-	s.ready = true
+	s.mu.Lock()
+	s.ready.Store(true)
 	s.info.Status = "ready"
 	s.info.LastUpdated = time.Now()
+	s.mu.Unlock()
 
 	log.Println("Whisper STT service initialized successfully")
 	return nil
@@ -117,9 +183,7 @@ func (s *STTService) Initialize(ctx context.Context) error {
 
 // IsReady returns true if the service is ready
 func (s *STTService) IsReady() bool {
-	s.mu.RLock()
-	defer s.mu.RUnlock()
-	return s.ready
+	return s.ready.Load()
 }
 
 // GetInfo returns service information
@@ -140,7 +204,7 @@ func (s *STTService) TranscribeAudio(ctx context.Context, audioData []byte) (str
 // TranscribeAudioWithLanguage performs speech transcription with optional language override
 func (s *STTService) TranscribeAudioWithLanguage(ctx context.Context, audioData []byte, language string) (string, error) {
 	if !s.IsReady() {
-		return "", fmt.Errorf("Whisper STT service is not ready")
+		return "", ErrNotReady
 	}
 
 	if len(audioData) == 0 {
@@ -159,8 +223,34 @@ func (s *STTService) TranscribeAudioWithLanguage(ctx context.Context, audioData
 	return s.transcribeDirectlyWithLanguage(ctx, samples, language)
 }
 
-// convertAudioToSamples converts byte audio data to float32 samples
+// TranscribeSamplesWithLanguage transcribes 16kHz mono float32 samples directly,
+// without a round-trip through 16-bit PCM bytes
+func (s *STTService) TranscribeSamplesWithLanguage(ctx context.Context, samples []float32, language string) (string, error) {
+	if !s.IsReady() {
+		return "", ErrNotReady
+	}
+
+	if len(samples) == 0 {
+		return "", nil
+	}
+
+	return s.transcribeDirectlyWithLanguage(ctx, samples, language)
+}
+
+// Warmup transcribes half a second of silence so the first real request does
+// not pay for locating the binary and loading the model from disk
+func (s *STTService) Warmup(ctx context.Context) error {
+	_, err := s.TranscribeSamplesWithLanguage(ctx, make([]float32, s.config.SampleRate/2), "")
+	return err
+}
+
+// convertAudioToSamples converts byte audio data to float32 samples. WAV
+// files are decoded in memory; anything else is taken as raw 16-bit PCM.
 func (s *STTService) convertAudioToSamples(audioData []byte) ([]float32, error) {
+	if wav.IsWAV(audioData) {
+		return wav.Decode(audioData, s.config.SampleRate)
+	}
+
 	if len(audioData)%2 != 0 {
 		return nil, fmt.Errorf("invalid audio data: odd number of bytes")
 	}
@@ -176,49 +266,15 @@ func (s *STTService) convertAudioToSamples(audioData []byte) ([]float32, error)
 	return samples, nil
 }
 
-// writeWAVFile writes float32 samples to a WAV file
+// writeWAVFile writes float32 samples to a WAV file. The header and 16-bit
+// PCM data are built in one buffer and written with a single call rather
+// than a write per field and per sample.
 func (s *STTService) writeWAVFile(filename string, samples []float32) error {
 	const sampleRate = 16000
-	const channels = 1
-	const bitsPerSample = 16
-
-	file, err := os.Create(filename)
-	if err != nil {
-		return err
-	}
-	defer file.Close()
 
 	dataSize := len(samples) * 2
-	fileSize := 36 + dataSize
-
-	// RIFF header
-	file.WriteString("RIFF")
-	file.Write([]byte{byte(fileSize & 0xFF), byte((fileSize >> 8) & 0xFF), byte((fileSize >> 16) & 0xFF), byte((fileSize >> 24) & 0xFF)})
-	file.WriteString("WAVE")
-
-	// fmt chunk
-	file.WriteString("fmt ")
-	file.Write([]byte{16, 0, 0, 0})
-	file.Write([]byte{1, 0})
-	file.Write([]byte{byte(channels), 0})
-
-	// Sample rate
-	file.Write([]byte{byte(sampleRate & 0xFF), byte((sampleRate >> 8) & 0xFF), byte((sampleRate >> 16) & 0xFF), byte((sampleRate >> 24) & 0xFF)})
-
-	// Byte rate
-	byteRate := sampleRate * channels * bitsPerSample / 8
-	file.Write([]byte{byte(byteRate & 0xFF), byte((byteRate >> 8) & 0xFF), byte((byteRate >> 16) & 0xFF), byte((byteRate >> 24) & 0xFF)})
-
-	// Block align
-	blockAlign := channels * bitsPerSample / 8
-	file.Write([]byte{byte(blockAlign), 0})
-
-	// Bits per sample
-	file.Write([]byte{byte(bitsPerSample), 0})
-
-	// data chunk
-	file.WriteString("data")
-	file.Write([]byte{byte(dataSize & 0xFF), byte((dataSize >> 8) & 0xFF), byte((dataSize >> 16) & 0xFF), byte((dataSize >> 24) & 0xFF)})
+	buf := make([]byte, 0, wav.HeaderSize+dataSize)
+	buf = wav.AppendHeader(buf, sampleRate, uint32(dataSize))
 
 	// Convert float32 samples to 16-bit PCM
 	for _, sample := range samples {
@@ -227,83 +283,101 @@ func (s *STTService) writeWAVFile(filename string, samples []float32) error {
 		} else if sample < -1.0 {
 			sample = -1.0
 		}
-
-		sample16 := int16(sample * 32767)
-		file.Write([]byte{byte(sample16), byte(sample16 >> 8)})
+		buf = binary.LittleEndian.AppendUint16(buf, uint16(int16(sample*32767)))
 	}
 
-	return nil
+	return os.WriteFile(filename, buf, 0644)
 }
 
-// transcribeDirectlyWithLanguage performs direct transcription using whisper.cpp binary
-func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples []float32, language string) (string, error) {
-	log.Printf("Direct transcription: processing %d audio samples", len(samples))
-	
-	if len(samples) == 0 {
-		return "", nil
-	}
-	
-	var whisperPath string
-	embeddedBinaryPath := s.assetManager.GetBinaryPath("whisper")
-	if s.assetManager.IsAssetAvailable(embeddedBinaryPath) {
-		whisperPath = embeddedBinaryPath
-	} else {
-		possiblePaths := []string{
-			"bin/whisper-cli.exe",
-			"bin/whisper-command.exe",
-			"bin/main.exe",
-			"bin/whisper.exe",
-		}
-
-		if runtime.GOOS != "windows" {
-			possiblePaths = []string{
-				"bin/whisper-cli",
-				"bin/whisper-command",
-				"bin/main",
-				"bin/whisper",
-			}
-		}
+// whisperBinary returns the path of the whisper.cpp binary and the flags its
+// --help output lists, which tell what the build supports. Both are resolved
+// on first use, downloading the binary if none is found, and reused afterwards
+// so a transcription does not stat every candidate path and spawn an extra
+// process just to probe flags. A failed resolution is retried next call.
+func (s *STTService) whisperBinary(ctx context.Context) (string, map[string]bool, error) {
+	s.binMu.Lock()
+	defer s.binMu.Unlock()
 
-		for _, path := range possiblePaths {
-			if _, err := os.Stat(path); err == nil {
-				whisperPath = path
-				break
-			}
-		}
+	if s.binPath != "" {
+		return s.binPath, s.binFlags, nil
 	}
 
+	whisperPath := s.findWhisperBinary()
 	if whisperPath == "" {
 		if downloadErr := s.downloadWhisperBinary(ctx); downloadErr != nil {
-			return "", fmt.Errorf("no whisper binary found and download failed: %w", downloadErr)
+			return "", nil, fmt.Errorf("no whisper binary found and download failed: %w", downloadErr)
 		}
-		
-		possiblePaths := []string{
-			"bin/whisper-cli.exe",
-			"bin/whisper-command.exe", 
-			"bin/main.exe",
-			"bin/whisper.exe",
+		whisperPath = s.findWhisperBinary()
+		if whisperPath == "" {
+			return "", nil, fmt.Errorf("no whisper binary found even after download attempt")
 		}
+	}
 
-		if runtime.GOOS != "windows" {
-			possiblePaths = []string{
-				"bin/whisper-cli",
-				"bin/whisper-command",
-				"bin/main",
-				"bin/whisper",
-			}
+	helpOutput, _ := exec.Command(whisperPath, "--help").CombinedOutput()
+
+	s.binPath = whisperPath
+	s.binFlags = parseHelpFlags(string(helpOutput))
+	return s.binPath, s.binFlags, nil
+}
+
+// parseHelpFlags collects every option named in whisper's --help output in a
+// single pass, so checking for a flag is a map lookup rather than a scan of
+// the whole help text
+func parseHelpFlags(help string) map[string]bool {
+	flags := make(map[string]bool)
+	for _, field := range strings.Fields(help) {
+		if strings.HasPrefix(field, "-") {
+			flags[strings.TrimRight(field, ",:")] = true
 		}
+	}
+	return flags
+}
 
-		for _, path := range possiblePaths {
-			if _, err := os.Stat(path); err == nil {
-				whisperPath = path
-				break
-			}
+// findWhisperBinary returns the embedded whisper binary if present, otherwise
+// the first known whisper.cpp executable name found under bin/, then
+// whisper-cli on PATH, or ""
+func (s *STTService) findWhisperBinary() string {
+	embeddedBinaryPath := s.assetManager.GetBinaryPath("whisper")
+	if s.assetManager.IsAssetAvailable(embeddedBinaryPath) {
+		return embeddedBinaryPath
+	}
+
+	possiblePaths := []string{
+		"bin/whisper-cli",
+		"bin/whisper-command",
+		"bin/main",
+		"bin/whisper",
+	}
+	for _, path := range possiblePaths {
+		if runtime.GOOS == "windows" {
+			path += ".exe"
 		}
-		
-		if whisperPath == "" {
-			return "", fmt.Errorf("no whisper binary found even after download attempt")
+		if _, err := os.Stat(path); err == nil {
+			return path
 		}
 	}
+
+	// A whisper.cpp install on PATH (e.g. from a package manager) saves
+	// downloading and unpacking the release archive. Only whisper-cli is
+	// looked up: a bare "whisper" on PATH is usually the Python CLI.
+	if path, err := exec.LookPath("whisper-cli"); err == nil {
+		return path
+	}
+	return ""
+}
+
+// transcribeDirectlyWithLanguage performs direct transcription using whisper.cpp binary
+func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples []float32, language string) (string, error) {
+	s.debugf("Direct transcription: processing %d audio samples", len(samples))
+	
+	if len(samples) == 0 {
+		return "", nil
+	}
+	
+	whisperPath, flags, err := s.whisperBinary(ctx)
+	if err != nil {
+		return "", err
+	}
 	
 	tmpDir := os.TempDir()
 	inputFile := filepath.Join(tmpDir, fmt.Sprintf("whisper_direct_%d.wav", time.Now().UnixNano()))
@@ -317,7 +391,7 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 	}
 	
 	// Get model path
-	modelPath := s.assetManager.GetModelPath("whisper")
+	modelPath := s.modelPath()
 	
 	// Ensure model is available, download if needed
 	if !s.assetManager.IsAssetAvailable(modelPath) {
@@ -333,16 +407,28 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 		"-f", inputFile,
 	}
 	
-	// Check if this binary supports -otxt flag by testing with --help
-	helpCmd := exec.Command(whisperPath, "--help")
-	helpOutput, _ := helpCmd.CombinedOutput()
-	supportsOtxt := strings.Contains(string(helpOutput), "-otxt") || strings.Contains(string(helpOutput), "otxt")
-	
-	if supportsOtxt {
+	if flags["-otxt"] {
 		args = append(args, "-otxt")
 	}
 	
 	args = append(args, "-of", strings.TrimSuffix(outputFile, ".txt"))
+	args = append(args, "-t", strconv.Itoa(s.config.Threads))
+
+	// Recent whisper.cpp builds default to a 5-wide beam search with 5
+	// candidates, several times the decoder work of greedy decoding for
+	// little gain on short clean utterances. Temperature fallback still
+	// retries segments that fail to decode.
+	if flags["--beam-size"] {
+		args = append(args, "-bs", strconv.Itoa(s.config.BeamSize))
+		if s.config.BeamSize == 1 {
+			args = append(args, "-bo", "1")
+		}
+	}
+
+	// Only the plain transcript is read back, so skip timestamp tokens
+	if flags["--no-timestamps"] {
+		args = append(args, "-nt")
+	}
 	
 	langToUse := language
 	if langToUse == "" {
@@ -351,10 +437,17 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 	
 	if langToUse != "" && langToUse != "auto" {
 		args = append(args, "-l", langToUse)
-		log.Printf("Using language parameter: %s", langToUse)
+		s.debugf("Using language parameter: %s", langToUse)
 	}
 	
-	log.Printf("Executing whisper: %s %v", whisperPath, args)
+	select {
+	case s.workers <- struct{}{}:
+		defer func() { <-s.workers }()
+	case <-ctx.Done():
+		return "", ctx.Err()
+	}
+
+	s.debugf("Executing whisper: %s %v", whisperPath, args)
 	
 	cmd := exec.CommandContext(ctx, whisperPath, args...)
 	
@@ -376,12 +469,25 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 		cmd.Env = append(cmd.Env, "LD_LIBRARY_PATH="+ldLibraryPath)
 	}
 	
-	output, err := cmd.CombinedOutput()
+	// The transcript is read from the -otxt file, so stdout is discarded and
+	// only the tail of stderr is kept for error messages, rather than
+	// buffering all of whisper's loading and timing output per request.
+	// In debug mode both streams share one writer, so os/exec copies them
+	// through a single pipe and goroutine instead of two racing on the buffer.
+	output := &tailWriter{max: maxCapturedOutput}
+	cmd.Stderr = output
+	var debugOutput bytes.Buffer
+	if s.config.Debug {
+		w := io.MultiWriter(output, &debugOutput)
+		cmd.Stdout, cmd.Stderr = w, w
+	}
+	
+	err = cmd.Run()
 	
-	log.Printf("Whisper command output: %s", string(output))
+	s.debugf("Whisper command output: %s", debugOutput.Bytes())
 	
 	if err != nil {
-		return "", fmt.Errorf("whisper command failed: %w (output: %s)", err, string(output))
+		return "", fmt.Errorf("whisper command failed: %w (output: %s)", err, output)
 	}
 	
 	time.Sleep(100 * time.Millisecond)
@@ -390,7 +496,7 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 	actualOutputFile := outputFile
 	
 	if _, err := os.Stat(actualOutputFile); os.IsNotExist(err) {
-		return "", fmt.Errorf("whisper output file not created: %s (command output: %s)", actualOutputFile, string(output))
+		return "", fmt.Errorf("whisper output file not created: %s (command output: %s)", actualOutputFile, output)
 	}
 	
 	transcription, err := os.ReadFile(actualOutputFile)
@@ -401,11 +507,39 @@ func (s *STTService) transcribeDirectlyWithLanguage(ctx context.Context, samples
 	defer os.Remove(actualOutputFile)
 	
 	text := strings.TrimSpace(string(transcription))
-	log.Printf("Direct transcription completed: '%s'", text)
+	s.debugf("Direct transcription completed: '%s'", text)
 	
 	return text, nil
 }
 
+// debugf logs only when debug logging is enabled
+func (s *STTService) debugf(format string, args ...interface{}) {
+	if s.config.Debug {
+		log.Printf(format, args...)
+	}
+}
+
+// maxCapturedOutput is how much of a whisper run's output is kept for errors
+const maxCapturedOutput = 8 << 10
+
+// tailWriter keeps only the last max bytes written to it
+type tailWriter struct {
+	max int
+	buf []byte
+}
+
+func (t *tailWriter) Write(p []byte) (int, error) {
+	t.buf = append(t.buf, p...)
+	if over := len(t.buf) - t.max; over > 0 {
+		t.buf = append(t.buf[:0], t.buf[over:]...)
+	}
+	return len(p), nil
+}
+
+func (t *tailWriter) String() string {
+	return string(t.buf)
+}
+
 // downloadWhisperBinary downloads the whisper.cpp binary for the current platform
 func (s *STTService) downloadWhisperBinary(ctx context.Context) error {
 	var downloadURLs []string
@@ -699,9 +833,24 @@ func (s *STTService) downloadFileWithHeaders(url, filepath string) error {
 	return nil
 }
 
-// downloadWhisperModel downloads the base Whisper model
+// modelPath returns the local path of the whisper model for the configured quantization
+func (s *STTService) modelPath() string {
+	if s.config.Quantization == QuantizationNone {
+		return s.assetManager.GetModelPath("whisper")
+	}
+	return s.assetManager.GetModelPath(fmt.Sprintf("whisper-base-%s.bin", s.config.Quantization))
+}
+
+// downloadWhisperModel downloads the base Whisper model in the configured quantization
 func (s *STTService) downloadWhisperModel(ctx context.Context, modelPath string) error {
 	modelURL := "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.bin"
+	if s.config.Quantization != QuantizationNone {
+		modelURL = fmt.Sprintf("https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base-%s.bin", s.config.Quantization)
+	}
+	
+	if downloader.CopyFromMirror(s.config.MirrorDir, path.Base(modelURL), modelPath) {
+		return nil
+	}
 	
 	log.Printf("Downloading whisper model from %s", modelURL)
 	
@@ -739,7 +888,7 @@ func (s *STTService) Shutdown(ctx context.Context) error {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	s.ready = false
+	s.ready.Store(false)
 	s.info.Status = "stopped"
 	s.info.LastUpdated = time.Now()
 
@@ -21,13 +21,6 @@ func main() {
 	// Initialize model manager
 	modelManager := models.NewManager(cfg)
 
-	// Initialize services
-	ctx := context.Background()
-	if err := modelManager.Initialize(ctx); err != nil {
-		slog.Error("Failed to initialize model manager", "error", err)
-		os.Exit(1)
-	}
-
 	// Create API handler
 	apiHandler := api.NewHandler(cfg, modelManager)
 
@@ -43,6 +36,16 @@ func main() {
 		}
 	}()
 
+	// Load models once the server is accepting connections, so health
+	// checks answer immediately and report each service as it becomes ready.
+	// A service that fails to load stays unavailable without taking the
+	// others down.
+	go func() {
+		if err := modelManager.Initialize(context.Background()); err != nil {
+			slog.Error("Failed to initialize model manager", "error", err)
+		}
+	}()
+
 	// Wait for interrupt signal
 	quit := make(chan os.Signal, 1)
 	signal.Notify(quit, syscall.SIGINT, syscall.SIGTERM)
@@ -772,15 +772,34 @@ function getBackendUrl(): string {
 }
 
 async function generateEmbeddings(texts: string[]): Promise<number[][]> {
-  const response = await axios.post(
-    `${getBackendUrl()}/api/embeddings/generate-batch`,
+  // The raw endpoint returns a packed float32 matrix instead of JSON arrays
+  const response = await axios.post<ArrayBuffer | Buffer>(
+    `${getBackendUrl()}/api/embeddings/generate-batch-raw`,
     { texts },
-    { timeout: 60000 }
+    { timeout: 60000, responseType: 'arraybuffer' }
   )
-  if (!response.data?.success) {
-    throw new Error(response.data?.error || 'Embedding generation failed')
+  const count = Number(response.headers['x-count'])
+  const dim = Number(response.headers['x-dim'])
+  // Node's adapter yields a (possibly unaligned) Buffer; copy it into an
+  // aligned byte array before viewing it as float32
+  const bytes =
+    response.data instanceof ArrayBuffer
+      ? new Uint8Array(response.data)
+      : new Uint8Array(response.data as Buffer)
+  const matrix = new Float32Array(
+    bytes.buffer,
+    bytes.byteOffset,
+    bytes.byteLength / 4
+  )
+  if (!count || !dim || matrix.length !== count * dim) {
+    throw new Error('Embedding generation returned a malformed matrix')
+  }
+
+  const embeddings: number[][] = new Array(count)
+  for (let i = 0; i < count; i++) {
+    embeddings[i] = Array.from(matrix.subarray(i * dim, (i + 1) * dim))
   }
-  return response.data.data?.embeddings || []
+  return embeddings
 }
 
 function toEmbeddingBuffer(embedding: number[]): Buffer {
@@ -1,6 +1,7 @@
 #!/usr/bin/env node
 
-import { execSync } from 'child_process'
+import { execSync, spawn } from 'child_process'
+import crypto from 'crypto'
 import fs from 'fs'
 import path from 'path'
 import os from 'os'
@@ -96,35 +97,119 @@ function downloadFile(url, outputPath) {
         file.on('error', (err) => {
           file.close()
           response.destroy()
-          if (fs.existsSync(outputPath)) {
-            fs.unlinkSync(outputPath)
-          }
+          fs.rmSync(outputPath, { force: true })
           reject(err)
         })
       })
       .on('error', err => {
         file.close()
-        if (fs.existsSync(outputPath)) {
-          fs.unlinkSync(outputPath)
-        }
+        fs.rmSync(outputPath, { force: true })
         reject(err)
       })
   })
 }
 
+// Downloads are kept here across builds, so rebuilding after resources/ is
+// cleaned copies archives and models from disk instead of fetching them again
+const DOWNLOAD_CACHE_DIR =
+  process.env.ALICE_DOWNLOAD_CACHE ||
+  path.join(os.homedir(), '.cache', 'alice', 'downloads')
+
+/**
+ * Download a file through the persistent download cache
+ */
+async function downloadCached(url, outputPath) {
+  const key = crypto.createHash('sha256').update(url).digest('hex').slice(0, 16)
+  const cachePath = path.join(
+    DOWNLOAD_CACHE_DIR,
+    `${key}-${path.basename(new URL(url).pathname)}`
+  )
+
+  // Copying straight away answers "is it cached" and does the copy in one
+  // call, instead of an existence check followed by the copy
+  try {
+    fs.copyFileSync(cachePath, outputPath)
+    console.log(`Using cached download: ${cachePath}`)
+    return
+  } catch (error) {
+    if (error.code !== 'ENOENT') throw error
+  }
+
+  fs.mkdirSync(DOWNLOAD_CACHE_DIR, { recursive: true })
+  const partPath = `${cachePath}.${process.pid}.part`
+  await downloadFile(url, partPath)
+  fs.renameSync(partPath, cachePath)
+  fs.copyFileSync(cachePath, outputPath)
+}
+
+/**
+ * Walk an extracted archive once and index it by entry name, so binaries,
+ * their dependencies and data directories can be looked up without
+ * re-traversing the tree for each of them
+ */
+function indexExtractedFiles(rootDir) {
+  const files = new Map()
+  const dirs = new Map()
+  const pending = [rootDir]
+
+  while (pending.length > 0) {
+    const dir = pending.pop()
+    for (const item of fs.readdirSync(dir, { withFileTypes: true })) {
+      const fullPath = path.join(dir, item.name)
+      if (item.isDirectory()) {
+        if (!dirs.has(item.name)) dirs.set(item.name, fullPath)
+        pending.push(fullPath)
+      } else if (!files.has(item.name)) {
+        files.set(item.name, fullPath)
+      }
+    }
+  }
+
+  return { files, dirs }
+}
+
+/**
+ * Log an extracted archive index for debugging
+ */
+function logExtractedFiles(index, rootDir) {
+  console.log('Extracted contents:')
+  for (const dirPath of index.dirs.values()) {
+    console.log(`[DIR] ${path.relative(rootDir, dirPath)}`)
+  }
+  for (const filePath of index.files.values()) {
+    console.log(`[FILE] ${path.relative(rootDir, filePath)}`)
+  }
+}
+
+/**
+ * Run a shell command with inherited stdio without blocking the event loop,
+ * so archive extraction does not stall downloads running alongside it
+ */
+function runCommand(command) {
+  return new Promise((resolve, reject) => {
+    const child = spawn(command, { shell: true, stdio: 'inherit' })
+    child.on('error', reject)
+    child.on('close', code => {
+      if (code === 0) {
+        resolve()
+      } else {
+        reject(new Error(`Command failed with exit code ${code}: ${command}`))
+      }
+    })
+  })
+}
+
 /**
  * Extract ffmpeg binary from downloaded archive
  */
-function extractFFmpeg(archivePath, outputDir) {
+async function extractFFmpeg(archivePath, outputDir) {
   const platform = os.platform()
 
   try {
     if (platform === 'win32') {
       // Create a temporary extraction directory
       const tempDir = path.join(outputDir, 'temp_extract')
-      if (fs.existsSync(tempDir)) {
-        fs.rmSync(tempDir, { recursive: true, force: true })
-      }
+      fs.rmSync(tempDir, { recursive: true, force: true })
       fs.mkdirSync(tempDir, { recursive: true })
 
       // Extract ZIP file using PowerShell on Windows with proper path escaping
@@ -133,26 +218,11 @@ function extractFFmpeg(archivePath, outputDir) {
       const extractCmd = `powershell -command "Expand-Archive -Path '${normalizedArchivePath}' -DestinationPath '${normalizedTempDir}' -Force"`
 
       console.log(`Running extraction command: ${extractCmd}`)
-      execSync(extractCmd, { stdio: 'pipe' })
-
-      // Find ffmpeg.exe in the extracted folder - look recursively
-      function findFFmpegRecursive(dir) {
-        const items = fs.readdirSync(dir, { withFileTypes: true })
+      await runCommand(extractCmd)
 
-        for (const item of items) {
-          const fullPath = path.join(dir, item.name)
-
-          if (item.isDirectory()) {
-            const result = findFFmpegRecursive(fullPath)
-            if (result) return result
-          } else if (item.name === 'ffmpeg.exe') {
-            return fullPath
-          }
-        }
-        return null
-      }
-
-      const ffmpegExePath = findFFmpegRecursive(tempDir)
+      // Find ffmpeg.exe anywhere in the extracted folder
+      const index = indexExtractedFiles(tempDir)
+      const ffmpegExePath = index.files.get('ffmpeg.exe') || null
       console.log(`Found ffmpeg at: ${ffmpegExePath}`)
 
       if (ffmpegExePath && fs.existsSync(ffmpegExePath)) {
@@ -166,19 +236,7 @@ function extractFFmpeg(archivePath, outputDir) {
       } else {
         console.error('ffmpeg.exe not found in extracted files')
         // List extracted files for debugging
-        console.log('Extracted contents:')
-        function listDir(dir, indent = '') {
-          const items = fs.readdirSync(dir, { withFileTypes: true })
-          items.forEach(item => {
-            console.log(
-              `${indent}${item.isDirectory() ? '[DIR]' : '[FILE]'} ${item.name}`
-            )
-            if (item.isDirectory() && indent.length < 20) {
-              listDir(path.join(dir, item.name), indent + '  ')
-            }
-          })
-        }
-        listDir(tempDir)
+        logExtractedFiles(index, tempDir)
 
         // Clean up temp directory
         fs.rmSync(tempDir, { recursive: true, force: true })
@@ -186,15 +244,12 @@ function extractFFmpeg(archivePath, outputDir) {
       }
     } else if (platform === 'darwin') {
       // Extract ZIP file on macOS
-      execSync(`cd "${outputDir}" && unzip -o "${archivePath}"`, {
-        stdio: 'inherit',
-      })
+      await runCommand(`cd "${outputDir}" && unzip -o "${archivePath}"`)
       return fs.existsSync(path.join(outputDir, 'ffmpeg'))
     } else {
       // Extract tar.xz on Linux
-      execSync(
-        `cd "${outputDir}" && tar -xf "${archivePath}" --strip-components=1`,
-        { stdio: 'inherit' }
+      await runCommand(
+        `cd "${outputDir}" && tar -xf "${archivePath}" --strip-components=1`
       )
       return fs.existsSync(path.join(outputDir, 'ffmpeg'))
     }
@@ -210,16 +265,14 @@ function extractFFmpeg(archivePath, outputDir) {
 /**
  * Extract whisper binary from downloaded archive
  */
-function extractWhisper(archivePath, outputDir) {
+async function extractWhisper(archivePath, outputDir) {
   const platform = os.platform()
 
   try {
     if (platform === 'win32' || platform === 'darwin' || platform === 'linux') {
       // Create a temporary extraction directory
       const tempDir = path.join(outputDir, 'temp_extract_whisper')
-      if (fs.existsSync(tempDir)) {
-        fs.rmSync(tempDir, { recursive: true, force: true })
-      }
+      fs.rmSync(tempDir, { recursive: true, force: true })
       fs.mkdirSync(tempDir, { recursive: true })
 
       let extractCmd
@@ -234,42 +287,29 @@ function extractWhisper(archivePath, outputDir) {
       }
 
       console.log(`Running whisper extraction command: ${extractCmd}`)
-      execSync(extractCmd, { stdio: 'pipe' })
-
-      // Find whisper binary in the extracted folder - look for whisper executables
-      function findWhisperRecursive(dir) {
-        const items = fs.readdirSync(dir, { withFileTypes: true })
-
-        // Priority order for whisper executables (based on new naming convention)
-        const whisperExecutables = [
-          'whisper-cli.exe',
-          'whisper-cli',
-          'whisper-main.exe',
-          'whisper-main',
-          'main.exe',
-          'main',
-          'whisper.exe',
-          'whisper',
-          'whisper-macos-arm64',
-          'whisper-macos-x64', // macOS specific names
-          'whisper-linux-x64',
-          'whisper-linux-arm64', // Linux specific names
-        ]
-
-        for (const item of items) {
-          const fullPath = path.join(dir, item.name)
-
-          if (item.isDirectory()) {
-            const result = findWhisperRecursive(fullPath)
-            if (result) return result
-          } else if (whisperExecutables.includes(item.name)) {
-            return fullPath
-          }
-        }
-        return null
-      }
-
-      const whisperExePath = findWhisperRecursive(tempDir)
+      await runCommand(extractCmd)
+
+      // Index the extracted folder once for the binary and its libraries
+      const index = indexExtractedFiles(tempDir)
+
+      // Priority order for whisper executables (based on new naming convention)
+      const whisperExecutables = [
+        'whisper-cli.exe',
+        'whisper-cli',
+        'whisper-main.exe',
+        'whisper-main',
+        'main.exe',
+        'main',
+        'whisper.exe',
+        'whisper',
+        'whisper-macos-arm64',
+        'whisper-macos-x64', // macOS specific names
+        'whisper-linux-x64',
+        'whisper-linux-arm64', // Linux specific names
+      ]
+
+      const whisperExe = whisperExecutables.find(name => index.files.has(name))
+      const whisperExePath = whisperExe ? index.files.get(whisperExe) : null
       console.log(`Found whisper binary at: ${whisperExePath}`)
 
       if (whisperExePath && fs.existsSync(whisperExePath)) {
@@ -288,23 +328,13 @@ function extractWhisper(archivePath, outputDir) {
             'whisper.dll',
           ]
 
-          function findAndCopyDlls(dir) {
-            const items = fs.readdirSync(dir, { withFileTypes: true })
-
-            for (const item of items) {
-              const fullPath = path.join(dir, item.name)
-
-              if (item.isDirectory()) {
-                findAndCopyDlls(fullPath)
-              } else if (requiredDlls.includes(item.name)) {
-                const targetDllPath = path.join(outputDir, item.name)
-                fs.copyFileSync(fullPath, targetDllPath)
-                console.log(`Copied DLL: ${item.name}`)
-              }
+          for (const dllName of requiredDlls) {
+            const dllPath = index.files.get(dllName)
+            if (dllPath) {
+              fs.copyFileSync(dllPath, path.join(outputDir, dllName))
+              console.log(`Copied DLL: ${dllName}`)
             }
           }
-
-          findAndCopyDlls(tempDir)
         } else if (platform === 'darwin') {
           // Copy dylib dependencies for macOS
           const requiredDylibs = [
@@ -323,28 +353,16 @@ function extractWhisper(archivePath, outputDir) {
             path.dirname(outputDir),
             'libinternal'
           )
-          if (!fs.existsSync(libInternalDir)) {
-            fs.mkdirSync(libInternalDir, { recursive: true })
-          }
+          fs.mkdirSync(libInternalDir, { recursive: true })
 
-          function findAndCopyDylibs(dir) {
-            const items = fs.readdirSync(dir, { withFileTypes: true })
-
-            for (const item of items) {
-              const fullPath = path.join(dir, item.name)
-
-              if (item.isDirectory()) {
-                findAndCopyDylibs(fullPath)
-              } else if (requiredDylibs.includes(item.name)) {
-                const targetDylibPath = path.join(libInternalDir, item.name)
-                fs.copyFileSync(fullPath, targetDylibPath)
-                console.log(`Copied dylib: ${item.name}`)
-              }
+          for (const dylibName of requiredDylibs) {
+            const dylibPath = index.files.get(dylibName)
+            if (dylibPath) {
+              fs.copyFileSync(dylibPath, path.join(libInternalDir, dylibName))
+              console.log(`Copied dylib: ${dylibName}`)
             }
           }
 
-          findAndCopyDylibs(tempDir)
-
           // Make executable on Unix systems
           fs.chmodSync(targetPath, '755')
         } else {
@@ -359,20 +377,7 @@ function extractWhisper(archivePath, outputDir) {
         console.error('Whisper binary (main) not found in extracted files')
 
         // List extracted files for debugging
-        console.log('Extracted contents:')
-        function listDir(dir, indent = '') {
-          if (!fs.existsSync(dir)) return
-          const items = fs.readdirSync(dir, { withFileTypes: true })
-          items.forEach(item => {
-            console.log(
-              `${indent}${item.isDirectory() ? '[DIR]' : '[FILE]'} ${item.name}`
-            )
-            if (item.isDirectory() && indent.length < 20) {
-              listDir(path.join(dir, item.name), indent + '  ')
-            }
-          })
-        }
-        listDir(tempDir)
+        logExtractedFiles(index, tempDir)
 
         // Clean up temp directory
         fs.rmSync(tempDir, { recursive: true, force: true })
@@ -391,16 +396,14 @@ function extractWhisper(archivePath, outputDir) {
 /**
  * Extract piper binary from downloaded archive
  */
-function extractPiper(archivePath, outputDir) {
+async function extractPiper(archivePath, outputDir) {
   const platform = os.platform()
 
   try {
     if (platform === 'win32' || platform === 'darwin' || platform === 'linux') {
       // Create a temporary extraction directory
       const tempDir = path.join(outputDir, 'temp_extract_piper')
-      if (fs.existsSync(tempDir)) {
-        fs.rmSync(tempDir, { recursive: true, force: true })
-      }
+      fs.rmSync(tempDir, { recursive: true, force: true })
       fs.mkdirSync(tempDir, { recursive: true })
 
       let extractCmd
@@ -419,7 +422,7 @@ function extractPiper(archivePath, outputDir) {
 
       console.log(`Running piper extraction command: ${extractCmd}`)
       try {
-        execSync(extractCmd, { stdio: 'pipe' })
+        await runCommand(extractCmd)
       } catch (error) {
         console.error(
           'PowerShell extraction failed, trying alternative method...'
@@ -431,7 +434,7 @@ function extractPiper(archivePath, outputDir) {
           try {
             const tarCmd = `tar -xf "${archivePath}" -C "${tempDir}"`
             console.log(`Trying tar extraction: ${tarCmd}`)
-            execSync(tarCmd, { stdio: 'pipe' })
+            await runCommand(tarCmd)
           } catch (tarError) {
             console.error('Tar extraction also failed:', tarError.message)
             throw new Error(
@@ -441,26 +444,10 @@ function extractPiper(archivePath, outputDir) {
         }
       }
 
-      // Find piper binary in the extracted folder
-      function findPiperRecursive(dir) {
-        const items = fs.readdirSync(dir, { withFileTypes: true })
-
-        const piperExecutables = ['piper.exe', 'piper']
-
-        for (const item of items) {
-          const fullPath = path.join(dir, item.name)
-
-          if (item.isDirectory()) {
-            const result = findPiperRecursive(fullPath)
-            if (result) return result
-          } else if (piperExecutables.includes(item.name)) {
-            return fullPath
-          }
-        }
-        return null
-      }
-
-      const piperExePath = findPiperRecursive(tempDir)
+      // Index the extracted folder once for the binary, DLLs and espeak data
+      const index = indexExtractedFiles(tempDir)
+      const piperExe = ['piper.exe', 'piper'].find(name => index.files.has(name))
+      const piperExePath = piperExe ? index.files.get(piperExe) : null
       console.log(`Found piper binary at: ${piperExePath}`)
 
       if (piperExePath && fs.existsSync(piperExePath)) {
@@ -478,70 +465,22 @@ function extractPiper(archivePath, outputDir) {
             'piper_phonemize.dll',
           ]
 
-          function findAndCopyDlls(dir) {
-            const items = fs.readdirSync(dir, { withFileTypes: true })
-
-            for (const item of items) {
-              const fullPath = path.join(dir, item.name)
-
-              if (item.isDirectory()) {
-                findAndCopyDlls(fullPath)
-              } else if (requiredDlls.includes(item.name)) {
-                const targetDllPath = path.join(outputDir, item.name)
-                fs.copyFileSync(fullPath, targetDllPath)
-                console.log(`Copied Piper DLL: ${item.name}`)
-              }
+          for (const dllName of requiredDlls) {
+            const dllPath = index.files.get(dllName)
+            if (dllPath) {
+              fs.copyFileSync(dllPath, path.join(outputDir, dllName))
+              console.log(`Copied Piper DLL: ${dllName}`)
             }
           }
 
-          findAndCopyDlls(tempDir)
-
           // Copy espeak-ng-data directory (required for phonemization)
-          function findAndCopyEspeakData(dir) {
-            const items = fs.readdirSync(dir, { withFileTypes: true })
-
-            for (const item of items) {
-              const fullPath = path.join(dir, item.name)
-
-              if (item.isDirectory()) {
-                if (item.name === 'espeak-ng-data') {
-                  const targetEspeakDataPath = path.join(outputDir, 'espeak-ng-data')
-                  console.log(`Copying espeak-ng-data directory from ${fullPath} to ${targetEspeakDataPath}`)
-                  
-                  // Copy directory recursively
-                  function copyDirRecursive(src, dest) {
-                    if (!fs.existsSync(dest)) {
-                      fs.mkdirSync(dest, { recursive: true })
-                    }
-                    
-                    const items = fs.readdirSync(src, { withFileTypes: true })
-                    for (const item of items) {
-                      const srcPath = path.join(src, item.name)
-                      const destPath = path.join(dest, item.name)
-                      
-                      if (item.isDirectory()) {
-                        copyDirRecursive(srcPath, destPath)
-                      } else {
-                        fs.copyFileSync(srcPath, destPath)
-                      }
-                    }
-                  }
-                  
-                  copyDirRecursive(fullPath, targetEspeakDataPath)
-                  console.log(`Copied espeak-ng-data directory successfully`)
-                  return true
-                } else {
-                  // Recursively search in subdirectories
-                  if (findAndCopyEspeakData(fullPath)) {
-                    return true
-                  }
-                }
-              }
-            }
-            return false
+          const espeakDataPath = index.dirs.get('espeak-ng-data')
+          if (espeakDataPath) {
+            const targetEspeakDataPath = path.join(outputDir, 'espeak-ng-data')
+            console.log(`Copying espeak-ng-data directory from ${espeakDataPath} to ${targetEspeakDataPath}`)
+            fs.cpSync(espeakDataPath, targetEspeakDataPath, { recursive: true })
+            console.log(`Copied espeak-ng-data directory successfully`)
           }
-
-          findAndCopyEspeakData(tempDir)
         } else {
           // Make executable on Unix systems
           fs.chmodSync(targetPath, '755')
@@ -554,20 +493,7 @@ function extractPiper(archivePath, outputDir) {
         console.error('Piper binary not found in extracted files')
 
         // List extracted files for debugging
-        console.log('Extracted contents:')
-        function listDir(dir, indent = '') {
-          if (!fs.existsSync(dir)) return
-          const items = fs.readdirSync(dir, { withFileTypes: true })
-          items.forEach(item => {
-            console.log(
-              `${indent}${item.isDirectory() ? '[DIR]' : '[FILE]'} ${item.name}`
-            )
-            if (item.isDirectory() && indent.length < 20) {
-              listDir(path.join(dir, item.name), indent + '  ')
-            }
-          })
-        }
-        listDir(tempDir)
+        logExtractedFiles(index, tempDir)
 
         // Clean up temp directory
         fs.rmSync(tempDir, { recursive: true, force: true })
@@ -602,9 +528,7 @@ async function ensurePiper() {
   }
 
   // Ensure bin directory exists
-  if (!fs.existsSync(backendBinDir)) {
-    fs.mkdirSync(backendBinDir, { recursive: true })
-  }
+  fs.mkdirSync(backendBinDir, { recursive: true })
 
   // Get download URL for platform
   let downloadUrl = PIPER_URLS[platform]
@@ -639,7 +563,7 @@ async function ensurePiper() {
     const archivePath = path.join(backendBinDir, `piper-download${archiveExt}`)
 
     // Download the archive
-    await downloadFile(downloadUrl, archivePath)
+    await downloadCached(downloadUrl, archivePath)
     console.log('✅ Piper download completed')
 
     // Handle direct binary for macOS ARM64
@@ -654,7 +578,7 @@ async function ensurePiper() {
 
     // Extract piper binary
     console.log('📦 Extracting piper binary...')
-    const extractSuccess = extractPiper(archivePath, backendBinDir)
+    const extractSuccess = await extractPiper(archivePath, backendBinDir)
 
     // Clean up archive
     fs.unlinkSync(archivePath)
@@ -691,9 +615,7 @@ async function ensureWhisper() {
   }
 
   // Ensure bin directory exists
-  if (!fs.existsSync(backendBinDir)) {
-    fs.mkdirSync(backendBinDir, { recursive: true })
-  }
+  fs.mkdirSync(backendBinDir, { recursive: true })
 
   // Get download URL for platform
   let downloadUrl = WHISPER_URLS[platform]
@@ -720,12 +642,12 @@ async function ensureWhisper() {
     const archivePath = path.join(backendBinDir, 'whisper-download.zip')
 
     // Download the archive
-    await downloadFile(downloadUrl, archivePath)
+    await downloadCached(downloadUrl, archivePath)
     console.log('✅ Whisper download completed')
 
     // Extract whisper binary
     console.log('📦 Extracting whisper binary...')
-    const extractSuccess = extractWhisper(archivePath, backendBinDir)
+    const extractSuccess = await extractWhisper(archivePath, backendBinDir)
 
     // Clean up archive
     fs.unlinkSync(archivePath)
@@ -762,16 +684,14 @@ async function ensureWhisperModel() {
   }
 
   // Ensure models directory exists
-  if (!fs.existsSync(backendModelsDir)) {
-    fs.mkdirSync(backendModelsDir, { recursive: true })
-  }
+  fs.mkdirSync(backendModelsDir, { recursive: true })
 
   try {
     console.log('📥 Downloading whisper base model...')
     const modelUrl =
       'https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.bin'
 
-    await downloadFile(modelUrl, modelPath)
+    await downloadCached(modelUrl, modelPath)
     console.log(`✅ Whisper model downloaded: ${modelPath}`)
     return true
   } catch (error) {
@@ -812,9 +732,7 @@ async function setupPiper() {
   }
 
   // Ensure bin directory exists
-  if (!fs.existsSync(backendBinDir)) {
-    fs.mkdirSync(backendBinDir, { recursive: true })
-  }
+  fs.mkdirSync(backendBinDir, { recursive: true })
 
   try {
     console.log('📥 Installing Piper TTS binary...')
@@ -845,38 +763,80 @@ async function setupPiper() {
   }
 }
 
+/**
+ * Resolve an executable on PATH, or return null if it is not installed.
+ * PATH is searched in-process rather than by spawning which/where.
+ */
+function findExecutable(name) {
+  const extensions =
+    os.platform() === 'win32'
+      ? (process.env.PATHEXT || '.EXE;.CMD;.BAT').split(';')
+      : ['']
+
+  for (const dir of (process.env.PATH || '').split(path.delimiter)) {
+    if (!dir) continue
+    for (const ext of extensions) {
+      const candidate = path.join(dir, name + ext)
+      try {
+        fs.accessSync(candidate, fs.constants.X_OK)
+        if (fs.statSync(candidate).isFile()) return candidate
+      } catch (e) {
+        // Not here, keep looking
+      }
+    }
+  }
+  return null
+}
+
+/**
+ * Locate a piper binary installed by pip or uv, or return null
+ */
+function findInstalledPiper() {
+  const homeDir = os.homedir()
+  const possiblePaths = [
+    path.join(homeDir, 'Library', 'Python', '3.9', 'bin', 'piper'), // macOS Python 3.9
+    path.join(homeDir, 'Library', 'Python', '3.10', 'bin', 'piper'), // macOS Python 3.10
+    path.join(homeDir, 'Library', 'Python', '3.11', 'bin', 'piper'), // macOS Python 3.11
+    path.join(homeDir, 'Library', 'Python', '3.12', 'bin', 'piper'), // macOS Python 3.12
+    path.join(homeDir, '.local', 'bin', 'piper'), // Alternative location
+  ]
+
+  for (const possiblePath of possiblePaths) {
+    if (fs.existsSync(possiblePath)) {
+      return possiblePath
+    }
+  }
+
+  // Try to find piper in PATH
+  return findExecutable('piper')
+}
+
 /**
  * Try pip installation of Piper TTS (macOS fallback)
  */
 async function tryPipInstallation(piperPath) {
   try {
-    console.log('Installing piper-tts via pip...')
-    execSync('python3 -m pip install --user piper-tts', { stdio: 'pipe' })
-
-    // Find the installed piper binary
-    const homeDir = os.homedir()
-    const possiblePaths = [
-      path.join(homeDir, 'Library', 'Python', '3.9', 'bin', 'piper'), // macOS Python 3.9
-      path.join(homeDir, 'Library', 'Python', '3.10', 'bin', 'piper'), // macOS Python 3.10
-      path.join(homeDir, 'Library', 'Python', '3.11', 'bin', 'piper'), // macOS Python 3.11
-      path.join(homeDir, 'Library', 'Python', '3.12', 'bin', 'piper'), // macOS Python 3.12
-      path.join(homeDir, '.local', 'bin', 'piper'), // Alternative location
-    ]
-
-    let sourcePiper = null
-    for (const possiblePath of possiblePaths) {
-      if (fs.existsSync(possiblePath)) {
-        sourcePiper = possiblePath
-        break
+    // An earlier build may already have installed piper-tts; only run the
+    // installer when no piper binary can be found
+    let sourcePiper = findInstalledPiper()
+    if (sourcePiper) {
+      console.log(`Found existing piper installation: ${sourcePiper}`)
+    } else {
+      // uv resolves and installs far faster than pip; `uv tool install` puts
+      // the piper entry point in ~/.local/bin, which is searched afterwards
+      const uvPath = findExecutable('uv')
+      if (uvPath) {
+        console.log('Installing piper-tts via uv...')
+        execSync(`"${uvPath}" tool install piper-tts`, { stdio: 'inherit' })
+      } else {
+        console.log('Installing piper-tts via pip...')
+        execSync('python3 -m pip install --user piper-tts', {
+          stdio: 'inherit',
+        })
       }
-    }
 
-    if (!sourcePiper) {
-      // Try to find piper in PATH
-      try {
-        const whichResult = execSync('which piper', { stdio: 'pipe' })
-        sourcePiper = whichResult.toString().trim()
-      } catch (e) {
+      sourcePiper = findInstalledPiper()
+      if (!sourcePiper) {
         throw new Error('Piper binary not found after pip installation')
       }
     }
@@ -898,6 +858,16 @@ async function tryPipInstallation(piperPath) {
   }
 }
 
+/**
+ * Resolve the rhasspy/piper-voices download URL of a voice's .onnx model from
+ * its name, which has the form <lang>_<REGION>-<voice>-<quality>
+ */
+function piperVoiceUrl(name) {
+  const [locale, voice, quality] = name.split('-')
+  const lang = locale.split('_')[0]
+  return `https://huggingface.co/rhasspy/piper-voices/resolve/main/${lang}/${locale}/${voice}/${quality}/${name}.onnx`
+}
+
 /**
  * Download required voice models for Piper TTS
  */
@@ -911,68 +881,57 @@ async function downloadRequiredVoiceModels() {
   )
 
   // Ensure models directory exists
-  if (!fs.existsSync(modelsDir)) {
-    fs.mkdirSync(modelsDir, { recursive: true })
-  }
+  fs.mkdirSync(modelsDir, { recursive: true })
 
   // Required voice models (as defined in backend Go code)
   const requiredVoices = [
-    {
-      name: 'en_US-amy-medium',
-      modelUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/medium/en_US-amy-medium.onnx',
-      configUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/medium/en_US-amy-medium.onnx.json',
-    },
-    {
-      name: 'en_US-hfc_female-medium',
-      modelUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/hfc_female/medium/en_US-hfc_female-medium.onnx',
-      configUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/hfc_female/medium/en_US-hfc_female-medium.onnx.json',
-    },
-    {
-      name: 'en_US-kristin-medium',
-      modelUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/kristin/medium/en_US-kristin-medium.onnx',
-      configUrl:
-        'https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/kristin/medium/en_US-kristin-medium.onnx.json',
-    },
-  ]
+    'en_US-amy-medium',
+    'en_US-hfc_female-medium',
+    'en_US-kristin-medium',
+  ].map(name => {
+    const url = piperVoiceUrl(name)
+    return { name, modelUrl: url, configUrl: `${url}.json` }
+  })
 
   console.log('📥 Downloading required voice models for out-of-box TTS...')
 
-  for (const voice of requiredVoices) {
-    const modelPath = path.join(modelsDir, `${voice.name}.onnx`)
-    const configPath = path.join(modelsDir, `${voice.name}.onnx.json`)
+  // Voices, and each voice's model and config, download concurrently
+  await Promise.all(
+    requiredVoices.map(async voice => {
+      const modelPath = path.join(modelsDir, `${voice.name}.onnx`)
+      const configPath = path.join(modelsDir, `${voice.name}.onnx.json`)
 
-    try {
-      // Check if model already exists
-      if (fs.existsSync(modelPath) && fs.existsSync(configPath)) {
-        console.log(`✅ Voice model already available: ${voice.name}`)
-        continue
-      }
-
-      console.log(`📥 Downloading ${voice.name}...`)
-
-      // Download model file (.onnx)
-      if (!fs.existsSync(modelPath)) {
-        await downloadFile(voice.modelUrl, modelPath)
-        console.log(`✅ Downloaded model: ${voice.name}.onnx`)
-      }
+      try {
+        // Check if model already exists
+        if (fs.existsSync(modelPath) && fs.existsSync(configPath)) {
+          console.log(`✅ Voice model already available: ${voice.name}`)
+          return
+        }
 
-      // Download config file (.onnx.json)
-      if (!fs.existsSync(configPath)) {
-        await downloadFile(voice.configUrl, configPath)
-        console.log(`✅ Downloaded config: ${voice.name}.onnx.json`)
+        console.log(`📥 Downloading ${voice.name}...`)
+
+        await Promise.all([
+          // Download model file (.onnx)
+          !fs.existsSync(modelPath) &&
+            downloadCached(voice.modelUrl, modelPath).then(() =>
+              console.log(`✅ Downloaded model: ${voice.name}.onnx`)
+            ),
+          // Download config file (.onnx.json)
+          !fs.existsSync(configPath) &&
+            downloadCached(voice.configUrl, configPath).then(() =>
+              console.log(`✅ Downloaded config: ${voice.name}.onnx.json`)
+            ),
+        ])
+      } catch (error) {
+        console.warn(
+          `⚠️  Failed to download voice model ${voice.name}: ${error.message}`
+        )
+        console.log(
+          `Note: ${voice.name} will be downloaded at runtime if needed`
+        )
       }
-    } catch (error) {
-      console.warn(
-        `⚠️  Failed to download voice model ${voice.name}: ${error.message}`
-      )
-      console.log(`Note: ${voice.name} will be downloaded at runtime if needed`)
-    }
-  }
+    })
+  )
 
   console.log('✅ Voice model setup completed')
 }
@@ -995,9 +954,7 @@ async function ensureFFmpeg() {
   }
 
   // Ensure bin directory exists
-  if (!fs.existsSync(backendBinDir)) {
-    fs.mkdirSync(backendBinDir, { recursive: true })
-  }
+  fs.mkdirSync(backendBinDir, { recursive: true })
 
   // Get download URL for platform
   const downloadUrl = FFMPEG_URLS[platform]
@@ -1016,12 +973,12 @@ async function ensureFFmpeg() {
     const archivePath = path.join(backendBinDir, `ffmpeg-download${archiveExt}`)
 
     // Download the archive
-    await downloadFile(downloadUrl, archivePath)
+    await downloadCached(downloadUrl, archivePath)
     console.log('✅ Download completed')
 
     // Extract ffmpeg binary
     console.log('📦 Extracting ffmpeg binary...')
-    const extractSuccess = extractFFmpeg(archivePath, backendBinDir)
+    const extractSuccess = await extractFFmpeg(archivePath, backendBinDir)
 
     // Clean up archive
     fs.unlinkSync(archivePath)
@@ -1093,16 +1050,15 @@ async function buildGoBackend() {
 
   // Ensure resources/backend directory exists
   const backendDir = path.join(process.cwd(), 'resources', 'backend')
-  if (!fs.existsSync(backendDir)) {
-    fs.mkdirSync(backendDir, { recursive: true })
-  }
+  fs.mkdirSync(backendDir, { recursive: true })
 
   // Determine output filename
   const outputName = isWindows ? 'alice-backend.exe' : 'alice-backend'
   const outputPath = path.join('..', 'resources', 'backend', outputName)
 
-  // Build command
-  const buildCmd = `cd backend && go build -ldflags="-s -w" -o "${outputPath}"`
+  // Build command: -trimpath drops local source paths, -s -w strip the symbol
+  // table and DWARF data, which shrinks the binary Electron has to ship
+  const buildCmd = `cd backend && go build -trimpath -ldflags="-s -w" -o "${outputPath}"`
 
   console.log(`Building Go backend for ${platform}...`)
   console.log(`Command: ${buildCmd}`)
@@ -1126,9 +1082,20 @@ async function buildGoBackend() {
         `Go backend built successfully: ${finalPath} (${Math.round(stats.size / 1024 / 1024)}MB)`
       )
 
-      // Setup ffmpeg for out-of-box experience
-      console.log('\nSetting up ffmpeg for out-of-box transcription...')
-      const ffmpegSuccess = await ensureFFmpeg()
+      // The ffmpeg, whisper, whisper model and piper downloads are
+      // independent, so they run concurrently and each archive is extracted
+      // as soon as its own download finishes
+      console.log(
+        '\nSetting up ffmpeg, Whisper and Piper TTS for out-of-box use...'
+      )
+      const [ffmpegSuccess, whisperSuccess, modelSuccess, piperSuccess] =
+        await Promise.all([
+          ensureFFmpeg(),
+          ensureWhisper(),
+          ensureWhisperModel(),
+          setupPiper(),
+        ])
+
       if (ffmpegSuccess) {
         setupFFmpegForUser()
       } else {
@@ -1140,27 +1107,18 @@ async function buildGoBackend() {
         )
       }
 
-      // Setup whisper for out-of-box transcription
-      console.log('\nSetting up Whisper for out-of-box transcription...')
-      const whisperSuccess = await ensureWhisper()
       if (!whisperSuccess) {
         console.warn(
           '⚠️  Whisper download failed, will fallback to runtime download'
         )
       }
 
-      // Download Whisper model
-      console.log('\nSetting up Whisper model...')
-      const modelSuccess = await ensureWhisperModel()
       if (!modelSuccess) {
         console.warn(
           '⚠️  Whisper model download failed, will fallback to runtime download'
         )
       }
 
-      // Setup Piper TTS for out-of-box text-to-speech
-      console.log('\nSetting up Piper TTS for out-of-box text-to-speech...')
-      const piperSuccess = await setupPiper()
       if (!piperSuccess) {
         console.warn(
           '⚠️  Piper TTS setup failed, will fallback to runtime download'
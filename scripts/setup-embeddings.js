@@ -19,6 +19,22 @@ const BACKEND_DIR = path.join(__dirname, '..', 'backend');
 const MODELS_DIR = path.join(BACKEND_DIR, 'models');
 const LIB_DIR = path.join(BACKEND_DIR, 'lib');
 
+// Prebuilt MiniLM files, the same ones the Go backend downloads at runtime
+const MODEL_FILES = [
+  {
+    url: 'https://huggingface.co/Xenova/all-MiniLM-L6-v2/resolve/main/onnx/model.onnx',
+    file: 'model.onnx'
+  },
+  {
+    url: `https://huggingface.co/${MODEL_NAME}/resolve/main/vocab.txt`,
+    file: 'vocab.txt'
+  },
+  {
+    url: `https://huggingface.co/${MODEL_NAME}/resolve/main/tokenizer.json`,
+    file: 'tokenizer.json'
+  }
+];
+
 // Platform-specific library configurations
 const PLATFORMS = {
   'win32-x64': {
@@ -54,31 +70,57 @@ function ensureDir(dir) {
 function downloadFile(url, dest) {
   return new Promise((resolve, reject) => {
     console.log(`Downloading ${url}...`);
-    const file = fs.createWriteStream(dest);
 
     https.get(url, (response) => {
-      if (response.statusCode === 302 || response.statusCode === 301) {
-        // Handle redirect
-        return downloadFile(response.headers.location, dest).then(resolve).catch(reject);
+      if (response.statusCode >= 300 && response.statusCode < 400 && response.headers.location) {
+        // Handle redirect; Hugging Face answers with relative locations
+        response.resume();
+        const location = new URL(response.headers.location, url).toString();
+        return downloadFile(location, dest).then(resolve).catch(reject);
       }
 
       if (response.statusCode !== 200) {
+        response.resume();
         reject(new Error(`Download failed with status: ${response.statusCode}`));
         return;
       }
 
+      // Write to a temporary file and rename it into place once complete,
+      // so an interrupted download never leaves a truncated file at dest
+      const partPath = `${dest}.part`;
+      const file = fs.createWriteStream(partPath);
+      let failed = false;
+      const fail = (err) => {
+        if (failed) return;
+        failed = true;
+        file.destroy();
+        fs.unlink(partPath, () => {}); // Delete the partial file on error
+        reject(err);
+      };
+
+      response.on('error', fail);
+      response.on('aborted', () => fail(new Error('Download was interrupted')));
       response.pipe(file);
 
       file.on('finish', () => {
-        file.close();
-        console.log(`Downloaded: ${dest}`);
-        resolve();
+        if (failed) return;
+        file.close((err) => {
+          if (err) {
+            fail(err);
+            return;
+          }
+          fs.rename(partPath, dest, (err) => {
+            if (err) {
+              fail(err);
+              return;
+            }
+            console.log(`Downloaded: ${dest}`);
+            resolve();
+          });
+        });
       });
 
-      file.on('error', (err) => {
-        fs.unlink(dest, () => {}); // Delete the file on error
-        reject(err);
-      });
+      file.on('error', fail);
     }).on('error', reject);
   });
 }
@@ -163,69 +205,27 @@ async function downloadModel() {
   const modelDir = path.join(MODELS_DIR, 'all-MiniLM-L6-v2');
   ensureDir(modelDir);
 
-  try {
-    // Check if Python is available
-    await execAsync('python --version');
-
-    console.log('Downloading model using Python...');
-
-    const pythonScript = `
-import os
-import sys
-try:
-    from huggingface_hub import snapshot_download
-    from transformers import AutoTokenizer
-    import torch
-    import onnx
-    from optimum.onnxruntime import ORTModelForFeatureExtraction
-except ImportError as e:
-    print(f"Missing required package: {e}")
-    print("Please install: pip install transformers torch onnx optimum[onnxruntime] huggingface_hub")
-    sys.exit(1)
-
-model_name = "${MODEL_NAME}"
-output_dir = "${modelDir.replace(/\\/g, '/')}"
-
-print(f"Downloading {model_name} to {output_dir}")
-
-try:
-    # Download tokenizer
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    tokenizer.save_pretrained(output_dir)
-    print("Tokenizer downloaded")
-
-    # Download and convert model to ONNX
-    model = ORTModelForFeatureExtraction.from_pretrained(
-        model_name,
-        export=True,
-        cache_dir=output_dir
-    )
-    model.save_pretrained(output_dir)
-    print("ONNX model downloaded and converted")
-
-    print("Model setup completed successfully!")
-
-except Exception as e:
-    print(f"Error: {e}")
-    sys.exit(1)
-`;
-
-    // Write and execute Python script
-    const scriptPath = path.join(modelDir, 'download_model.py');
-    fs.writeFileSync(scriptPath, pythonScript);
-
-    await execAsync(`python "${scriptPath}"`, { cwd: modelDir });
-
-    // Clean up script
-    fs.unlinkSync(scriptPath);
+  // The model is fetched as a prebuilt ONNX export with its tokenizer files
+  // rather than exported locally, which needed Python with torch,
+  // transformers and optimum installed and resolved by pip first
+  for (const { url, file } of MODEL_FILES) {
+    const dest = path.join(modelDir, file);
+    if (fs.existsSync(dest)) {
+      console.log(`Already present: ${dest}`);
+      continue;
+    }
 
-  } catch (error) {
-    console.error('Failed to download model with Python. Please install the required packages:');
-    console.error('pip install transformers torch onnx optimum[onnxruntime] huggingface_hub');
-    console.error('\\nOr manually download the model files:');
-    console.error(`- Download tokenizer.json from https://huggingface.co/${MODEL_NAME}/resolve/main/tokenizer.json`);
-    console.error(`- Download model.onnx (you'll need to convert from PyTorch)`);
-    console.error(`- Place them in: ${modelDir}`);
+    try {
+      await downloadFile(url, dest);
+    } catch (error) {
+      console.error(`Failed to download ${file}: ${error.message}`);
+      console.error('\nManually download the model files:');
+      for (const { url: fileUrl } of MODEL_FILES) {
+        console.error(`- ${fileUrl}`);
+      }
+      console.error(`- Place them in: ${modelDir}`);
+      return;
+    }
   }
 }
 
@@ -266,30 +266,15 @@ export const ttsStream = async (
         return fallbackToOpenAITTS(cleanedText, signal)
       }
 
-      const speechResult = await backendApi.synthesizeSpeech(
+      return await backendApi.synthesizeSpeechStream(
         cleanedText,
-        settings.localTtsVoice
+        settings.localTtsVoice,
+        signal
       )
-
-      if (!speechResult.audio) {
-        return fallbackToOpenAITTS(cleanedText, signal)
-      }
-
-      // Convert number array to ArrayBuffer
-      const audioBuffer = new ArrayBuffer(speechResult.audio.length)
-      const audioView = new Uint8Array(audioBuffer)
-      audioView.set(speechResult.audio)
-
-      const audioBlob = new Blob([audioBuffer], { type: 'audio/wav' })
-      return new Response(audioBlob, {
-        status: 200,
-        statusText: 'OK',
-        headers: {
-          'Content-Type': 'audio/wav',
-          'Content-Length': audioBuffer.byteLength.toString(),
-        },
-      })
     } catch (error: any) {
+      if (error?.name === 'AbortError') {
+        throw error
+      }
       return fallbackToOpenAITTS(cleanedText, signal)
     }
   } else if (settings.ttsProvider === 'google') {
@@ -182,12 +182,22 @@ export class BackendApi {
     sampleRate = 16000,
     language?: string
   ): Promise<TranscriptionResult> {
+    // Send the raw float32 samples instead of a JSON number array
+    const body = audioData.buffer.slice(
+      audioData.byteOffset,
+      audioData.byteOffset + audioData.byteLength
+    )
     const response = await this.client.post<ApiResponse<TranscriptionResult>>(
-      '/api/stt/transcribe-audio',
+      '/api/stt/transcribe-raw',
+      body,
       {
-        audio_data: Array.from(audioData),
-        sample_rate: sampleRate,
-        language,
+        headers: {
+          'Content-Type': 'application/octet-stream',
+        },
+        params: {
+          sample_rate: sampleRate,
+          language,
+        },
       }
     )
 
@@ -282,6 +292,38 @@ export class BackendApi {
     return response.data.data!
   }
 
+  /**
+   * Synthesize speech as a streamed WAV response, so playback setup can
+   * begin before synthesis has finished
+   */
+  async synthesizeSpeechStream(
+    text: string,
+    voice?: string,
+    signal?: AbortSignal
+  ): Promise<Response> {
+    const response = await fetch(`${this.baseUrl}/api/tts/synthesize-stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ text, voice }),
+      signal,
+    })
+
+    if (!response.ok) {
+      let message = 'Speech synthesis failed'
+      try {
+        const data = (await response.json()) as ApiResponse
+        message = data.error || message
+      } catch {
+        // Non-JSON error body
+      }
+      throw new BackendApiError(message, response.status)
+    }
+
+    return response
+  }
+
   /**
    * Get available voices
    */